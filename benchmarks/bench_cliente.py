@@ -0,0 +1,287 @@
+"""
+Micro-benchmark do custo de CPU e memória do próprio FintechAPI por chamada.
+
+As chamadas vão para um transporte em processo (sem sockets), que responde
+com os corpos do catálogo de cenários do Mock Server já serializados. O que
+sobra é o custo do cliente: URL, headers, payload, anexos do Allure,
+métricas, retentativa e parse do JSON (nas variantes tipadas).
+
+Por caso são medidos:
+    ops_por_s       melhor de `--repeticoes` rodadas de `--chamadas` chamadas
+    custo_relativo  tempo por chamada dividido pelo de uma carga de referência
+                    em Python puro, medida junto; desconta a velocidade da máquina
+    pico_bytes      pico de memória alocada durante uma chamada (tracemalloc)
+    blocos_retidos  blocos de memória que continuam vivos após cada chamada
+
+Uso:
+    python -m benchmarks.bench_cliente                      # só mede
+    python -m benchmarks.bench_cliente --salvar             # grava a baseline
+    python -m benchmarks.bench_cliente --comparar --limite 0.2
+
+No modo `--comparar` o processo termina com código 1 se o custo relativo de
+algum caso (ou seu pico de memória) crescer além do limite em relação à
+baseline. O custo relativo tolera máquinas diferentes melhor que ops/s, mas
+a baseline continua mais confiável quando gravada no mesmo ambiente. As
+variáveis FINTECH_API_* (métricas, cassete, resiliência) também afetam o
+resultado.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.mock.falhas import PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+from src.services.transport import TransportConfig
+
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_cliente.json")
+URL_STUB = "http://stub.local"
+
+
+class TransporteStub:
+    """
+    Transporte em processo com a mesma interface do HTTPTransport.
+
+    O payload é serializado como o requests faria; a resposta de cada
+    (método, path, cenário) é calculada uma vez pelo Mock Server e reutilizada.
+    """
+
+    def __init__(self):
+        self.config = TransportConfig()
+        self._mock = MockServer(falhas=PlanoFalhas({}))
+        self._respostas: Dict[Tuple[str, str, Optional[str]], Tuple[int, bytes]] = {}
+        self.chamadas = 0
+
+    def request(self, method, url, json=None, headers=None, timeout=None) -> requests.Response:
+        self.chamadas += 1
+        corpo = _json_dumps(json).encode("utf-8") if json is not None else b""
+        path = url[len(URL_STUB):]
+        chave = (method, path, (headers or {}).get("x-mock-response-name"))
+        if chave not in self._respostas:
+            headers_mock = {nome.lower(): valor for nome, valor in (headers or {}).items()}
+            headers_mock.pop("idempotency-key", None)
+            self._respostas[chave] = self._mock.responder(method, path, headers_mock, corpo)
+        status, conteudo = self._respostas[chave]
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json; charset=utf-8"})
+        response._content = conteudo
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _json_dumps(dados: Any) -> str:
+    return json.dumps(dados, allow_nan=False)
+
+
+def casos(api: FintechAPI) -> Dict[str, Callable[[], Any]]:
+    """Chamadas medidas, com a resposta crua e com o resultado tipado (parse do JSON)."""
+    return {
+        "cadastrar_usuario": lambda: api.cadastrar_usuario(
+            "Tester", "529.982.247-25", "secure_pass", scenario_name="Cadastro Sucesso 201"),
+        "cadastrar_usuario[tipado]": lambda: api.cadastrar_usuario(
+            "Tester", "529.982.247-25", "secure_pass", scenario_name="Cadastro Sucesso 201", tipado=True),
+        "consultar_saldo": lambda: api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200"),
+        "consultar_saldo[tipado]": lambda: api.consultar_saldo(
+            "12345", scenario_name="Saldo Encontrado 200", tipado=True),
+        "realizar_transferencia": lambda: api.realizar_transferencia(
+            "12345", "45678", 100.0, scenario_name="Transferencia Sucesso 200"),
+        "realizar_transferencia[tipado]": lambda: api.realizar_transferencia(
+            "12345", "45678", 100.0, scenario_name="Transferencia Sucesso 200", tipado=True),
+    }
+
+
+def referencia() -> Any:
+    """Carga fixa em Python puro (dicts, strings e JSON), usada para normalizar os tempos."""
+    dados = {"origem": "12345", "destino": "45678", "valor": 100.0, "chaves": [str(i) for i in range(8)]}
+    texto = json.dumps(dados)
+    return len(json.loads(texto)) + len(f"{dados['origem']}/{dados['destino']}".split("/"))
+
+
+def medir_tempo(chamadas_por_caso: Dict[str, Callable[[], Any]], chamadas: int, repeticoes: int) -> Dict[str, float]:
+    """
+    Melhor tempo (s) de `chamadas` execuções de cada caso.
+
+    As rodadas se alternam entre os casos, então uma perturbação passageira
+    da máquina atinge todos igualmente em vez de um caso inteiro.
+    """
+    for chamada in chamadas_por_caso.values():
+        for _ in range(min(chamadas, 200)):
+            chamada()
+
+    # O GC fica ligado: coletar os ciclos que o cliente cria faz parte do custo da chamada
+    melhores = {nome: float("inf") for nome in chamadas_por_caso}
+    for _ in range(repeticoes):
+        for nome, chamada in chamadas_por_caso.items():
+            inicio = time.perf_counter()
+            for _ in range(chamadas):
+                chamada()
+            melhores[nome] = min(melhores[nome], time.perf_counter() - inicio)
+    return melhores
+
+
+def medir_memoria(chamada: Callable[[], Any], amostras: int = 50) -> Dict[str, float]:
+    """Pico de memória por chamada (mediana) e blocos que continuam vivos depois dela."""
+    # Coleta antes e depois: ciclos ainda não coletados não contam como retidos
+    gc.collect()
+    blocos_inicio = sys.getallocatedblocks()
+    for _ in range(amostras):
+        chamada()
+    gc.collect()
+    blocos_retidos = (sys.getallocatedblocks() - blocos_inicio) / amostras
+
+    picos = []
+    tracemalloc.start()
+    try:
+        for _ in range(amostras):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            chamada()
+            picos.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    picos.sort()
+    return {"pico_bytes": picos[len(picos) // 2], "blocos_retidos": round(max(0.0, blocos_retidos), 2)}
+
+
+def executar(chamadas: int = 1000, repeticoes: int = 25, filtro: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Executa todos os casos (ou os que contêm `filtro` no nome).
+
+    Args:
+        chamadas: Chamadas por rodada de tempo
+        repeticoes: Rodadas por caso; vale a mais rápida (a menos perturbada pelo sistema)
+        filtro: Trecho do nome dos casos a executar
+
+    Returns:
+        Dict[str, Dict[str, float]]: ops_por_s, us_por_chamada, pico_bytes e blocos_retidos por caso
+    """
+    with FintechAPI(base_url=URL_STUB, transport=TransporteStub()) as api:
+        selecionados = {nome: chamada for nome, chamada in casos(api).items() if not filtro or filtro in nome}
+        tempos = medir_tempo({**selecionados, "_referencia": referencia}, chamadas, repeticoes)
+        return {
+            nome: {
+                "ops_por_s": round(chamadas / tempos[nome], 1),
+                "us_por_chamada": round(tempos[nome] / chamadas * 1_000_000, 2),
+                "custo_relativo": round(tempos[nome] / tempos["_referencia"], 3),
+                **medir_memoria(chamada),
+            }
+            for nome, chamada in selecionados.items()
+        }
+
+
+def variacao_custo(atual: Dict[str, float], referencia: Dict[str, float]) -> float:
+    """Variação do custo relativo em relação à baseline (+0.25 = 25% mais lento)."""
+    return atual["custo_relativo"] / referencia["custo_relativo"] - 1
+
+
+def comparar(
+    atuais: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    limite: float,
+    limite_memoria: float,
+) -> List[str]:
+    """
+    Regressões em relação à baseline.
+
+    Args:
+        atuais: Resultado de `executar`
+        baseline: Casos gravados na baseline
+        limite: Aumento máximo tolerado do custo relativo (fração, 0.2 = 20%)
+        limite_memoria: Aumento máximo tolerado do pico de memória (fração)
+
+    Returns:
+        List[str]: Descrição de cada regressão (vazia se nenhuma)
+    """
+    regressoes = []
+    for nome, atual in atuais.items():
+        referencia = baseline.get(nome)
+        if referencia is None:
+            continue
+        variacao = variacao_custo(atual, referencia)
+        if variacao > limite:
+            regressoes.append(
+                f"{nome}: custo relativo {atual['custo_relativo']:.3f} vs {referencia['custo_relativo']:.3f} "
+                f"na baseline ({variacao:+.1%}; {atual['ops_por_s']:.0f} ops/s)"
+            )
+        if referencia["pico_bytes"] and atual["pico_bytes"] / referencia["pico_bytes"] - 1 > limite_memoria:
+            regressoes.append(
+                f"{nome}: pico de {atual['pico_bytes']} bytes vs {referencia['pico_bytes']} na baseline"
+            )
+    return regressoes
+
+
+def formatar(resultados: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    linhas = [
+        f"{'caso':<32}{'ops/s':>10}{'us/chamada':>12}{'custo rel':>11}{'pico bytes':>12}{'retidos':>9}{'vs baseline':>13}"
+    ]
+    for nome, r in resultados.items():
+        referencia = (baseline or {}).get(nome)
+        variacao = f"{variacao_custo(r, referencia):+.1%}" if referencia else "-"
+        linhas.append(
+            f"{nome:<32}{r['ops_por_s']:>10.0f}{r['us_por_chamada']:>12.2f}{r['custo_relativo']:>11.3f}"
+            f"{r['pico_bytes']:>12}{r['blocos_retidos']:>9}{variacao:>13}"
+        )
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chamadas", type=int, default=1000, help="Chamadas por rodada")
+    parser.add_argument("--repeticoes", type=int, default=25, help="Rodadas por caso (vale a melhor)")
+    parser.add_argument("--filtro", help="Executa apenas os casos que contêm este texto")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO, help="Arquivo JSON da baseline")
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument("--salvar", action="store_true", help="Grava o resultado como nova baseline")
+    modo.add_argument("--comparar", action="store_true", help="Falha se houver regressão além do limite")
+    parser.add_argument("--limite", type=float, default=0.2, help="Aumento tolerado do custo relativo (padrão 0.2)")
+    parser.add_argument("--limite-memoria", type=float, default=0.1, help="Aumento tolerado do pico de memória")
+    args = parser.parse_args(argv)
+
+    resultados = executar(args.chamadas, args.repeticoes, args.filtro)
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as arquivo:
+            baseline = json.load(arquivo)["casos"]
+    print(formatar(resultados, baseline))
+
+    if args.salvar:
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(terse=True),
+                "chamadas": args.chamadas,
+                "casos": resultados,
+            }, arquivo, indent=2, ensure_ascii=False)
+            arquivo.write("\n")
+        print(f"Baseline gravada em {args.baseline}")
+    elif args.comparar:
+        if baseline is None:
+            print(f"Baseline não encontrada: {args.baseline}", file=sys.stderr)
+            return 2
+        regressoes = comparar(resultados, baseline, args.limite, args.limite_memoria)
+        for regressao in regressoes:
+            print(f"REGRESSÃO - {regressao}", file=sys.stderr)
+        return 1 if regressoes else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Benchmark: requisições por segundo com e sem pool de conexões.
+
+Sobe o Mock Server local e compara o transporte keep-alive do FintechAPI
+com chamadas avulsas a requests.get (uma conexão nova por requisição).
+
+Uso:
+    python -m benchmarks.bench_transport --requisicoes 2000 --threads 8
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+
+from src.mock.server import MockServer
+from src.services.transport import HTTPTransport, TransportConfig
+
+
+def _medir(nome: str, chamada: Callable[[], None], requisicoes: int, threads: int) -> float:
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in executor.map(lambda _: chamada(), range(requisicoes)):
+            pass
+    duracao = time.perf_counter() - inicio
+    rps = requisicoes / duracao
+    print(f"{nome:<12} {requisicoes:>7} req  {duracao:8.2f} s  {rps:10.1f} req/s")
+    return rps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requisicoes", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    with MockServer() as servidor:
+        url = f"{servidor.url}/saldo/99999"
+        sem_pool = _medir("sem pool", lambda: requests.get(url).content, args.requisicoes, args.threads)
+        with HTTPTransport(TransportConfig(pool_size=args.threads)) as transport:
+            com_pool = _medir("com pool", lambda: transport.request("GET", url).content, args.requisicoes, args.threads)
+        print(f"ganho: {com_pool / sem_pool:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
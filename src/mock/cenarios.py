@@ -0,0 +1,81 @@
+"""
+Catálogo de cenários do Mock Server local, espelhando as respostas do Postman.
+
+Cada rota tem seus cenários indexados pelo valor do header
+`x-mock-response-name`; o primeiro cenário de cada rota é o padrão usado
+quando o header não é enviado.
+"""
+from typing import Any, Callable, Dict, NamedTuple, Union
+
+
+class Requisicao(NamedTuple):
+    """Dados de uma requisição já roteada, entregues aos corpos dinâmicos."""
+    metodo: str
+    path: str
+    params: Dict[str, str]
+    headers: Dict[str, str]
+    corpo: bytes
+
+
+class Cenario(NamedTuple):
+    """Resposta de um cenário: status HTTP e corpo fixo ou gerado por requisição."""
+    status: int
+    corpo: Union[Dict[str, Any], Callable[[Requisicao], Dict[str, Any]]]
+
+
+CENARIOS: Dict[str, Dict[str, Cenario]] = {
+    "cadastro": {
+        "Cadastro Sucesso 201": Cenario(201, {
+            "status": "SUCESSO",
+            "conta_id": "99999",
+            "mensagem": "Conta criada com sucesso e saldo inicial de R$0.00.",
+        }),
+        "Cadastro Falha CPF Duplicado 409": Cenario(409, {
+            "status": "FALHA_NEGOCIO",
+            "codigo_erro": "ERR-CAD-002",
+            "mensagem": "CPF já cadastrado no sistema.",
+        }),
+    },
+    "saldo": {
+        "Saldo Encontrado 200": Cenario(200, lambda req: {
+            "conta_id": req.params["conta_id"],
+            "saldo": 1500.5,
+            "status": "ATIVO",
+        }),
+        "Saldo Nao Encontrado 404": Cenario(404, {
+            "status": "ERRO",
+            "mensagem": "Conta não encontrada.",
+        }),
+    },
+    "transferencia": {
+        "Transferencia Sucesso 200": Cenario(200, {
+            "status": "SUCESSO",
+            "mensagem": "Transferência concluída com sucesso.",
+            "transacao_id": "T-QA-123456",
+        }),
+        "Falha Saldo Insuficiente 400": Cenario(400, {
+            "status": "FALHA_NEGOCIO",
+            "codigo_erro": "ERR-SALDO-001",
+            "mensagem": "Saldo insuficiente para completar a transação.",
+        }),
+        "Conta Destino Invalida 404": Cenario(404, {
+            "status": "ERRO",
+            "mensagem": "Conta de destino não existe.",
+        }),
+    },
+    "exclusao": {
+        "Exclusao Sucesso 200": Cenario(200, lambda req: {
+            "status": "SUCESSO",
+            "conta_id": req.params["conta_id"],
+            "mensagem": "Conta removida com sucesso.",
+        }),
+        "Exclusao Conta Nao Encontrada 404": Cenario(404, {
+            "status": "ERRO",
+            "mensagem": "Conta não encontrada.",
+        }),
+        "Exclusao Indisponivel 503": Cenario(503, {
+            "status": "ERRO",
+            "mensagem": "Serviço temporariamente indisponível.",
+        }),
+    },
+}
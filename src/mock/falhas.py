@@ -0,0 +1,140 @@
+"""
+Injeção de latência e de erros no Mock Server local.
+
+As regras valem por rota ou por cenário (`"rota/Nome do Cenário"`), com `"*"`
+como padrão para o resto; a regra mais específica vence:
+
+    {
+        "*":        {"latencia": "fixa:2"},
+        "saldo":    {"latencia": "lognormal:20:0.8", "taxa_erro": 0.02},
+        "transferencia/Transferencia Sucesso 200": {"taxa_erro": 0.1, "status_erro": 503}
+    }
+
+Latências em milissegundos:
+    fixa:ms                    sempre o mesmo atraso
+    uniforme:min:max           uniforme entre min e max
+    exponencial:media          cauda leve, típica de filas
+    lognormal:mediana:sigma    cauda longa (sigma ~0.5 a 1.5)
+
+Com `falhas_iniciais`, as N primeiras requisições da regra falham antes do
+sorteio, para testes determinísticos de retry.
+
+Configuração por ambiente: FINTECH_MOCK_FALHAS com o JSON das regras ou o
+caminho de um arquivo JSON; FINTECH_MOCK_FALHAS_SEMENTE fixa o sorteio.
+"""
+import json
+import math
+import os
+import random
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+DISTRIBUICOES = {"fixa": 1, "uniforme": 2, "exponencial": 1, "lognormal": 2}
+
+CORPO_ERRO = {"status": "ERRO", "mensagem": "Falha injetada pelo Mock Server."}
+
+
+class Latencia(NamedTuple):
+    """Distribuição de latência: nome e parâmetros em milissegundos."""
+    distribuicao: str
+    parametros: Tuple[float, ...]
+
+    @classmethod
+    def parse(cls, texto: str) -> "Latencia":
+        """Interpreta "lognormal:20:0.8", "fixa:5", etc."""
+        nome, *valores = texto.split(":")
+        if nome not in DISTRIBUICOES or len(valores) != DISTRIBUICOES[nome]:
+            raise ValueError(f"Latência inválida: {texto}. Use {', '.join(DISTRIBUICOES)}.")
+        return cls(nome, tuple(float(valor) for valor in valores))
+
+    def amostrar(self, rng: random.Random) -> float:
+        """Atraso sorteado, em segundos."""
+        if self.distribuicao == "fixa":
+            ms = self.parametros[0]
+        elif self.distribuicao == "uniforme":
+            ms = rng.uniform(*self.parametros)
+        elif self.distribuicao == "exponencial":
+            ms = rng.expovariate(1 / self.parametros[0]) if self.parametros[0] > 0 else 0.0
+        else:
+            mediana, sigma = self.parametros
+            ms = rng.lognormvariate(math.log(mediana), sigma)
+        return max(0.0, ms) / 1000
+
+
+class Falha(NamedTuple):
+    """Regra de injeção: latência, taxa de erro e o status devolvido no erro."""
+    latencia: Optional[Latencia] = None
+    taxa_erro: float = 0.0
+    status_erro: int = 503
+    falhas_iniciais: int = 0
+
+    @classmethod
+    def de_dict(cls, dados: Dict[str, Any]) -> "Falha":
+        latencia = dados.get("latencia")
+        return cls(
+            Latencia.parse(latencia) if latencia else None,
+            float(dados.get("taxa_erro", 0.0)),
+            int(dados.get("status_erro", 503)),
+            int(dados.get("falhas_iniciais", 0)),
+        )
+
+
+class PlanoFalhas:
+    """
+    Conjunto de regras de injeção do Mock Server.
+
+    Args:
+        regras: {"*" | rota | "rota/cenário": Falha}
+        semente: Semente do sorteio, para execuções reproduzíveis
+    """
+
+    def __init__(self, regras: Dict[str, Falha], semente: Optional[int] = None):
+        self.regras = dict(regras)
+        self._rng = random.Random(semente)
+        self._lock = threading.Lock()
+        self._contagem: Dict[str, int] = {}
+
+    @classmethod
+    def de_dict(cls, dados: Dict[str, Dict[str, Any]], semente: Optional[int] = None) -> "PlanoFalhas":
+        return cls({chave: Falha.de_dict(regra) for chave, regra in dados.items()}, semente)
+
+    @classmethod
+    def from_env(cls) -> Optional["PlanoFalhas"]:
+        """Plano de FINTECH_MOCK_FALHAS (JSON ou caminho de arquivo), ou None se não definida."""
+        valor = os.environ.get("FINTECH_MOCK_FALHAS", "").strip()
+        if not valor:
+            return None
+        if not valor.startswith("{"):
+            with open(valor, encoding="utf-8") as arquivo:
+                valor = arquivo.read()
+        semente = os.environ.get("FINTECH_MOCK_FALHAS_SEMENTE")
+        return cls.de_dict(json.loads(valor), int(semente) if semente else None)
+
+    def regra(self, rota: str, cenario: Optional[str]) -> Tuple[Optional[str], Optional[Falha]]:
+        """Regra mais específica para a rota e o cenário, com a sua chave."""
+        for chave in (f"{rota}/{cenario}" if cenario else None, rota, "*"):
+            if chave in self.regras:
+                return chave, self.regras[chave]
+        return None, None
+
+    def sortear(self, rota: str, cenario: Optional[str]) -> Tuple[float, Optional[int]]:
+        """
+        Sorteia o efeito da injeção para uma requisição.
+
+        Args:
+            rota: Nome da rota no catálogo de cenários
+            cenario: Valor do header de cenário (ou None)
+
+        Returns:
+            Tuple[float, Optional[int]]: Atraso em segundos e o status de erro
+            a devolver (None para a resposta normal do cenário)
+        """
+        chave, falha = self.regra(rota, cenario)
+        if falha is None:
+            return 0.0, None
+        with self._lock:
+            ordem = self._contagem.get(chave, 0)
+            self._contagem[chave] = ordem + 1
+            atraso = falha.latencia.amostrar(self._rng) if falha.latencia else 0.0
+            falhou = ordem < falha.falhas_iniciais or (falha.taxa_erro > 0 and self._rng.random() < falha.taxa_erro)
+        return atraso, falha.status_erro if falhou else None
@@ -0,0 +1,319 @@
+"""
+Mock Server local em asyncio, substituto do Postman Mock Server.
+
+Serve /cadastro, /saldo/{conta_id} e /transferencia escolhendo a resposta
+pelo header `x-mock-response-name`, com HTTP/1.1 keep-alive. Roda em uma
+thread própria (fixture de sessão) ou como processo separado:
+
+    python -m src.mock.server --host 0.0.0.0 --porta 8080
+    python -m src.mock.server --falhas '{"saldo": {"latencia": "lognormal:20:0.8", "taxa_erro": 0.02}}'
+
+Latência e erros podem ser injetados por rota e por cenário (ver
+`src/mock/falhas.py`). POSTs com `Idempotency-Key` repetida recebem a mesma
+resposta da primeira execução, sem reprocessar.
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Match, Optional, Pattern, Set, Tuple
+
+from src.mock.cenarios import CENARIOS, Cenario, Requisicao
+from src.mock.falhas import CORPO_ERRO, PlanoFalhas
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCENARIO_HEADER = "x-mock-response-name"
+IDEMPOTENCY_HEADER = "idempotency-key"
+# Respostas guardadas por Idempotency-Key (as mais antigas são descartadas)
+MAX_IDEMPOTENTES = 10000
+
+# (método, padrão do path, nome da rota no catálogo de cenários)
+ROTAS: List[Tuple[str, str, str]] = [
+    ("POST", "/cadastro", "cadastro"),
+    ("GET", "/saldo/{conta_id}", "saldo"),
+    ("POST", "/transferencia", "transferencia"),
+    ("DELETE", "/usuario/{conta_id}", "exclusao"),
+]
+
+_ERRO_SEM_MATCH = {
+    "error": {
+        "name": "mockRequestNotFoundError",
+        "message": "Double check your method and the request path and try again.",
+    }
+}
+
+_ERRO_CONTENT_LENGTH = {
+    "error": {
+        "name": "malformedRequestError",
+        "message": "Invalid Content-Length header.",
+    }
+}
+
+
+def _compilar(padrao: str) -> Pattern:
+    return re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", padrao) + "$")
+
+
+def _serializar(corpo) -> bytes:
+    return json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+
+
+def _resposta_http(status: int, dados: bytes, manter: bool) -> bytes:
+    # responses.get: status fora da tabela padrão (ex.: 599 injetado) sai sem frase
+    return (
+        f"HTTP/1.1 {status} {http.client.responses.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(dados)}\r\n"
+        f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n"
+    ).encode("latin-1") + dados
+
+
+def _elevar_limite_arquivos() -> None:
+    # Milhares de conexões simultâneas estouram o soft limit padrão (1024) de descritores
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+class MockServer:
+    """
+    Servidor HTTP/1.1 local que responde os cenários do catálogo CENARIOS.
+
+    Args:
+        host: Interface de escuta
+        porta: Porta TCP (0 escolhe uma porta livre)
+        backlog: Tamanho da fila de conexões pendentes
+        falhas: Injeção de latência e erros (padrão: FINTECH_MOCK_FALHAS, se definida)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        porta: int = 0,
+        backlog: int = 4096,
+        falhas: Optional[PlanoFalhas] = None,
+    ):
+        self.host = host
+        self.porta = porta
+        self.backlog = backlog
+        self.falhas = falhas if falhas is not None else PlanoFalhas.from_env()
+        self.rotas = [(metodo, _compilar(padrao), nome) for metodo, padrao, nome in ROTAS]
+        # Corpos fixos são serializados uma única vez
+        self._cache_corpos: Dict[int, bytes] = {}
+        self._corpo_erro = _serializar(CORPO_ERRO)
+        self._idempotentes: "OrderedDict[Tuple[str, str], Tuple[int, bytes]]" = OrderedDict()
+        self._lock_idempotentes = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pronto = threading.Event()
+        self._parar: Optional[asyncio.Event] = None
+        self._conexoes: Set[asyncio.StreamWriter] = set()
+        self._erro: Optional[BaseException] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.porta}"
+
+    # --- Roteamento ---
+    def _rotear(self, metodo: str, path: str) -> Tuple[Optional[str], Optional[Match]]:
+        for metodo_rota, padrao, nome in self.rotas:
+            match = padrao.match(path)
+            if match and metodo == metodo_rota:
+                return nome, match
+        return None, None
+
+    def responder(self, metodo: str, alvo: str, headers: Dict[str, str], corpo: bytes = b"") -> Tuple[int, bytes]:
+        """
+        Resolve rota e cenário de uma requisição.
+
+        Args:
+            metodo: Método HTTP
+            alvo: Path da requisição (com ou sem query string)
+            headers: Cabeçalhos com nomes em minúsculas
+            corpo: Corpo bruto da requisição
+
+        Returns:
+            Tuple[int, bytes]: Status HTTP e corpo JSON da resposta
+        """
+        path = alvo.split("?", 1)[0]
+        nome, match = self._rotear(metodo, path)
+        if nome is None:
+            return 404, _serializar(_ERRO_SEM_MATCH)
+
+        cenarios = CENARIOS[nome]
+        nome_cenario = headers.get(SCENARIO_HEADER)
+        cenario = cenarios.get(nome_cenario) if nome_cenario else next(iter(cenarios.values()))
+        if cenario is None:
+            return 404, _serializar(_ERRO_SEM_MATCH)
+
+        chave = (path, headers[IDEMPOTENCY_HEADER]) if metodo == "POST" and IDEMPOTENCY_HEADER in headers else None
+        if chave is not None:
+            with self._lock_idempotentes:
+                if chave in self._idempotentes:
+                    return self._idempotentes[chave]
+
+        resposta = cenario.status, self._corpo(cenario, Requisicao(metodo, path, match.groupdict(), headers, corpo))
+        if chave is not None and cenario.status < 500:
+            with self._lock_idempotentes:
+                self._idempotentes[chave] = resposta
+                if len(self._idempotentes) > MAX_IDEMPOTENTES:
+                    self._idempotentes.popitem(last=False)
+        return resposta
+
+    async def _responder_com_falhas(self, metodo: str, alvo: str, headers: Dict[str, str], corpo: bytes) -> Tuple[int, bytes]:
+        """Aplica o plano de falhas (atraso e erro injetado) antes da resposta do cenário."""
+        rota, _ = self._rotear(metodo, alvo.split("?", 1)[0])
+        if rota is None:
+            return self.responder(metodo, alvo, headers, corpo)
+        atraso, status_erro = self.falhas.sortear(rota, headers.get(SCENARIO_HEADER))
+        if atraso:
+            await asyncio.sleep(atraso)
+        if status_erro is not None:
+            return status_erro, self._corpo_erro
+        return self.responder(metodo, alvo, headers, corpo)
+
+    def _corpo(self, cenario: Cenario, requisicao: Requisicao) -> bytes:
+        if callable(cenario.corpo):
+            return _serializar(cenario.corpo(requisicao))
+        chave = id(cenario)
+        if chave not in self._cache_corpos:
+            self._cache_corpos[chave] = _serializar(cenario.corpo)
+        return self._cache_corpos[chave]
+
+    # --- Protocolo HTTP/1.1 ---
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._conexoes.add(writer)
+        try:
+            while True:
+                try:
+                    cabecalho = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                try:
+                    metodo, alvo, versao = linhas[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for linha in linhas[1:]:
+                    if linha:
+                        nome, _, valor = linha.partition(":")
+                        headers[nome.strip().lower()] = valor.strip()
+
+                try:
+                    tamanho = int(headers.get("content-length") or 0)
+                except ValueError:
+                    tamanho = -1
+                if tamanho < 0:
+                    # Sem um tamanho válido não há como achar o fim do corpo: responde e fecha
+                    writer.write(_resposta_http(400, _serializar(_ERRO_CONTENT_LENGTH), manter=False))
+                    await writer.drain()
+                    break
+                corpo = await reader.readexactly(tamanho) if tamanho else b""
+
+                if self.falhas is None:
+                    status, dados = self.responder(metodo, alvo, headers, corpo)
+                else:
+                    status, dados = await self._responder_com_falhas(metodo, alvo, headers, corpo)
+
+                conexao = headers.get("connection", "").lower()
+                manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+                writer.write(_resposta_http(status, dados, manter))
+                await writer.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._conexoes.discard(writer)
+            writer.close()
+
+    # --- Ciclo de vida ---
+    async def _servir(self) -> None:
+        self._parar = asyncio.Event()
+        servidor = await asyncio.start_server(
+            self._atender, self.host, self.porta, backlog=self.backlog, reuse_address=True
+        )
+        self.porta = servidor.sockets[0].getsockname()[1]
+        self._pronto.set()
+        await self._parar.wait()
+
+        servidor.close()
+        # Conexões keep-alive ociosas seguram o wait_closed; fecha todas antes
+        for writer in list(self._conexoes):
+            writer.close()
+        await servidor.wait_closed()
+        # Respostas ainda em atraso injetado são canceladas em vez de destruídas com o loop
+        pendentes = [tarefa for tarefa in asyncio.all_tasks() if tarefa is not asyncio.current_task()]
+        for tarefa in pendentes:
+            tarefa.cancel()
+        await asyncio.gather(*pendentes, return_exceptions=True)
+
+    def _executar(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._servir())
+        except BaseException as erro:
+            self._erro = erro
+        finally:
+            self._pronto.set()
+            self._loop.close()
+
+    def start(self) -> "MockServer":
+        """Sobe o servidor em uma thread daemon e aguarda a porta estar aberta."""
+        _elevar_limite_arquivos()
+        self._thread = threading.Thread(target=self._executar, name="mock-server", daemon=True)
+        self._thread.start()
+        self._pronto.wait()
+        if self._erro is not None:
+            raise self._erro
+        return self
+
+    def stop(self) -> None:
+        """Encerra o servidor e aguarda a thread terminar."""
+        if self._loop is not None and self._parar is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._parar.set)
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock Server local da API Fintech")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--falhas", help="Regras de latência/erro em JSON (padrão: FINTECH_MOCK_FALHAS)")
+    parser.add_argument("--semente", type=int, help="Semente do sorteio das falhas")
+    args = parser.parse_args()
+
+    falhas = PlanoFalhas.de_dict(json.loads(args.falhas), args.semente) if args.falhas else None
+    servidor = MockServer(args.host, args.porta, falhas=falhas).start()
+    print(f"Mock Server ouvindo em {servidor.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        servidor.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+"""
+Gerador de carga em malha aberta (open-loop) para /transferencia e /saldo.
+
+As requisições seguem um cronograma fixo (taxa constante, rampa ou degraus)
+independente da velocidade do servidor. A latência é medida a partir do
+instante *previsto* de envio, não do envio real: se o gerador ou o backend
+atrasam, o tempo de fila entra na medida (correção de coordinated omission).
+
+Uso:
+    python -m src.perf.carga --rps 200 --duracao 60 --sla p99=250 --sla erro=0.01
+    python -m src.perf.carga --perfil rampa --rps-inicial 50 --rps 500 --duracao 120
+    python -m src.perf.carga --perfil degraus --degrau 100:30 --degrau 200:30
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.mock.cenarios import CENARIOS
+from src.perf.histograma import Histograma
+from src.services.api_client import FintechAPI
+from src.services.cache_saldo import CacheSaldo
+from src.services.metricas import REGISTRO, ServidorMetricas
+from src.services.transport import HTTPTransport, TransportConfig
+from src.services.validacao import Validador, validador_do_cenario
+
+PERCENTIS = (50, 90, 99, 99.9)
+
+# Mix padrão: maioria de transferências com sucesso, algumas falhas de negócio e consultas
+MIX_PADRAO: Dict[str, float] = {
+    "Transferencia Sucesso 200": 70,
+    "Falha Saldo Insuficiente 400": 5,
+    "Conta Destino Invalida 404": 5,
+    "Saldo Encontrado 200": 20,
+}
+
+
+# =============================================================================
+# PERFIS DE TAXA
+# =============================================================================
+
+class Perfil:
+    """Cronograma de envios: offsets (s) a partir do início da execução."""
+    duracao: float
+
+    def instantes(self) -> Iterator[float]:
+        raise NotImplementedError
+
+
+class PerfilFixo(Perfil):
+    """Taxa constante de `rps` requisições por segundo."""
+
+    def __init__(self, rps: float, duracao: float):
+        self.rps = rps
+        self.duracao = duracao
+
+    def instantes(self) -> Iterator[float]:
+        for i in range(int(self.rps * self.duracao)):
+            yield i / self.rps
+
+
+class PerfilRampa(Perfil):
+    """Taxa variando linearmente de `rps_inicial` a `rps_final` ao longo de `duracao`."""
+
+    def __init__(self, rps_inicial: float, rps_final: float, duracao: float):
+        self.rps_inicial = rps_inicial
+        self.rps_final = rps_final
+        self.duracao = duracao
+
+    def instantes(self) -> Iterator[float]:
+        # N(t) = r0*t + a*t², com a = (r1 - r0) / 2D; o i-ésimo envio ocorre em N(t) = i
+        a = (self.rps_final - self.rps_inicial) / (2 * self.duracao)
+        b = self.rps_inicial
+        total = int(b * self.duracao + a * self.duracao ** 2)
+        for i in range(total):
+            # Forma racionalizada da raiz: estável para a = 0 e rampas descendentes
+            yield 2 * i / (b + math.sqrt(b * b + 4 * a * i)) if i else 0.0
+
+
+class PerfilDegraus(Perfil):
+    """Sequência de patamares (rps, duração)."""
+
+    def __init__(self, degraus: Sequence[Tuple[float, float]]):
+        self.degraus = list(degraus)
+        self.duracao = sum(duracao for _, duracao in self.degraus)
+
+    def instantes(self) -> Iterator[float]:
+        inicio = 0.0
+        for rps, duracao in self.degraus:
+            for offset in PerfilFixo(rps, duracao).instantes():
+                yield inicio + offset
+            inicio += duracao
+
+
+# =============================================================================
+# MIX DE OPERAÇÕES
+# =============================================================================
+
+class ItemMix(NamedTuple):
+    """
+    Cenário do mix: rota chamada, peso relativo e status HTTP esperado.
+
+    Com `validador`, além do status o corpo da resposta é conferido pelo
+    validador compilado do catálogo declarativo (`src/services/validacao.py`).
+    """
+    cenario: str
+    rota: str
+    peso: float
+    status_esperado: int
+    validador: Optional[Validador] = None
+
+
+def montar_mix(pesos: Dict[str, float], validar: bool = False) -> List[ItemMix]:
+    """
+    Converte {nome do cenário: peso} em itens do mix, resolvendo a rota
+    e o status esperado pelo catálogo de cenários.
+
+    Args:
+        pesos: Peso relativo de cada cenário
+        validar: Confere também o corpo das respostas dos cenários presentes
+            no catálogo declarativo
+
+    Returns:
+        List[ItemMix]: Itens do mix
+
+    Raises:
+        ValueError: Se um cenário não for de /saldo ou /transferencia
+    """
+    mix = []
+    for cenario, peso in pesos.items():
+        for rota in ("saldo", "transferencia"):
+            if cenario in CENARIOS[rota]:
+                validador = validador_do_cenario(cenario) if validar else None
+                mix.append(ItemMix(cenario, rota, float(peso), CENARIOS[rota][cenario].status, validador))
+                break
+        else:
+            raise ValueError(f"Cenário desconhecido para /saldo ou /transferencia: {cenario}")
+    return mix
+
+
+def _chamar(api: FintechAPI, item: ItemMix, contas: Sequence[str], rng: random.Random):
+    if item.rota == "saldo":
+        conta_id = rng.choice(contas)
+        return lambda: api.consultar_saldo(conta_id, scenario_name=item.cenario)
+    origem, destino = rng.sample(contas, 2)
+    valor = round(rng.uniform(1, 500), 2)
+    return lambda: api.realizar_transferencia(origem, destino, valor, scenario_name=item.cenario)
+
+
+# =============================================================================
+# ESTATÍSTICAS E RELATÓRIO
+# =============================================================================
+
+class EstatisticasCenario:
+    """
+    Latências e contadores de um cenário.
+
+    `latencia` é medida do instante previsto até a resposta (corrigida);
+    `servico` vai do envio real até a resposta.
+    """
+
+    __slots__ = ("latencia", "servico", "total", "erros", "descartadas")
+
+    def __init__(self):
+        self.latencia = Histograma()
+        self.servico = Histograma()
+        self.total = 0
+        self.erros = 0
+        self.descartadas = 0
+
+    def mesclar(self, outra: "EstatisticasCenario") -> "EstatisticasCenario":
+        self.latencia.mesclar(outra.latencia)
+        self.servico.mesclar(outra.servico)
+        self.total += outra.total
+        self.erros += outra.erros
+        self.descartadas += outra.descartadas
+        return self
+
+    def snapshot(self) -> Tuple[int, int, int, bytes, bytes]:
+        """Forma compacta e serializável, usada para enviar deltas entre processos."""
+        return (self.total, self.erros, self.descartadas, self.latencia.para_bytes(), self.servico.para_bytes())
+
+    @classmethod
+    def de_snapshot(cls, snapshot: Tuple[int, int, int, bytes, bytes]) -> "EstatisticasCenario":
+        estatisticas = cls()
+        estatisticas.total, estatisticas.erros, estatisticas.descartadas, latencia, servico = snapshot
+        estatisticas.latencia = Histograma.de_bytes(latencia)
+        estatisticas.servico = Histograma.de_bytes(servico)
+        return estatisticas
+
+    @property
+    def taxa_erro(self) -> float:
+        tentativas = self.total + self.descartadas
+        return (self.erros + self.descartadas) / tentativas if tentativas else 0.0
+
+    def resumo(self, duracao: float) -> Dict[str, float]:
+        """Métricas agregadas, com latências em milissegundos."""
+        resumo = {
+            "requisicoes": self.total,
+            "descartadas": self.descartadas,
+            "rps": self.total / duracao if duracao else 0.0,
+            "taxa_erro": self.taxa_erro,
+        }
+        for p in PERCENTIS:
+            resumo[f"p{p:g}"] = self.latencia.percentil(p) / 1000
+        resumo["max"] = self.latencia.maximo / 1000
+        resumo["p99_servico"] = self.servico.percentil(99) / 1000
+        return resumo
+
+
+class ColetorCarga:
+    """
+    Registro thread-safe das estatísticas de uma execução em andamento.
+
+    `extrair` troca as estatísticas acumuladas por outras vazias e devolve
+    o delta, permitindo publicar snapshots periódicos durante a execução.
+    """
+
+    def __init__(self, cenarios: Sequence[str]):
+        self._cenarios = list(cenarios)
+        self._lock = threading.Lock()
+        self.estatisticas = self._vazias()
+
+    def _vazias(self) -> Dict[str, EstatisticasCenario]:
+        return {cenario: EstatisticasCenario() for cenario in self._cenarios}
+
+    def registrar(self, cenario: str, latencia_us: float, servico_us: float, erro: bool) -> None:
+        with self._lock:
+            est = self.estatisticas[cenario]
+            est.latencia.registrar(latencia_us)
+            est.servico.registrar(servico_us)
+            est.total += 1
+            est.erros += erro
+
+    def descartar(self, cenario: str) -> None:
+        with self._lock:
+            self.estatisticas[cenario].descartadas += 1
+
+    def extrair(self) -> Dict[str, EstatisticasCenario]:
+        """Devolve o que foi registrado desde a última extração."""
+        with self._lock:
+            delta, self.estatisticas = self.estatisticas, self._vazias()
+        return delta
+
+
+class RelatorioCarga:
+    """Resultado de uma execução de carga, por cenário e consolidado."""
+
+    def __init__(self, por_cenario: Dict[str, EstatisticasCenario], duracao: float):
+        self.por_cenario = por_cenario
+        self.duracao = duracao
+
+    def consolidado(self) -> EstatisticasCenario:
+        total = EstatisticasCenario()
+        for estatisticas in self.por_cenario.values():
+            total.mesclar(estatisticas)
+        return total
+
+    def resumo(self) -> Dict[str, Dict[str, float]]:
+        resumo = {nome: est.resumo(self.duracao) for nome, est in self.por_cenario.items()}
+        resumo["TOTAL"] = self.consolidado().resumo(self.duracao)
+        return resumo
+
+    def formatar(self) -> str:
+        colunas = ["req", "rps", "erro%"] + [f"p{p:g}" for p in PERCENTIS] + ["max", "p99 serv"]
+        linhas = [f"{'cenário':<32}" + "".join(f"{c:>10}" for c in colunas) + "   (latências em ms)"]
+        for nome, r in self.resumo().items():
+            valores = [r["requisicoes"], r["rps"], r["taxa_erro"] * 100]
+            valores += [r[f"p{p:g}"] for p in PERCENTIS] + [r["max"], r["p99_servico"]]
+            linhas.append(
+                f"{nome:<32}{valores[0]:>10}" + "".join(f"{v:>10.2f}" for v in valores[1:])
+            )
+        return "\n".join(linhas)
+
+
+# =============================================================================
+# SLA
+# =============================================================================
+
+class Sla(NamedTuple):
+    """Limite de SLA: `metrica` (p50..p99.9, max, erro, rps) de um cenário ou do TOTAL."""
+    metrica: str
+    limite: float
+    cenario: str = "TOTAL"
+
+    @classmethod
+    def parse(cls, texto: str) -> "Sla":
+        """
+        Interpreta "p99=250", "erro=0.01", "rps=100" ou "Cenario X:p99=300".
+
+        Latências em ms; erro é fração (0.01 = 1%); rps é o mínimo exigido.
+        """
+        cenario, _, regra = texto.rpartition(":")
+        metrica, _, limite = regra.partition("=")
+        metrica = metrica.strip()
+        if metrica not in {f"p{p:g}" for p in PERCENTIS} | {"max", "erro", "rps"} or not limite:
+            raise ValueError(f"SLA inválido: {texto}")
+        return cls(metrica, float(limite), cenario.strip() or "TOTAL")
+
+
+def avaliar_sla(relatorio: RelatorioCarga, slas: Sequence[Sla]) -> List[str]:
+    """
+    Compara o relatório com os limites de SLA.
+
+    Returns:
+        List[str]: Descrição de cada violação (vazia se todos os SLAs passaram)
+    """
+    resumo = relatorio.resumo()
+    violacoes = []
+    for sla in slas:
+        if sla.cenario not in resumo:
+            violacoes.append(f"{sla.cenario}: cenário sem amostras")
+            continue
+        chave = "taxa_erro" if sla.metrica == "erro" else sla.metrica
+        medido = resumo[sla.cenario][chave]
+        violou = medido < sla.limite if sla.metrica == "rps" else medido > sla.limite
+        if violou:
+            violacoes.append(f"{sla.cenario}: {sla.metrica} = {medido:.4g} (limite {sla.limite:g})")
+    return violacoes
+
+
+# =============================================================================
+# EXECUÇÃO
+# =============================================================================
+
+def executar_carga(
+    api: FintechAPI,
+    perfil: Perfil,
+    mix: Sequence[ItemMix],
+    workers: int = 64,
+    max_pendentes: int = 10000,
+    contas: Sequence[str] = tuple(str(10000 + i) for i in range(100)),
+    semente: Optional[int] = None,
+    coletor: Optional[ColetorCarga] = None,
+) -> RelatorioCarga:
+    """
+    Executa o cronograma do `perfil` disparando operações sorteadas do `mix`.
+
+    Um despachante agenda cada envio no instante previsto e entrega a
+    chamada a um pool de `workers` threads; se todas estiverem ocupadas a
+    requisição espera na fila e esse atraso é contabilizado na latência.
+    Acima de `max_pendentes` na fila a requisição é descartada e conta como erro.
+
+    Args:
+        api: Cliente usado pelos workers (o pool de conexões é compartilhado)
+        perfil: Cronograma de taxa
+        mix: Cenários sorteados a cada envio
+        workers: Threads executando requisições
+        max_pendentes: Limite da fila antes de descartar envios
+        contas: IDs de conta usados como origem/destino/consulta
+        semente: Semente do sorteio, para execuções reproduzíveis
+        coletor: Coletor externo, para quem precisa ler snapshots durante a execução
+
+    Returns:
+        RelatorioCarga: Estatísticas por cenário (desde a última extração do coletor)
+    """
+    rng = random.Random(semente)
+    pesos_acumulados = list(_acumular(item.peso for item in mix))
+    coletor = coletor or ColetorCarga([item.cenario for item in mix])
+    lock = threading.Lock()
+    pendentes = [0]
+
+    def executar(item: ItemMix, chamada, previsto: float) -> None:
+        inicio = time.perf_counter()
+        try:
+            response = chamada()
+            erro = response.status_code != item.status_esperado
+            if not erro and item.validador is not None:
+                erro = bool(item.validador(response.status_code, response.json(), {}))
+        except Exception:
+            erro = True
+        fim = time.perf_counter()
+        coletor.registrar(item.cenario, (fim - previsto) * 1_000_000, (fim - inicio) * 1_000_000, erro)
+        with lock:
+            pendentes[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="carga") as executor:
+        inicio = time.perf_counter()
+        for offset in perfil.instantes():
+            previsto = inicio + offset
+            espera = previsto - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            item = rng.choices(mix, cum_weights=pesos_acumulados)[0]
+            chamada = _chamar(api, item, contas, rng)
+            with lock:
+                descartar = pendentes[0] >= max_pendentes
+                if not descartar:
+                    pendentes[0] += 1
+            if descartar:
+                coletor.descartar(item.cenario)
+                continue
+            executor.submit(executar, item, chamada, previsto)
+    duracao = time.perf_counter() - inicio
+
+    return RelatorioCarga(coletor.estatisticas, duracao)
+
+
+def _acumular(valores) -> Iterator[float]:
+    soma = 0.0
+    for valor in valores:
+        soma += valor
+        yield soma
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_peso(texto: str) -> Tuple[str, float]:
+    cenario, _, peso = texto.rpartition("=")
+    if not cenario:
+        raise argparse.ArgumentTypeError(f"Use 'Nome do Cenário=peso': {texto}")
+    return cenario.strip(), float(peso)
+
+
+def _parse_degrau(texto: str) -> Tuple[float, float]:
+    rps, _, duracao = texto.partition(":")
+    return float(rps), float(duracao)
+
+
+def adicionar_argumentos(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Registra no `parser` as opções de perfil, mix, SLA e saída da carga."""
+    parser.add_argument("--url", default=os.environ.get("MOCK_API_URL"), help="URL base (padrão: MOCK_API_URL)")
+    parser.add_argument("--mock-local", action="store_true", help="Sobe o Mock Server local neste processo")
+    parser.add_argument("--perfil", choices=("fixo", "rampa", "degraus"), default="fixo")
+    parser.add_argument("--rps", type=float, default=100, help="Taxa alvo (final, na rampa)")
+    parser.add_argument("--rps-inicial", type=float, default=0, help="Taxa inicial da rampa")
+    parser.add_argument("--duracao", type=float, default=30, help="Duração em segundos")
+    parser.add_argument("--degrau", type=_parse_degrau, action="append", default=[], help="Patamar rps:segundos")
+    parser.add_argument("--mix", type=_parse_peso, action="append", default=[], help="'Nome do Cenário=peso'")
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--max-pendentes", type=int, default=10000)
+    parser.add_argument("--contas", type=int, default=100, help="Quantidade de contas sorteadas")
+    parser.add_argument("--semente", type=int)
+    parser.add_argument("--validar", action="store_true", help="Valida o corpo das respostas pelo catálogo de cenários")
+    parser.add_argument("--cache-saldo", type=float, metavar="TTL", help="Cache de /saldo no cliente com este TTL (s)")
+    parser.add_argument("--cache-saldo-itens", type=int, default=1024, help="Contas no cache de /saldo")
+    parser.add_argument("--sla", type=Sla.parse, action="append", default=[], help="Ex.: p99=250, erro=0.01, rps=90")
+    parser.add_argument("--saida", help="Grava o resumo em JSON neste arquivo")
+    return parser
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    return adicionar_argumentos(argparse.ArgumentParser(
+        description="Gerador de carga open-loop para a API Fintech",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    ))
+
+
+def criar_perfil(args: argparse.Namespace, fracao: float = 1.0) -> Perfil:
+    """
+    Monta o perfil pedido na linha de comando.
+
+    Args:
+        args: Argumentos da CLI
+        fracao: Parcela da taxa total atribuída a este gerador (scale-out)
+    """
+    if args.perfil == "rampa":
+        return PerfilRampa(args.rps_inicial * fracao, args.rps * fracao, args.duracao)
+    if args.perfil == "degraus":
+        if not args.degrau:
+            raise SystemExit("--perfil degraus exige ao menos um --degrau rps:segundos")
+        return PerfilDegraus([(rps * fracao, duracao) for rps, duracao in args.degrau])
+    return PerfilFixo(args.rps * fracao, args.duracao)
+
+
+def criar_cache_saldo(args: argparse.Namespace) -> Optional[CacheSaldo]:
+    """Cache de /saldo pedido na linha de comando, ou None sem `--cache-saldo`."""
+    if args.cache_saldo is None:
+        return None
+    return CacheSaldo(max_itens=args.cache_saldo_itens, ttl=args.cache_saldo)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = criar_parser()
+    parser.add_argument("--metricas-porta", type=int, help="Serve /metrics (Prometheus) nesta porta durante a carga")
+    args = parser.parse_args(argv)
+    perfil = criar_perfil(args)
+    mix = montar_mix(dict(args.mix) or MIX_PADRAO, validar=args.validar)
+    contas = [str(10000 + i) for i in range(args.contas)]
+
+    servidor = None
+    if args.mock_local:
+        from src.mock.server import MockServer
+        servidor = MockServer().start()
+        args.url = servidor.url
+    metricas = None
+    if args.metricas_porta is not None:
+        metricas = ServidorMetricas(REGISTRO, "0.0.0.0", args.metricas_porta).start()
+        print(f"Métricas em {metricas.url}")
+
+    # Uma conexão por worker: o pool não pode ser o gargalo do gerador
+    transport = HTTPTransport(replace(TransportConfig.from_env(), pool_size=args.workers))
+    cache_saldo = criar_cache_saldo(args)
+    try:
+        with FintechAPI(base_url=args.url, transport=transport, cache_saldo=cache_saldo) as api:
+            relatorio = executar_carga(api, perfil, mix, args.workers, args.max_pendentes, contas, args.semente)
+    finally:
+        if servidor is not None:
+            servidor.stop()
+        if metricas is not None:
+            metricas.stop()
+
+    print(relatorio.formatar())
+    if cache_saldo is not None:
+        print(cache_saldo)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio.resumo(), arquivo, indent=2, ensure_ascii=False)
+
+    violacoes = avaliar_sla(relatorio, args.sla)
+    for violacao in violacoes:
+        print(f"SLA violado - {violacao}", file=sys.stderr)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""
+Scale-out do gerador de carga em vários processos e/ou hosts.
+
+Um coordenador divide a taxa alvo entre N workers. Cada worker roda sua
+parcela do cronograma open-loop com `executar_carga` e, a cada intervalo,
+envia ao coordenador o delta das estatísticas como histogramas compactos.
+O coordenador mescla os deltas e imprime um relatório parcial ao vivo.
+
+Uso:
+    # 4 processos locais, mesmo comando de sempre
+    python -m src.perf.distribuido coordenador --processos 4 --rps 4000 --duracao 60 --sla p99=250
+
+    # 2 locais + 2 em outros hosts, conectando ao coordenador
+    export FINTECH_CARGA_CHAVE=$(python -c "import secrets; print(secrets.token_hex(16))")
+    python -m src.perf.distribuido coordenador --processos 2 --remotos 2 --host 0.0.0.0 --porta 7070 ...
+    python -m src.perf.distribuido worker --coordenador 10.0.0.5:7070   # com a mesma FINTECH_CARGA_CHAVE
+
+As conexões usam `multiprocessing.connection`, que trafega pickle: quem
+conhece a chave pode executar código no coordenador e nos workers. Sem
+FINTECH_CARGA_CHAVE o coordenador usa uma chave aleatória, repassada só aos
+workers locais, e recusa escutar fora do loopback ou aguardar remotos.
+"""
+import argparse
+import ipaddress
+import json
+import multiprocessing
+import os
+import secrets
+import select
+import socket
+import sys
+import threading
+import time
+from dataclasses import replace
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.perf.carga import (
+    MIX_PADRAO, ColetorCarga, EstatisticasCenario, RelatorioCarga, adicionar_argumentos,
+    avaliar_sla, criar_cache_saldo, criar_perfil, executar_carga, montar_mix,
+)
+from src.services.api_client import FintechAPI
+from src.services.transport import HTTPTransport, TransportConfig
+
+VARIAVEL_CHAVE = "FINTECH_CARGA_CHAVE"
+
+
+class WorkersAusentes(RuntimeError):
+    """Nem todos os workers conectaram ao coordenador."""
+
+# Argumentos que só fazem sentido no coordenador e não são repassados aos workers
+_SOMENTE_COORDENADOR = (
+    "sla", "saida", "mock_local", "processos", "remotos", "host", "porta", "intervalo", "prazo_conexao", "comando",
+)
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def _chave_do_ambiente() -> Optional[bytes]:
+    chave = os.environ.get(VARIAVEL_CHAVE)
+    return chave.encode() if chave else None
+
+
+def _loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # nome de host: pode resolver para qualquer interface
+
+
+def resolver_chave(host: str, remotos: int) -> bytes:
+    """
+    Chave de autenticação do coordenador.
+
+    Args:
+        host: Interface de escuta
+        remotos: Workers externos aguardados
+
+    Returns:
+        bytes: FINTECH_CARGA_CHAVE, ou uma chave aleatória para execuções só locais
+
+    Raises:
+        ValueError: Sem FINTECH_CARGA_CHAVE, se houver remotos ou a escuta não for loopback
+    """
+    chave = _chave_do_ambiente()
+    if chave is not None:
+        return chave
+    if remotos or not _loopback(host):
+        raise ValueError(
+            f"Defina {VARIAVEL_CHAVE} (a mesma no coordenador e nos workers) para escutar em {host} "
+            f"ou aguardar workers remotos: a conexão trafega pickle."
+        )
+    return secrets.token_bytes(32)
+
+
+def executar_worker(endereco: Tuple[str, int], chave: Optional[bytes] = None) -> None:
+    """
+    Conecta ao coordenador, recebe a tarefa e transmite snapshots até o fim.
+
+    Args:
+        endereco: (host, porta) do coordenador
+        chave: Chave compartilhada de autenticação da conexão (padrão: FINTECH_CARGA_CHAVE)
+
+    Raises:
+        ValueError: Sem chave nem FINTECH_CARGA_CHAVE
+    """
+    chave = chave or _chave_do_ambiente()
+    if chave is None:
+        raise ValueError(f"Defina {VARIAVEL_CHAVE} com a chave do coordenador.")
+    with Client(endereco, authkey=chave) as conexao:
+        tarefa = conexao.recv()
+        args = argparse.Namespace(**tarefa["args"])
+        mix = montar_mix(dict(args.mix) or MIX_PADRAO, validar=args.validar)
+        coletor = ColetorCarga([item.cenario for item in mix])
+        contas = [str(10000 + i) for i in range(args.contas)]
+        semente = None if args.semente is None else args.semente + tarefa["id"]
+
+        parar = threading.Event()
+
+        def publicar() -> None:
+            while not parar.wait(tarefa["intervalo"]):
+                conexao.send(("snapshot", _snapshot(coletor.extrair())))
+
+        transport = HTTPTransport(replace(TransportConfig.from_env(), pool_size=args.workers))
+        with FintechAPI(base_url=args.url, transport=transport, cache_saldo=criar_cache_saldo(args)) as api:
+            time.sleep(max(0.0, tarefa["inicio"] - time.time()))
+            publicador = threading.Thread(target=publicar, daemon=True)
+            publicador.start()
+            relatorio = executar_carga(
+                api, criar_perfil(args, tarefa["fracao"]), mix,
+                args.workers, args.max_pendentes, contas, semente, coletor,
+            )
+            parar.set()
+            publicador.join()
+        conexao.send(("fim", _snapshot(coletor.extrair()), relatorio.duracao))
+
+
+def _snapshot(estatisticas: Dict[str, EstatisticasCenario]) -> Dict[str, tuple]:
+    return {cenario: est.snapshot() for cenario, est in estatisticas.items() if est.total or est.descartadas}
+
+
+def _worker_local(endereco: Tuple[str, int], chave: bytes) -> None:
+    executar_worker(endereco, chave)
+
+
+# =============================================================================
+# COORDENADOR
+# =============================================================================
+
+class Agregador:
+    """Estatísticas acumuladas da execução e da janela corrente, por cenário."""
+
+    def __init__(self):
+        self.acumulado: Dict[str, EstatisticasCenario] = {}
+        self.janela: Dict[str, EstatisticasCenario] = {}
+
+    def mesclar(self, snapshot: Dict[str, tuple]) -> None:
+        for cenario, dados in snapshot.items():
+            delta = EstatisticasCenario.de_snapshot(dados)
+            self.acumulado.setdefault(cenario, EstatisticasCenario()).mesclar(delta)
+            self.janela.setdefault(cenario, EstatisticasCenario()).mesclar(delta)
+
+    def fechar_janela(self) -> EstatisticasCenario:
+        janela = EstatisticasCenario()
+        for estatisticas in self.janela.values():
+            janela.mesclar(estatisticas)
+        self.janela = {}
+        return janela
+
+
+def coordenar(
+    args: argparse.Namespace,
+    processos: int,
+    remotos: int = 0,
+    endereco: Tuple[str, int] = ("127.0.0.1", 0),
+    chave: Optional[bytes] = None,
+    intervalo: float = 2.0,
+    saida: Callable[[str], None] = print,
+    prazo_conexao: float = 60.0,
+) -> RelatorioCarga:
+    """
+    Distribui a carga entre `processos` locais e `remotos` externos e mescla
+    os resultados.
+
+    Args:
+        args: Argumentos de carga (mesmos de `src.perf.carga`)
+        processos: Workers locais a iniciar
+        remotos: Workers externos aguardados (iniciados com o subcomando `worker`)
+        endereco: Onde o coordenador escuta (porta 0 escolhe uma livre)
+        chave: Chave compartilhada de autenticação (padrão: `resolver_chave`)
+        intervalo: Segundos entre snapshots e linhas do relatório ao vivo
+        saida: Função que recebe as linhas do relatório ao vivo
+        prazo_conexao: Segundos para todos os workers conectarem
+
+    Returns:
+        RelatorioCarga: Relatório consolidado de todos os workers
+
+    Raises:
+        ValueError: Sem chave explícita para escuta externa (ver `resolver_chave`)
+        WorkersAusentes: Se um worker local terminar antes de conectar ou
+            os workers não conectarem dentro do prazo
+    """
+    total_workers = processos + remotos
+    if total_workers < 1:
+        raise ValueError("É preciso ao menos um worker.")
+    repassados = {k: v for k, v in vars(args).items() if k not in _SOMENTE_COORDENADOR}
+    chave = chave or resolver_chave(endereco[0], remotos)
+
+    contexto = multiprocessing.get_context("spawn")
+    # Socket próprio em vez do Listener: o accept precisa de prazo, que o Listener não oferece
+    with socket.create_server(endereco, backlog=max(total_workers, 16)) as servidor:
+        escuta = servidor.getsockname()[:2]
+        locais = [
+            contexto.Process(target=_worker_local, args=(escuta, chave), daemon=True)
+            for _ in range(processos)
+        ]
+        for processo in locais:
+            processo.start()
+        if remotos:
+            saida(f"Aguardando {remotos} worker(s) remoto(s) em {escuta[0]}:{escuta[1]}")
+        try:
+            conexoes = _aceitar(servidor, chave, total_workers, locais, prazo_conexao)
+        except Exception:
+            for processo in locais:
+                processo.terminate()
+            raise
+
+    # Todos começam juntos, após o último worker ter recebido a tarefa
+    inicio = time.time() + 1.0
+    for indice, conexao in enumerate(conexoes):
+        conexao.send({
+            "id": indice,
+            "args": repassados,
+            "fracao": 1.0 / total_workers,
+            "inicio": inicio,
+            "intervalo": intervalo,
+        })
+
+    agregador = Agregador()
+    duracoes: List[float] = []
+    ativas = list(conexoes)
+    proximo_relatorio = inicio + intervalo
+    try:
+        while ativas:
+            for conexao in wait(ativas, timeout=max(0.0, proximo_relatorio - time.time())):
+                try:
+                    mensagem = conexao.recv()
+                except EOFError:
+                    saida("Worker desconectou antes de terminar; resultados parciais mantidos.")
+                    ativas.remove(conexao)
+                    continue
+                agregador.mesclar(mensagem[1])
+                if mensagem[0] == "fim":
+                    duracoes.append(mensagem[2])
+                    ativas.remove(conexao)
+            if time.time() >= proximo_relatorio:
+                saida(_linha_ao_vivo(agregador, time.time() - inicio, intervalo, len(ativas), total_workers))
+                proximo_relatorio += intervalo
+    finally:
+        for conexao in conexoes:
+            conexao.close()
+        for processo in locais:
+            processo.join(timeout=5)
+
+    return RelatorioCarga(agregador.acumulado, max(duracoes, default=time.time() - inicio))
+
+
+def _aceitar(servidor: socket.socket, chave: bytes, total: int, locais: Sequence, prazo: float) -> List[Connection]:
+    """
+    Aceita `total` workers autenticados até o prazo, falhando cedo se um worker local morrer.
+
+    Cada conexão passa pelo mesmo desafio HMAC do `Listener` antes de ser
+    usada; quem não conhece a chave é descartado e não conta no total.
+    """
+    limite = time.monotonic() + prazo
+    conexoes: List[Connection] = []
+    try:
+        while len(conexoes) < total:
+            mortos = [processo.exitcode for processo in locais if processo.exitcode is not None]
+            if mortos:
+                raise WorkersAusentes(f"{len(mortos)} worker(s) local(is) terminou(aram) antes de conectar (exitcode {mortos}).")
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                raise WorkersAusentes(f"Só {len(conexoes)} de {total} worker(s) conectaram em {prazo:g}s.")
+            if select.select([servidor], [], [], min(0.2, restante))[0]:
+                cliente, _ = servidor.accept()
+                cliente.setblocking(True)
+                conexao = Connection(cliente.detach())
+                try:
+                    deliver_challenge(conexao, chave)
+                    answer_challenge(conexao, chave)
+                except (multiprocessing.AuthenticationError, EOFError, OSError):
+                    conexao.close()
+                    continue
+                conexoes.append(conexao)
+    except Exception:
+        for conexao in conexoes:
+            conexao.close()
+        raise
+    return conexoes
+
+
+def _linha_ao_vivo(agregador: Agregador, decorrido: float, intervalo: float, ativos: int, total: int) -> str:
+    janela = agregador.fechar_janela()
+    acumulado = EstatisticasCenario()
+    for estatisticas in agregador.acumulado.values():
+        acumulado.mesclar(estatisticas)
+    return (
+        f"[{decorrido:6.1f}s] janela: {janela.total / intervalo:9.1f} req/s  erro {janela.taxa_erro * 100:5.2f}%"
+        f"  p99 {janela.latencia.percentil(99) / 1000:8.2f} ms"
+        f" | acumulado: {acumulado.total} req  p99 {acumulado.latencia.percentil(99) / 1000:8.2f} ms"
+        f"  p99.9 {acumulado.latencia.percentil(99.9) / 1000:8.2f} ms  (workers {ativos}/{total})"
+    )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _endereco(texto: str) -> Tuple[str, int]:
+    host, _, porta = texto.rpartition(":")
+    return host or "127.0.0.1", int(porta)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Scale-out do gerador de carga da API Fintech",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    coordenador = adicionar_argumentos(subcomandos.add_parser("coordenador", help="Distribui a carga e agrega os resultados"))
+    coordenador.add_argument("--processos", type=int, default=os.cpu_count() or 1, help="Workers locais")
+    coordenador.add_argument("--remotos", type=int, default=0, help="Workers remotos aguardados")
+    coordenador.add_argument("--host", default="127.0.0.1", help="Interface de escuta para workers")
+    coordenador.add_argument("--porta", type=int, default=0)
+    coordenador.add_argument("--intervalo", type=float, default=2.0, help="Segundos entre relatórios ao vivo")
+    coordenador.add_argument("--prazo-conexao", type=float, default=60.0, help="Segundos para todos os workers conectarem")
+
+    worker = subcomandos.add_parser("worker", help="Conecta a um coordenador e executa sua parcela")
+    worker.add_argument("--coordenador", type=_endereco, required=True, help="host:porta do coordenador")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.comando == "worker":
+            executar_worker(args.coordenador)
+            return 0
+        chave = resolver_chave(args.host, args.remotos)
+    except ValueError as erro:
+        print(erro, file=sys.stderr)
+        return 2
+
+    servidor = None
+    if args.mock_local:
+        from src.mock.server import MockServer
+        servidor = MockServer().start()
+        args.url = servidor.url
+    try:
+        relatorio = coordenar(
+            args, args.processos, args.remotos, (args.host, args.porta), chave, args.intervalo,
+            prazo_conexao=args.prazo_conexao,
+        )
+    except WorkersAusentes as erro:
+        print(erro, file=sys.stderr)
+        return 2
+    finally:
+        if servidor is not None:
+            servidor.stop()
+
+    print(relatorio.formatar())
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio.resumo(), arquivo, indent=2, ensure_ascii=False)
+
+    violacoes = avaliar_sla(relatorio, args.sla)
+    for violacao in violacoes:
+        print(f"SLA violado - {violacao}", file=sys.stderr)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
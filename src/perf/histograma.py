@@ -0,0 +1,156 @@
+"""
+Histograma de latências no estilo HDR (log-linear), com memória fixa.
+
+Valores são inteiros em microssegundos. Até SUB_BUCKETS µs cada valor tem
+o próprio bucket; acima disso cada oitava (potência de 2) é dividida em
+SUB_BUCKETS / 2 buckets, o que limita o erro relativo a ~0,8% em qualquer
+ordem de grandeza, de microssegundos a horas.
+"""
+import struct
+import sys
+import zlib
+from array import array
+from typing import Optional
+
+_CABECALHO = struct.Struct("<QQQqQI")
+
+# 2**8 buckets exatos + 128 buckets por oitava => erro relativo <= 1/128
+_BITS_PRECISAO = 8
+SUB_BUCKETS = 1 << _BITS_PRECISAO
+_METADE = SUB_BUCKETS >> 1
+
+
+def _indice(valor: int) -> int:
+    if valor < SUB_BUCKETS:
+        return valor
+    deslocamento = valor.bit_length() - _BITS_PRECISAO
+    return SUB_BUCKETS + (deslocamento - 1) * _METADE + ((valor >> deslocamento) - _METADE)
+
+
+def _maior_equivalente(indice: int) -> int:
+    """Maior valor que cai no mesmo bucket de `indice`."""
+    if indice < SUB_BUCKETS:
+        return indice
+    deslocamento, resto = divmod(indice - SUB_BUCKETS, _METADE)
+    deslocamento += 1
+    return ((resto + _METADE + 1) << deslocamento) - 1
+
+
+class Histograma:
+    """
+    Contagem de latências por bucket, mesclável e com percentis aproximados.
+
+    Args:
+        valor_maximo: Maior valor registrável em µs (acima disso é truncado)
+    """
+
+    __slots__ = ("valor_maximo", "contagens", "total", "soma", "minimo", "maximo")
+
+    def __init__(self, valor_maximo: int = 3_600_000_000):
+        self.valor_maximo = valor_maximo
+        self.contagens = [0] * (_indice(valor_maximo) + 1)
+        self.total = 0
+        self.soma = 0
+        self.minimo: Optional[int] = None
+        self.maximo = 0
+
+    def registrar(self, valor: int, contagem: int = 1) -> None:
+        """
+        Registra `contagem` ocorrências de `valor` µs.
+
+        Args:
+            valor: Latência em microssegundos (negativos contam como 0)
+            contagem: Número de ocorrências
+        """
+        valor = min(max(int(valor), 0), self.valor_maximo)
+        self.contagens[_indice(valor)] += contagem
+        self.total += contagem
+        self.soma += valor * contagem
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def percentil(self, p: float) -> int:
+        """
+        Valor (µs) abaixo do qual estão `p`% das amostras.
+
+        Retorna o maior valor equivalente do bucket, limitado ao máximo
+        registrado, como no HdrHistogram.
+
+        Args:
+            p: Percentil entre 0 e 100
+
+        Returns:
+            int: Latência em microssegundos (0 se vazio)
+        """
+        if not self.total:
+            return 0
+        alvo = max(1, -(-self.total * p // 100))
+        acumulado = 0
+        for indice, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return min(_maior_equivalente(indice), self.maximo)
+        return self.maximo
+
+    @property
+    def media(self) -> float:
+        return self.soma / self.total if self.total else 0.0
+
+    def mesclar(self, outro: "Histograma") -> "Histograma":
+        """Soma as contagens de `outro` neste histograma (mesmo valor_maximo)."""
+        if len(outro.contagens) != len(self.contagens):
+            raise ValueError("Histogramas com valor_maximo diferentes não podem ser mesclados.")
+        for indice, contagem in enumerate(outro.contagens):
+            if contagem:
+                self.contagens[indice] += contagem
+        self.total += outro.total
+        self.soma += outro.soma
+        if outro.minimo is not None and (self.minimo is None or outro.minimo < self.minimo):
+            self.minimo = outro.minimo
+        self.maximo = max(self.maximo, outro.maximo)
+        return self
+
+    def zerar(self) -> None:
+        self.contagens = [0] * len(self.contagens)
+        self.total = 0
+        self.soma = 0
+        self.minimo = None
+        self.maximo = 0
+
+    def para_bytes(self) -> bytes:
+        """
+        Serialização compacta: apenas buckets não vazios, comprimidos.
+
+        Returns:
+            bytes: Snapshot que pode ser enviado a outro processo ou host
+        """
+        indices = array("I", (i for i, contagem in enumerate(self.contagens) if contagem))
+        contagens = array("Q", (self.contagens[i] for i in indices))
+        if sys.byteorder == "big":
+            indices.byteswap()
+            contagens.byteswap()
+        cabecalho = _CABECALHO.pack(
+            self.valor_maximo, self.total, self.soma,
+            -1 if self.minimo is None else self.minimo, self.maximo, len(indices),
+        )
+        return zlib.compress(cabecalho + indices.tobytes() + contagens.tobytes())
+
+    @classmethod
+    def de_bytes(cls, dados: bytes) -> "Histograma":
+        """Reconstrói um histograma gerado por `para_bytes`."""
+        dados = zlib.decompress(dados)
+        valor_maximo, total, soma, minimo, maximo, n = _CABECALHO.unpack_from(dados)
+        histograma = cls(valor_maximo)
+        inicio = _CABECALHO.size
+        indices = array("I", dados[inicio:inicio + 4 * n])
+        contagens = array("Q", dados[inicio + 4 * n:inicio + 12 * n])
+        if sys.byteorder == "big":
+            indices.byteswap()
+            contagens.byteswap()
+        for indice, contagem in zip(indices, contagens):
+            histograma.contagens[indice] = contagem
+        histograma.total, histograma.soma, histograma.maximo = total, soma, maximo
+        histograma.minimo = None if minimo < 0 else minimo
+        return histograma
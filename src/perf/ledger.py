@@ -0,0 +1,302 @@
+"""
+Modelo de razão (ledger) vetorizado para conferir transferências em escala.
+
+Os saldos ficam em um array NumPy de centavos (int64) e as transferências
+são aplicadas em blocos. Para cada bloco, supõe-se que todas as
+transferências válidas dão certo e calcula-se, por conta, o fluxo acumulado
+até cada débito (ordenando débitos e créditos por conta e posição). Se
+nenhum débito deixa a conta negativa, o bloco inteiro é aplicado de uma vez;
+senão, aplica-se o prefixo até a primeira falha, marca-se a falha e o
+processamento recomeça logo depois dela. O tamanho do bloco se adapta: dobra
+após blocos limpos e encolhe quando há falhas.
+
+O resultado previsto de cada transferência segue os cenários do Mock
+Server: sucesso, saldo insuficiente (ERR-SALDO-001) e destino inexistente.
+
+Uso:
+    python -m src.perf.ledger --contas 10000 --transferencias 1000000 --semente 42
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+SUCESSO = 0
+SALDO_INSUFICIENTE = 1
+DESTINO_INEXISTENTE = 2
+
+CENARIO_POR_RESULTADO = {
+    SUCESSO: "Transferencia Sucesso 200",
+    SALDO_INSUFICIENTE: "Falha Saldo Insuficiente 400",
+    DESTINO_INEXISTENTE: "Conta Destino Invalida 404",
+}
+
+# Conta que não existe no ledger (destino inválido)
+INEXISTENTE = -1
+
+
+def para_centavos(valor) -> np.ndarray:
+    """Converte reais (float ou array) em centavos int64, arredondando."""
+    return np.rint(np.asarray(valor, dtype=np.float64) * 100).astype(np.int64)
+
+
+class Transferencias(NamedTuple):
+    """Lote de transferências em colunas: índices de origem/destino e valor em centavos."""
+    origem: np.ndarray
+    destino: np.ndarray
+    valor: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.valor)
+
+
+class Divergencia(NamedTuple):
+    conta_id: str
+    esperado: int
+    obtido: Optional[int]
+
+
+class Ledger:
+    """
+    Saldos de um conjunto de contas e o histórico previsto das transferências.
+
+    Args:
+        contas: IDs das contas, na ordem dos índices
+        saldos: Saldos iniciais em centavos (mesma ordem de `contas`)
+        bloco_inicial: Tamanho do primeiro bloco vetorizado
+    """
+
+    def __init__(self, contas: Sequence[str], saldos, bloco_inicial: int = 4096):
+        self.contas = list(contas)
+        self.indice: Dict[str, int] = {conta_id: i for i, conta_id in enumerate(self.contas)}
+        self.saldos = np.array(saldos, dtype=np.int64)
+        if self.saldos.shape != (len(self.contas),):
+            raise ValueError("É preciso um saldo inicial por conta.")
+        if (self.saldos < 0).any():
+            raise ValueError("Saldos iniciais não podem ser negativos.")
+        self.total_inicial = int(self.saldos.sum())
+        self.bloco_inicial = bloco_inicial
+
+    def indices(self, conta_ids: Sequence[str]) -> np.ndarray:
+        """IDs -> índices; contas fora do ledger viram INEXISTENTE."""
+        return np.fromiter((self.indice.get(c, INEXISTENTE) for c in conta_ids), dtype=np.int64, count=len(conta_ids))
+
+    # --- Aplicação ---
+    def aplicar(self, transferencias: Transferencias) -> np.ndarray:
+        """
+        Aplica as transferências em ordem e prevê o resultado de cada uma.
+
+        Args:
+            transferencias: Lote a aplicar (origens devem existir no ledger)
+
+        Returns:
+            np.ndarray: Resultado por transferência (SUCESSO, SALDO_INSUFICIENTE ou DESTINO_INEXISTENTE)
+
+        Raises:
+            ValueError: Para origem inexistente ou valor não positivo
+        """
+        origem = np.asarray(transferencias.origem, dtype=np.int64)
+        destino = np.asarray(transferencias.destino, dtype=np.int64)
+        valor = np.asarray(transferencias.valor, dtype=np.int64)
+        if ((origem < 0) | (origem >= len(self.saldos))).any():
+            raise ValueError("Transferência com conta de origem fora do ledger.")
+        if (valor <= 0).any():
+            raise ValueError("Transferências devem ter valor positivo.")
+
+        resultados = np.full(len(valor), SUCESSO, dtype=np.int8)
+        invalidas = (destino < 0) | (destino >= len(self.saldos))
+        resultados[invalidas] = DESTINO_INEXISTENTE
+        validas = np.flatnonzero(~invalidas)
+        origem, destino, valor = origem[validas], destino[validas], valor[validas]
+
+        inicio, bloco, total = 0, self.bloco_inicial, len(validas)
+        while inicio < total:
+            fim = min(total, inicio + bloco)
+            falha = self._primeira_falha(origem[inicio:fim], destino[inicio:fim], valor[inicio:fim])
+            if falha < 0:
+                self._efetivar(origem[inicio:fim], destino[inicio:fim], valor[inicio:fim])
+                inicio = fim
+                bloco *= 2
+                continue
+            corte = inicio + falha
+            self._efetivar(origem[inicio:corte], destino[inicio:corte], valor[inicio:corte])
+            resultados[validas[corte]] = SALDO_INSUFICIENTE
+            inicio = corte + 1
+            # Próximo bloco do tamanho do trecho limpo que acabou de passar
+            bloco = max(64, falha * 2)
+        return resultados
+
+    def _primeira_falha(self, origem: np.ndarray, destino: np.ndarray, valor: np.ndarray) -> int:
+        """Posição do primeiro débito sem saldo supondo sucesso dos anteriores, ou -1."""
+        n = len(valor)
+        if n == 0:
+            return -1
+        # Atalho para blocos grandes: nenhuma conta debita mais do que tem,
+        # mesmo sem contar os créditos
+        if n >= len(self.saldos):
+            debitos = np.bincount(origem, weights=valor, minlength=len(self.saldos))
+            if (debitos <= self.saldos).all():
+                return -1
+
+        # Eventos ordenados por (conta, posição, débito antes do crédito) em uma
+        # única chave inteira; o crédito para a própria conta vem depois do débito
+        posicoes = np.arange(n, dtype=np.int64)
+        chaves = np.concatenate((origem * (2 * n) + 2 * posicoes, destino * (2 * n) + 2 * posicoes + 1))
+        ordem = np.argsort(chaves)
+        chaves = chaves[ordem]
+        contas, resto = np.divmod(chaves, 2 * n)
+        tempos, tipos = np.divmod(resto, 2)
+        fluxos = np.concatenate((-valor, valor))[ordem]
+
+        anterior = np.cumsum(fluxos) - fluxos
+        inicio_grupo = np.empty(len(contas), dtype=bool)
+        inicio_grupo[0] = True
+        np.not_equal(contas[1:], contas[:-1], out=inicio_grupo[1:])
+        base = np.maximum.accumulate(np.where(inicio_grupo, np.arange(len(contas)), 0))
+        saldo_antes = self.saldos[contas] + (anterior - anterior[base])
+
+        sem_saldo = (tipos == 0) & (saldo_antes < -fluxos)
+        if not sem_saldo.any():
+            return -1
+        return int(tempos[sem_saldo].min())
+
+    def _efetivar(self, origem: np.ndarray, destino: np.ndarray, valor: np.ndarray) -> None:
+        if len(valor):
+            np.subtract.at(self.saldos, origem, valor)
+            np.add.at(self.saldos, destino, valor)
+
+    # --- Invariantes e conferência ---
+    def verificar_invariantes(self) -> List[str]:
+        """
+        Conservação do dinheiro e ausência de saldo negativo.
+
+        Returns:
+            List[str]: Violações encontradas (vazia se tudo confere)
+        """
+        violacoes = []
+        total = int(self.saldos.sum())
+        if total != self.total_inicial:
+            violacoes.append(f"Total não conservado: {total} != {self.total_inicial} centavos")
+        negativas = np.flatnonzero(self.saldos < 0)
+        if len(negativas):
+            violacoes.append(f"{len(negativas)} conta(s) com saldo negativo, ex.: {self.contas[negativas[0]]}")
+        return violacoes
+
+    def conferir_saldos(
+        self, api, conta_ids: Optional[Sequence[str]] = None, concorrencia: int = 16
+    ) -> List[Divergencia]:
+        """
+        Compara os saldos do ledger com `consultar_saldo` da API.
+
+        Args:
+            api: FintechAPI
+            conta_ids: Contas a conferir (padrão: todas)
+            concorrencia: Consultas simultâneas
+
+        Returns:
+            List[Divergencia]: Contas cujo saldo da API difere do previsto
+        """
+        conta_ids = list(self.contas if conta_ids is None else conta_ids)
+
+        def consultar(conta_id: str) -> Tuple[str, Optional[int]]:
+            resultado = api.consultar_saldo(conta_id, tipado=True)
+            saldo = getattr(resultado, "saldo", None)
+            return conta_id, None if saldo is None else int(para_centavos(saldo))
+
+        with ThreadPoolExecutor(max_workers=max(1, concorrencia)) as executor:
+            obtidos = list(executor.map(consultar, conta_ids))
+        return [
+            Divergencia(conta_id, int(self.saldos[self.indice[conta_id]]), obtido)
+            for conta_id, obtido in obtidos
+            if obtido != self.saldos[self.indice[conta_id]]
+        ]
+
+
+def resultado_observado(status_code: int, codigo_erro: Optional[str] = None) -> int:
+    """Resultado do ledger equivalente a uma resposta de `realizar_transferencia`."""
+    if status_code < 300:
+        return SUCESSO
+    if codigo_erro == "ERR-SALDO-001" or status_code == 400:
+        return SALDO_INSUFICIENTE
+    return DESTINO_INEXISTENTE
+
+
+def gerar_carga(
+    contas: int,
+    transferencias: int,
+    saldo_maximo: float = 10_000.0,
+    valor_maximo: float = 500.0,
+    fracao_destino_invalido: float = 0.02,
+    semente: Optional[int] = None,
+) -> Tuple[Ledger, Transferencias]:
+    """
+    Gera um ledger com saldos aleatórios e um lote de transferências.
+
+    Args:
+        contas: Quantidade de contas
+        transferencias: Quantidade de transferências
+        saldo_maximo: Saldo inicial máximo por conta, em reais
+        valor_maximo: Valor máximo por transferência, em reais
+        fracao_destino_invalido: Parcela das transferências para conta inexistente
+        semente: Semente do gerador (reprodutível)
+
+    Returns:
+        Tuple[Ledger, Transferencias]: Ledger inicial e transferências a aplicar
+    """
+    rng = np.random.default_rng(semente)
+    ids = [str(10000 + i) for i in range(contas)]
+    saldos = rng.integers(0, int(saldo_maximo * 100) + 1, size=contas, dtype=np.int64)
+    origem = rng.integers(0, contas, size=transferencias, dtype=np.int64)
+    destino = rng.integers(0, contas, size=transferencias, dtype=np.int64)
+    destino[rng.random(transferencias) < fracao_destino_invalido] = INEXISTENTE
+    valor = rng.integers(1, int(valor_maximo * 100) + 1, size=transferencias, dtype=np.int64)
+    return Ledger(ids, saldos), Transferencias(origem, destino, valor)
+
+
+def aplicar_sequencial(ledger: Ledger, transferencias: Transferencias) -> np.ndarray:
+    """Referência escalar (uma transferência por vez), usada para validar `Ledger.aplicar`."""
+    saldos = ledger.saldos
+    resultados = np.empty(len(transferencias), dtype=np.int8)
+    n = len(saldos)
+    for i, (o, d, v) in enumerate(zip(transferencias.origem.tolist(), transferencias.destino.tolist(),
+                                      transferencias.valor.tolist())):
+        if d < 0 or d >= n:
+            resultados[i] = DESTINO_INEXISTENTE
+        elif saldos[o] < v:
+            resultados[i] = SALDO_INSUFICIENTE
+        else:
+            saldos[o] -= v
+            saldos[d] += v
+            resultados[i] = SUCESSO
+    return resultados
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simula transferências no ledger vetorizado e confere invariantes")
+    parser.add_argument("--contas", type=int, default=10_000)
+    parser.add_argument("--transferencias", type=int, default=1_000_000)
+    parser.add_argument("--valor-maximo", type=float, default=500.0, help="Valor máximo por transferência (R$)")
+    parser.add_argument("--semente", type=int)
+    args = parser.parse_args(argv)
+
+    ledger, transferencias = gerar_carga(args.contas, args.transferencias, valor_maximo=args.valor_maximo,
+                                         semente=args.semente)
+    inicio = time.perf_counter()
+    resultados = ledger.aplicar(transferencias)
+    duracao = time.perf_counter() - inicio
+
+    contagem = np.bincount(resultados, minlength=len(CENARIO_POR_RESULTADO))
+    print(f"{len(transferencias)} transferências em {duracao:.2f}s ({len(transferencias) / duracao:,.0f}/s)")
+    for resultado, cenario in CENARIO_POR_RESULTADO.items():
+        print(f"  {cenario:<32} {contagem[resultado]}")
+    violacoes = ledger.verificar_invariantes()
+    for violacao in violacoes:
+        print(f"Invariante violada - {violacao}", file=sys.stderr)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,665 @@
+"""
+Soak: carga longa com rastreamento de vazamento de memória e de recursos.
+
+Um mix de consultas, transferências (com sucesso e com erro de negócio) e
+cadastros passa pelo FintechAPI em malha fechada por um tempo ou uma
+quantidade de operações fixos. As contas cadastradas vão para uma
+`LimpezaSessao`, que é esvaziada periodicamente, do mesmo jeito que na
+sessão de testes.
+
+O caminho de relatório também é exercitado: durante o soak o Allure fica
+ativo com um diretório de resultados temporário, e os anexos que o cliente
+faz a cada requisição passam pelo `Anexador` em modo async. A cada
+`--operacoes-por-teste` operações o teste corrente é fechado e um novo
+começa, como numa sessão longa do pytest; assim o crescimento do reporter,
+da fila e da deduplicação de anexos entra na medição (`--sem-anexos`
+desliga).
+
+A cada `--intervalo` segundos é tirada uma amostra de:
+    memoria   bytes alocados pelo Python e ainda vivos (tracemalloc)
+    rss       memória residente do processo (/proc/self/statm)
+    fds       descritores de arquivo abertos (/proc/self/fd)
+    sockets   descritores que são sockets
+
+Depois do aquecimento (pools de conexão, caches e imports se estabilizando)
+o crescimento de cada métrica é estimado por regressão linear contra o
+número de operações e expresso por 100 mil operações. Também são listados
+os pontos do código cuja memória alocada mais cresceu. A execução falha
+(código 1) se o crescimento passar dos limites.
+
+Uso:
+    python -m src.perf.soak --mock-local --duracao 3600 --intervalo 30
+    python -m src.perf.soak --iteracoes 500000 --limite-memoria 512 --limite-fds 1
+
+Com `--mock-local` o Mock Server roda neste processo: as alocações dele são
+excluídas do tracemalloc, mas entram no RSS.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import allure_commons
+from allure_commons._core import plugin_manager
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult
+from allure_commons.reporter import AllureReporter
+
+from src.reporting import anexos
+from src.services.api_client import FintechAPI
+from src.services.limpeza import LimpezaSessao
+from src.services.pool_contas import GeradorCpf
+from src.services.transport import HTTPTransport, TransportConfig
+
+# Peso relativo de cada operação do mix
+MIX_SOAK: Dict[str, float] = {
+    "saldo": 45,
+    "transferencia": 35,
+    "transferencia_erro": 10,
+    "cadastro": 10,
+}
+
+METRICAS = ("memoria", "rss", "fds", "sockets")
+
+# Alocações que não são do código medido
+_IGNORAR_SEMPRE = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap*>", "<unknown>")
+
+
+# =============================================================================
+# SONDAS DO PROCESSO
+# =============================================================================
+
+def rss_bytes() -> Optional[int]:
+    """Memória residente do processo, ou None fora do Linux."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as arquivo:
+            paginas = int(arquivo.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return paginas * os.sysconf("SC_PAGE_SIZE")
+
+
+def descritores() -> Tuple[Optional[int], Optional[int]]:
+    """
+    Returns:
+        Tuple[Optional[int], Optional[int]]: (descritores abertos, quantos são
+        sockets), ou (None, None) sem /proc
+    """
+    try:
+        nomes = os.listdir("/proc/self/fd")
+    except OSError:
+        return None, None
+    sockets = 0
+    for nome in nomes:
+        try:
+            sockets += os.readlink(f"/proc/self/fd/{nome}").startswith("socket:")
+        except OSError:
+            pass  # o descritor do próprio listdir já foi fechado
+    return len(nomes), sockets
+
+
+class Amostra(NamedTuple):
+    """Recursos do processo depois de `operacoes` operações."""
+    operacoes: int
+    segundos: float
+    memoria: int
+    rss: Optional[int]
+    fds: Optional[int]
+    sockets: Optional[int]
+
+
+class MonitorRecursos:
+    """
+    Amostras periódicas de memória e descritores, com snapshots do tracemalloc.
+
+    O snapshot da base (fim do aquecimento) é comparado com o último para
+    apontar as linhas cuja memória alocada mais cresceu.
+
+    Args:
+        frames: Frames guardados por alocação (mais frames, mais custo)
+        ignorar: Padrões (fnmatch) de arquivos cujas alocações são ignoradas
+    """
+
+    def __init__(self, frames: int = 1, ignorar: Sequence[str] = ()):
+        self.frames = frames
+        self._filtros = [tracemalloc.Filter(False, padrao) for padrao in (*_IGNORAR_SEMPRE, *ignorar)]
+        self.amostras: List[Amostra] = []
+        self.indice_base: Optional[int] = None
+        self._snapshot_base: Optional[tracemalloc.Snapshot] = None
+        self._ultimo: Optional[tracemalloc.Snapshot] = None
+        self._iniciou = False
+        self._inicio = time.perf_counter()
+
+    def iniciar(self) -> "MonitorRecursos":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._iniciou = True
+        self._inicio = time.perf_counter()
+        return self
+
+    def parar(self) -> None:
+        if self._iniciou:
+            tracemalloc.stop()
+            self._iniciou = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._filtros)
+
+    def amostrar(self, operacoes: int) -> Amostra:
+        """Registra uma amostra depois de `operacoes` operações."""
+        self._ultimo = self._snapshot()
+        memoria = sum(stat.size for stat in self._ultimo.statistics("filename"))
+        fds, sockets = descritores()
+        amostra = Amostra(operacoes, time.perf_counter() - self._inicio, memoria, rss_bytes(), fds, sockets)
+        self.amostras.append(amostra)
+        return amostra
+
+    def marcar_base(self) -> None:
+        """Fim do aquecimento: a última amostra passa a ser a referência de crescimento."""
+        self.indice_base = len(self.amostras) - 1
+        self._snapshot_base = self._ultimo
+
+    def crescimento(self) -> Dict[str, Optional[float]]:
+        """Crescimento de cada métrica por 100 mil operações, desde a base."""
+        amostras = self.amostras[self.indice_base or 0:]
+        return {metrica: crescimento_por_100k(amostras, metrica) for metrica in METRICAS}
+
+    def top_crescimento(self, quantidade: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Linhas cuja memória alocada mais cresceu desde a base.
+
+        Returns:
+            List[Tuple[str, int, int]]: (arquivo:linha, bytes a mais, blocos a mais)
+        """
+        if self._snapshot_base is None or self._ultimo is None:
+            return []
+        diferencas = self._ultimo.compare_to(self._snapshot_base, "lineno")
+        top = []
+        for stat in diferencas:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            top.append((f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff))
+            if len(top) == quantidade:
+                break
+        return top
+
+
+def crescimento_por_100k(amostras: Sequence[Amostra], metrica: str) -> Optional[float]:
+    """
+    Inclinação (mínimos quadrados) de `metrica` contra o número de operações.
+
+    Returns:
+        Optional[float]: Unidades da métrica por 100 mil operações, ou None com
+        menos de duas amostras válidas
+    """
+    pontos = [(a.operacoes, getattr(a, metrica)) for a in amostras if getattr(a, metrica) is not None]
+    if len(pontos) < 2:
+        return None
+    media_x = sum(x for x, _ in pontos) / len(pontos)
+    media_y = sum(y for _, y in pontos) / len(pontos)
+    variancia = sum((x - media_x) ** 2 for x, _ in pontos)
+    if not variancia:
+        return None
+    covariancia = sum((x - media_x) * (y - media_y) for x, y in pontos)
+    return covariancia / variancia * 100_000
+
+
+# =============================================================================
+# CARGA
+# =============================================================================
+
+class CargaSoak:
+    """
+    Operações do mix de soak sobre um FintechAPI.
+
+    Args:
+        api: Cliente medido
+        contas: IDs usados como origem/destino/consulta
+        limpeza: Registro das contas cadastradas (padrão: um novo, sobre `api`)
+        semente: Semente do sorteio
+    """
+
+    def __init__(
+        self,
+        api: FintechAPI,
+        contas: Sequence[str] = tuple(str(10000 + i) for i in range(100)),
+        limpeza: Optional[LimpezaSessao] = None,
+        semente: Optional[int] = None,
+    ):
+        self.api = api
+        self.contas = list(contas)
+        self.limpeza = limpeza or LimpezaSessao(api)
+        self._rng = random.Random(semente)
+        self._cpfs = GeradorCpf()
+        self._operacoes: Dict[str, Callable[[random.Random], bool]] = {
+            "saldo": self._saldo,
+            "transferencia": self._transferencia,
+            "transferencia_erro": self._transferencia_erro,
+            "cadastro": self._cadastro,
+        }
+
+    def sortear(self, mix: Dict[str, float], quantidade: int) -> List[Tuple[str, int]]:
+        """Sorteia `quantidade` operações do mix, cada uma com a semente do próprio sorteio."""
+        desconhecidas = set(mix) - set(self._operacoes)
+        if desconhecidas:
+            raise ValueError(f"Operações desconhecidas no mix: {sorted(desconhecidas)}. Use {sorted(self._operacoes)}.")
+        nomes = self._rng.choices(list(mix), weights=list(mix.values()), k=quantidade)
+        return [(nome, self._rng.getrandbits(32)) for nome in nomes]
+
+    def executar(self, operacao: Tuple[str, int]) -> bool:
+        """Executa uma operação sorteada; retorna True se ela falhou."""
+        nome, semente = operacao
+        try:
+            return self._operacoes[nome](random.Random(semente))
+        except Exception:
+            return True
+
+    def _saldo(self, rng: random.Random) -> bool:
+        saldo = self.api.consultar_saldo(rng.choice(self.contas), scenario_name="Saldo Encontrado 200", tipado=True)
+        return not saldo.ok
+
+    def _transferencia(self, rng: random.Random) -> bool:
+        origem, destino = rng.sample(self.contas, 2)
+        response = self.api.realizar_transferencia(
+            origem, destino, round(rng.uniform(1, 500), 2), scenario_name="Transferencia Sucesso 200"
+        )
+        return response.status_code != 200
+
+    def _transferencia_erro(self, rng: random.Random) -> bool:
+        origem, destino = rng.sample(self.contas, 2)
+        erro = self.api.realizar_transferencia(
+            origem, destino, 1e9, scenario_name="Falha Saldo Insuficiente 400", tipado=True
+        )
+        return erro.status_code != 400
+
+    def _cadastro(self, rng: random.Random) -> bool:
+        try:
+            cpf = self._cpfs.proximo()
+        except RuntimeError:
+            # Sequência do gerador esgotada: um novo gerador tem outro prefixo
+            self._cpfs = GeradorCpf()
+            cpf = self._cpfs.proximo()
+        cadastro = self.api.cadastrar_usuario(f"Soak {rng.getrandbits(24)}", cpf, "Senha@123", tipado=True)
+        if cadastro.ok and cadastro.conta_id:
+            self.limpeza.registrar(cadastro.conta_id)
+        return cadastro.status_code != 201
+
+
+# =============================================================================
+# ALLURE DURANTE O SOAK
+# =============================================================================
+
+class _OuvinteAllure:
+    """Encaminha `allure.attach` ao reporter do soak, como o listener do allure-pytest."""
+
+    def __init__(self, reporter: AllureReporter):
+        self.reporter = reporter
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        self.reporter.attach_data(uuid4(), body, name=name, attachment_type=attachment_type, extension=extension)
+
+
+class AllureTemporario:
+    """
+    Allure ativo durante o soak, gravando em um diretório temporário.
+
+    Enquanto aberto, o anexador do cliente é trocado por um em modo async
+    ligado a um reporter próprio, e um AllureFileLogger grava no diretório
+    temporário. O reporter precisa ser criado na thread que abre os testes:
+    as threads de trabalho herdam dela o teste corrente.
+
+    Args:
+        max_bytes: Limite por anexo do anexador do soak
+    """
+
+    def __init__(self, max_bytes: int = 65536):
+        self.max_bytes = max_bytes
+        self.diretorio: Optional[Path] = None
+        self.testes = 0
+        self.anexador: Optional[anexos.Anexador] = None
+        self._original: Optional[anexos.Anexador] = None
+        self._plugins: List[object] = []
+
+    def __enter__(self) -> "AllureTemporario":
+        self.diretorio = Path(tempfile.mkdtemp(prefix="soak-allure-"))
+        self.reporter = AllureReporter()
+        self.anexador = anexos.Anexador(modo="async", max_bytes=self.max_bytes, reporter=self.reporter)
+        self._plugins = [_OuvinteAllure(self.reporter), AllureFileLogger(self.diretorio)]
+        for plugin in self._plugins:
+            plugin_manager.register(plugin)
+        self._original, anexos.anexador = anexos.anexador, self.anexador
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        anexos.anexador = self._original
+        self.anexador.flush(30.0)
+        for plugin in self._plugins:
+            plugin_manager.unregister(plugin)
+        shutil.rmtree(self.diretorio, ignore_errors=True)
+
+    @contextmanager
+    def teste(self) -> Iterator[None]:
+        """
+        Um teste do Allure: os anexos feitos dentro dele entram no seu resultado.
+
+        No fim o resultado é gravado e os resultados anteriores são apagados,
+        para o diretório não crescer; os arquivos de anexo ficam, porque a
+        deduplicação pode apontar para eles de novo.
+        """
+        uuid = str(uuid4())
+        self.reporter.schedule_test(uuid, TestResult(uuid=uuid, name=f"soak {self.testes}"))
+        try:
+            yield
+        finally:
+            self.reporter.close_test(uuid)
+            self.testes += 1
+            for resultado in self.diretorio.glob("*-result.json"):
+                resultado.unlink()
+
+
+class RelatorioSoak:
+    """Resultado de um soak: amostras, crescimento por 100 mil operações e maiores alocações."""
+
+    def __init__(
+        self,
+        monitor: MonitorRecursos,
+        operacoes: int,
+        erros: int,
+        duracao: float,
+        top: int = 10,
+        allure: Optional[AllureTemporario] = None,
+    ):
+        self.amostras = monitor.amostras
+        self.indice_base = monitor.indice_base or 0
+        self.crescimento = monitor.crescimento()
+        self.top = monitor.top_crescimento(top)
+        self.operacoes = operacoes
+        self.erros = erros
+        self.duracao = duracao
+        self.allure: Optional[Dict[str, int]] = None
+        if allure is not None:
+            self.allure = {
+                "testes": allure.testes,
+                "anexos_gravados": allure.anexador.gravados,
+                "anexos_deduplicados": allure.anexador.deduplicados,
+            }
+
+    def resumo(self) -> Dict[str, object]:
+        return {
+            "operacoes": self.operacoes,
+            "erros": self.erros,
+            "duracao": self.duracao,
+            "ops_por_s": self.operacoes / self.duracao if self.duracao else 0.0,
+            "crescimento_por_100k": self.crescimento,
+            "allure": self.allure,
+            "top_alocacoes": [
+                {"local": local, "bytes": tamanho, "blocos": blocos} for local, tamanho, blocos in self.top
+            ],
+            "amostras": [amostra._asdict() for amostra in self.amostras],
+        }
+
+    def formatar(self) -> str:
+        linhas = [f"{'operações':>12}{'s':>9}{'memória KiB':>14}{'RSS KiB':>12}{'fds':>7}{'sockets':>9}"]
+        for numero, a in enumerate(self.amostras):
+            rss = f"{a.rss // 1024}" if a.rss is not None else "-"
+            marca = "  <- base" if numero == self.indice_base else ""
+            linhas.append(
+                f"{a.operacoes:>12}{a.segundos:>9.1f}{a.memoria / 1024:>14.1f}{rss:>12}"
+                f"{_ou_traco(a.fds):>7}{_ou_traco(a.sockets):>9}{marca}"
+            )
+        taxa = self.operacoes / self.duracao if self.duracao else 0.0
+        linhas.append(f"\n{self.operacoes} operações em {self.duracao:.1f}s ({taxa:.0f} ops/s), {self.erros} erros")
+        if self.allure is not None:
+            linhas.append(
+                f"Allure: {self.allure['testes']} testes, {self.allure['anexos_gravados']} anexos gravados, "
+                f"{self.allure['anexos_deduplicados']} deduplicados"
+            )
+        linhas.append("Crescimento por 100 mil operações:")
+        for metrica, valor in self.crescimento.items():
+            if valor is None:
+                texto = "-"
+            elif metrica in ("memoria", "rss"):
+                texto = f"{valor / 1024:+.1f} KiB"
+            else:
+                texto = f"{valor:+.2f}"
+            linhas.append(f"  {metrica:<10}{texto}")
+        if self.top:
+            linhas.append("Maiores crescimentos de memória desde a base:")
+            linhas += [f"  {tamanho / 1024:+10.1f} KiB {blocos:+8} blocos  {local}" for local, tamanho, blocos in self.top]
+        return "\n".join(linhas)
+
+
+def _ou_traco(valor: Optional[int]) -> str:
+    return "-" if valor is None else str(valor)
+
+
+class LimitesSoak(NamedTuple):
+    """Crescimento máximo por 100 mil operações (None: apenas reportado)."""
+    memoria_kib: Optional[float] = 1024
+    rss_kib: Optional[float] = None
+    fds: Optional[float] = 1
+
+
+def avaliar_limites(relatorio: RelatorioSoak, limites: LimitesSoak) -> List[str]:
+    """
+    Compara o crescimento medido com os limites.
+
+    Returns:
+        List[str]: Descrição de cada violação (vazia se tudo ficou dentro)
+    """
+    verificacoes = [
+        ("memoria", limites.memoria_kib, 1024, "KiB"),
+        ("rss", limites.rss_kib, 1024, "KiB"),
+        ("fds", limites.fds, 1, "descritores"),
+        ("sockets", limites.fds, 1, "sockets"),
+    ]
+    violacoes = []
+    for metrica, limite, escala, unidade in verificacoes:
+        valor = relatorio.crescimento.get(metrica)
+        if limite is None or valor is None:
+            continue
+        if valor / escala > limite:
+            violacoes.append(f"{metrica}: {valor / escala:+.2f} {unidade} por 100k operações (limite {limite:g})")
+    return violacoes
+
+
+def executar_soak(
+    carga: CargaSoak,
+    duracao: Optional[float] = None,
+    iteracoes: Optional[int] = None,
+    intervalo: float = 10.0,
+    workers: int = 8,
+    mix: Optional[Dict[str, float]] = None,
+    aquecimento: float = 0.2,
+    limpar_a_cada: int = 1000,
+    monitor: Optional[MonitorRecursos] = None,
+    top: int = 10,
+    operacoes_por_teste: Optional[int] = 1000,
+) -> RelatorioSoak:
+    """
+    Executa o mix em lotes até acabar o tempo ou as iterações.
+
+    Entre um lote e outro a limpeza é executada quando acumula
+    `limpar_a_cada` contas, e uma amostra é tirada a cada `intervalo`
+    segundos. A base do crescimento é a primeira amostra depois de
+    `aquecimento` (fração da duração ou das iterações).
+
+    Com `operacoes_por_teste`, a carga roda dentro de um `AllureTemporario`,
+    com um teste do Allure e um pool de threads novos a cada tantas
+    operações (threads que sobrevivem ao teste continuariam anexando nele).
+
+    Args:
+        carga: Operações sobre o cliente
+        duracao: Tempo máximo em segundos
+        iteracoes: Operações no máximo
+        intervalo: Segundos entre amostras
+        workers: Threads executando operações em paralelo
+        mix: Peso de cada operação (padrão: MIX_SOAK)
+        aquecimento: Fração inicial da execução fora do cálculo de crescimento
+        limpar_a_cada: Contas registradas que disparam a limpeza
+        monitor: Monitor externo (padrão: um novo, iniciado e parado aqui)
+        top: Quantidade de locais de alocação no relatório
+        operacoes_por_teste: Operações por teste do Allure (None: sem Allure)
+
+    Returns:
+        RelatorioSoak: Amostras, crescimento e maiores alocações
+
+    Raises:
+        ValueError: Sem `duracao` nem `iteracoes`
+    """
+    if duracao is None and iteracoes is None:
+        raise ValueError("Informe a duração, as iterações ou ambas.")
+    mix = mix or MIX_SOAK
+    lote = workers * 64
+    proprio = monitor is None
+    monitor = (monitor or MonitorRecursos()).iniciar()
+
+    inicio = time.perf_counter()
+    fim = inicio + duracao if duracao is not None else None
+    base_operacoes = iteracoes * aquecimento if iteracoes is not None else None
+    base_instante = inicio + duracao * aquecimento if duracao is not None else None
+    operacoes = erros = 0
+    proxima_amostra = inicio + intervalo
+
+    def terminou() -> bool:
+        return (fim is not None and time.perf_counter() >= fim) or (iteracoes is not None and operacoes >= iteracoes)
+
+    allure = AllureTemporario() if operacoes_por_teste else None
+    try:
+        monitor.amostrar(0)
+        with allure or nullcontext():
+            while not terminou():
+                no_teste = 0
+                # O pool fecha antes do teste: close_test descarta o contexto das threads encerradas
+                with allure.teste() if allure else nullcontext(), \
+                        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="soak") as executor:
+                    while not terminou() and (allure is None or no_teste < operacoes_por_teste):
+                        quantidade = lote if iteracoes is None else min(lote, iteracoes - operacoes)
+                        erros += sum(executor.map(carga.executar, carga.sortear(mix, quantidade)))
+                        operacoes += quantidade
+                        no_teste += quantidade
+
+                        if len(carga.limpeza.pendentes) >= limpar_a_cada:
+                            carga.limpeza.executar()
+                        agora = time.perf_counter()
+                        if agora >= proxima_amostra:
+                            monitor.amostrar(operacoes)
+                            proxima_amostra = agora + intervalo
+                            if monitor.indice_base is None and (
+                                (base_operacoes is not None and operacoes >= base_operacoes)
+                                or (base_instante is not None and agora >= base_instante)
+                            ):
+                                monitor.marcar_base()
+
+        carga.limpeza.executar()
+        if monitor.amostras[-1].operacoes != operacoes:
+            monitor.amostrar(operacoes)
+        if monitor.indice_base is None:
+            monitor.marcar_base()  # execução curta demais: base no fim, sem crescimento estimado
+        return RelatorioSoak(monitor, operacoes, erros, time.perf_counter() - inicio, top, allure)
+    finally:
+        if proprio:
+            monitor.parar()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_peso(texto: str) -> Tuple[str, float]:
+    operacao, _, peso = texto.rpartition("=")
+    if not operacao:
+        raise argparse.ArgumentTypeError(f"Use 'operacao=peso': {texto}")
+    return operacao.strip(), float(peso)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Soak do FintechAPI com rastreamento de vazamentos",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--url", default=os.environ.get("MOCK_API_URL"), help="URL base (padrão: MOCK_API_URL)")
+    parser.add_argument("--mock-local", action="store_true", help="Sobe o Mock Server local neste processo")
+    parser.add_argument("--duracao", type=float, help="Duração em segundos")
+    parser.add_argument("--iteracoes", type=int, help="Operações no máximo")
+    parser.add_argument("--intervalo", type=float, default=10, help="Segundos entre amostras")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--mix", type=_parse_peso, action="append", default=[], help=f"operacao=peso, com operacao em {sorted(MIX_SOAK)}")
+    parser.add_argument("--contas", type=int, default=100, help="Quantidade de contas sorteadas")
+    parser.add_argument("--semente", type=int)
+    parser.add_argument("--aquecimento", type=float, default=0.2, help="Fração inicial ignorada no crescimento")
+    parser.add_argument("--limpar-a-cada", type=int, default=1000, help="Contas cadastradas que disparam a limpeza")
+    parser.add_argument("--operacoes-por-teste", type=int, default=1000, help="Operações por teste do Allure temporário")
+    parser.add_argument("--sem-anexos", action="store_true", help="Não exercita o Allure e os anexos")
+    parser.add_argument("--frames", type=int, default=1, help="Frames por alocação no tracemalloc")
+    parser.add_argument("--top", type=int, default=10, help="Locais de alocação no relatório")
+    parser.add_argument("--limite-memoria", type=float, default=1024, help="KiB (tracemalloc) por 100k operações")
+    parser.add_argument("--limite-rss", type=float, help="KiB de RSS por 100k operações (padrão: só reporta)")
+    parser.add_argument("--limite-fds", type=float, default=1, help="Descritores e sockets por 100k operações")
+    parser.add_argument("--saida", help="Grava o relatório em JSON neste arquivo")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = criar_parser().parse_args(argv)
+    if args.duracao is None and args.iteracoes is None:
+        args.duracao = 60.0
+    contas = [str(10000 + i) for i in range(args.contas)]
+
+    servidor = None
+    ignorar: List[str] = []
+    if args.mock_local:
+        from src.mock import server
+        servidor = server.MockServer().start()
+        args.url = servidor.url
+        ignorar.append(os.path.join(os.path.dirname(server.__file__), "*"))
+
+    transport = HTTPTransport(replace(TransportConfig.from_env(), pool_size=args.workers))
+    monitor = MonitorRecursos(args.frames, ignorar).iniciar()
+    try:
+        with FintechAPI(base_url=args.url, transport=transport) as api:
+            relatorio = executar_soak(
+                CargaSoak(api, contas, semente=args.semente),
+                duracao=args.duracao,
+                iteracoes=args.iteracoes,
+                intervalo=args.intervalo,
+                workers=args.workers,
+                mix=dict(args.mix) or None,
+                aquecimento=args.aquecimento,
+                limpar_a_cada=args.limpar_a_cada,
+                monitor=monitor,
+                top=args.top,
+                operacoes_por_teste=None if args.sem_anexos else args.operacoes_por_teste,
+            )
+    finally:
+        monitor.parar()
+        if servidor is not None:
+            servidor.stop()
+
+    print(relatorio.formatar())
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio.resumo(), arquivo, indent=2, ensure_ascii=False)
+
+    violacoes = avaliar_limites(relatorio, LimitesSoak(args.limite_memoria, args.limite_rss, args.limite_fds))
+    for violacao in violacoes:
+        print(f"Crescimento acima do limite - {violacao}", file=sys.stderr)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
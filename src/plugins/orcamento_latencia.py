@@ -0,0 +1,160 @@
+"""
+Plugin pytest de orçamento de latência por teste.
+
+Uso:
+    @pytest.mark.latency_budget(p99_ms=250, samples=20)
+    def test_consulta_saldo(fintech_api, orcamento_latencia):
+        with allure.step("Act - Consultar saldo"):
+            response = orcamento_latencia(lambda: fintech_api.consultar_saldo(...))
+
+A fixture `orcamento_latencia` executa a ação do Act `samples` vezes, mede
+cada execução e devolve o resultado da primeira, usado pelas asserções
+funcionais de sempre. Depois que o teste passa, os percentis são comparados
+com o orçamento (`p50_ms`, `p90_ms`, `p99_ms`, ... e `max_ms`) e o teste
+falha se algum for excedido. As estatísticas são anexadas ao Allure.
+
+A ação é repetida de verdade: use o marcador apenas em chamadas idempotentes
+(consultas), nunca em escritas como transferências ou cadastros.
+
+Variáveis de ambiente:
+    FINTECH_ORCAMENTO_LATENCIA=off  executa a ação uma vez e não verifica
+    FINTECH_ORCAMENTO_AMOSTRAS=N    sobrescreve `samples` de todos os marcadores
+"""
+import math
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import allure
+import pytest
+
+from src.reporting.anexos import anexar
+
+MARCADOR = "latency_budget"
+AMOSTRAS_PADRAO = 20
+
+_CHAVE_PERCENTIL = re.compile(r"^p(\d{1,2})_ms$")
+_ESTATISTICAS = pytest.StashKey[Dict[str, Any]]()
+
+
+def percentil(amostras_ordenadas: List[float], p: float) -> float:
+    """Percentil pelo método nearest-rank (o valor observado, sem interpolação)."""
+    indice = max(0, math.ceil(p / 100 * len(amostras_ordenadas)) - 1)
+    return amostras_ordenadas[indice]
+
+
+def _limites(marcador: pytest.Mark) -> Dict[str, float]:
+    limites = {}
+    for chave, valor in marcador.kwargs.items():
+        if chave == "samples":
+            continue
+        if chave != "max_ms" and not _CHAVE_PERCENTIL.match(chave):
+            raise pytest.UsageError(
+                f"{MARCADOR}: parâmetro desconhecido '{chave}'. Use pNN_ms, max_ms e samples."
+            )
+        limites[chave] = float(valor)
+    if not limites:
+        raise pytest.UsageError(f"{MARCADOR}: informe ao menos um limite (ex.: p99_ms=250).")
+    return limites
+
+
+def calcular_estatisticas(duracoes_ms: List[float], limites: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Percentis pedidos no orçamento (mais p50 e max) e as violações.
+
+    Args:
+        duracoes_ms: Duração de cada amostra, em ms
+        limites: Orçamento, ex.: {"p99_ms": 250.0}
+
+    Returns:
+        Dict[str, Any]: amostras, medidas, orcamento e violacoes
+    """
+    ordenadas = sorted(duracoes_ms)
+    medidas = {"p50_ms": percentil(ordenadas, 50), "max_ms": ordenadas[-1]}
+    for chave in limites:
+        if chave != "max_ms":
+            medidas[chave] = percentil(ordenadas, int(_CHAVE_PERCENTIL.match(chave).group(1)))
+    violacoes = [
+        f"{chave} = {medidas[chave]:.2f} ms > orçamento de {limite:.2f} ms"
+        for chave, limite in limites.items()
+        if medidas[chave] > limite
+    ]
+    return {
+        "amostras": len(ordenadas),
+        "media_ms": round(sum(ordenadas) / len(ordenadas), 3),
+        "medidas": {chave: round(valor, 3) for chave, valor in sorted(medidas.items())},
+        "orcamento": limites,
+        "violacoes": violacoes,
+    }
+
+
+# =============================================================================
+# HOOKS E FIXTURE
+# =============================================================================
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{MARCADOR}(p99_ms=..., samples=...): repete o Act e falha se os percentis excederem o orçamento",
+    )
+
+
+@pytest.fixture
+def orcamento_latencia(request: pytest.FixtureRequest) -> Callable[[Callable[[], Any]], Any]:
+    """
+    Mede a ação do Act conforme o marcador `latency_budget` do teste.
+
+    Sem o marcador (ou com FINTECH_ORCAMENTO_LATENCIA=off) a ação roda uma
+    única vez, sem medição.
+
+    Returns:
+        Callable: Recebe a ação e devolve o resultado da primeira execução
+    """
+    marcador: Optional[pytest.Mark] = request.node.get_closest_marker(MARCADOR)
+    ativo = marcador is not None and os.environ.get("FINTECH_ORCAMENTO_LATENCIA", "on") != "off"
+
+    def medir(acao: Callable[[], Any]) -> Any:
+        if not ativo:
+            return acao()
+        limites = _limites(marcador)
+        amostras = int(os.environ.get("FINTECH_ORCAMENTO_AMOSTRAS") or marcador.kwargs.get("samples", AMOSTRAS_PADRAO))
+
+        duracoes_ms = []
+        primeiro = None
+        for indice in range(max(1, amostras)):
+            inicio = time.perf_counter()
+            resultado = acao()
+            duracoes_ms.append((time.perf_counter() - inicio) * 1000)
+            if indice == 0:
+                primeiro = resultado
+
+        estatisticas = calcular_estatisticas(duracoes_ms, limites)
+        request.node.stash[_ESTATISTICAS] = estatisticas
+        anexar(estatisticas, name="Orçamento de Latência", attachment_type=allure.attachment_type.JSON)
+        return primeiro
+
+    return medir
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    resultado = yield
+    marcador = item.get_closest_marker(MARCADOR)
+    if marcador is None or os.environ.get("FINTECH_ORCAMENTO_LATENCIA", "on") == "off":
+        return resultado
+
+    estatisticas = item.stash.get(_ESTATISTICAS, None)
+    if estatisticas is None:
+        raise pytest.fail.Exception(
+            f"Teste marcado com {MARCADOR} não mediu o Act: use a fixture 'orcamento_latencia'.",
+            pytrace=False,
+        )
+    item.user_properties.append(("latency_budget", estatisticas["medidas"]))
+    if estatisticas["violacoes"]:
+        raise pytest.fail.Exception(
+            f"Orçamento de latência excedido ({estatisticas['amostras']} amostras): "
+            + "; ".join(estatisticas["violacoes"]),
+            pytrace=False,
+        )
+    return resultado
@@ -0,0 +1,177 @@
+"""
+Plugin pytest de particionamento da suíte por duração (shards).
+
+Uso:
+    pytest tests/api --shards 4 --shard-indice 0   # primeiro de 4 runners do CI
+    FINTECH_SHARDS=4 FINTECH_SHARD_INDICE=2 pytest
+
+Os testes coletados são divididos em N shards de duração total equilibrada
+(LPT: do mais longo para o mais curto, cada teste vai para o shard menos
+carregado) e cada processo executa apenas o shard do seu índice, já ordenado
+do mais longo para o mais curto. Com pytest-xdist, o controlador repassa as
+durações aos workers e a ordem longest-first também alimenta o escalonador.
+
+Durações, em ordem de preferência:
+    1. cache do pytest (`.pytest_cache`), gravado ao fim de cada execução
+    2. resultados do Allure (`--duracoes-allure`, padrão: o `--alluredir`),
+       lidos pelo índice incremental de `src.reporting.agregador`
+    3. mediana das durações conhecidas (ou 1 s) para testes novos
+
+Todos os shards precisam ver as mesmas durações para montar a mesma
+partição; no CI, use a mesma fonte (ex.: os resultados do Allure do
+repositório) em todos os jobs da matriz.
+"""
+import heapq
+import os
+import statistics
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+from allure_pytest.utils import allure_full_name
+
+from src.reporting.agregador import INDICE_PADRAO, IndiceAllure
+
+CHAVE_CACHE = "fintech/duracoes"
+DURACAO_PADRAO = 1.0
+# Peso da execução mais recente na média móvel gravada no cache
+PESO_RECENTE = 0.5
+
+
+def particionar(duracoes: Sequence[Tuple[str, float]], shards: int) -> List[List[str]]:
+    """
+    Divide os testes em `shards` grupos de duração total equilibrada (LPT).
+
+    O resultado é determinístico para a mesma entrada: empates são
+    desfeitos pelo id do teste e pelo índice do shard.
+
+    Args:
+        duracoes: (id do teste, duração estimada em segundos)
+        shards: Quantidade de shards
+
+    Returns:
+        List[List[str]]: Ids de cada shard, do mais longo para o mais curto
+    """
+    particao: List[List[str]] = [[] for _ in range(shards)]
+    cargas = [(0.0, indice) for indice in range(shards)]
+    for nodeid, duracao in sorted(duracoes, key=lambda par: (-par[1], par[0])):
+        carga, indice = heapq.heappop(cargas)
+        particao[indice].append(nodeid)
+        heapq.heappush(cargas, (carga + duracao, indice))
+    return particao
+
+
+def adicionar_opcoes(parser: pytest.Parser) -> None:
+    """Registra as opções do particionamento (chamada pelo `pytest_addoption` do conftest)."""
+    grupo = parser.getgroup("particionamento", "particionamento da suíte por duração")
+    grupo.addoption(
+        "--shards", type=int, default=int(os.environ.get("FINTECH_SHARDS") or 0),
+        help="Divide a suíte em N shards equilibrados por duração (padrão: FINTECH_SHARDS)",
+    )
+    grupo.addoption(
+        "--shard-indice", type=int, default=int(os.environ.get("FINTECH_SHARD_INDICE") or 0),
+        help="Shard executado por este processo, de 0 a N-1 (padrão: FINTECH_SHARD_INDICE)",
+    )
+    grupo.addoption(
+        "--duracoes-allure", default=None,
+        help="Diretório allure-results usado como fonte de durações (padrão: --alluredir)",
+    )
+
+
+class Particionamento:
+    """
+    Hooks do particionamento; uma instância por sessão.
+
+    Args:
+        config: Configuração do pytest
+    """
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.shards = config.getoption("shards")
+        self.indice = config.getoption("shard_indice")
+        if self.shards < 0 or (self.shards and not 0 <= self.indice < self.shards):
+            raise pytest.UsageError(f"--shard-indice deve estar entre 0 e {self.shards - 1}")
+        self._duracoes: Optional[Dict[str, float]] = None
+        self._medidas: Dict[str, float] = {}
+        self._estimativa: Optional[float] = None
+        self._estimado = 0.0
+
+    # -------------------------------------------------------------------------
+    # Fontes de duração
+    # -------------------------------------------------------------------------
+
+    def duracoes_conhecidas(self) -> Dict[str, float]:
+        """Durações do cache do pytest (por nodeid) e do Allure (por `fullName`)."""
+        if self._duracoes is None:
+            workerinput = getattr(self.config, "workerinput", None)
+            if workerinput is not None and "fintech_duracoes" in workerinput:
+                self._duracoes = workerinput["fintech_duracoes"]
+            else:
+                self._duracoes = {**self._duracoes_allure(), **self._duracoes_cache()}
+        return self._duracoes
+
+    def _duracoes_cache(self) -> Dict[str, float]:
+        cache = getattr(self.config, "cache", None)
+        return dict(cache.get(CHAVE_CACHE, {})) if cache is not None else {}
+
+    def _duracoes_allure(self) -> Dict[str, float]:
+        diretorio = self.config.getoption("duracoes_allure") or getattr(self.config.option, "allure_report_dir", None)
+        if not diretorio or not os.path.isdir(diretorio):
+            return {}
+        with IndiceAllure(INDICE_PADRAO) as indice:
+            indice.atualizar(diretorio)
+            return indice.duracoes_por_teste()
+
+    def estimar(self, item: pytest.Item) -> float:
+        """Duração estimada do teste, em segundos."""
+        duracoes = self.duracoes_conhecidas()
+        if item.nodeid in duracoes:
+            return duracoes[item.nodeid]
+        nome_allure = allure_full_name(item)
+        if nome_allure in duracoes:
+            return duracoes[nome_allure]
+        if self._estimativa is None:
+            self._estimativa = statistics.median(duracoes.values()) if duracoes else DURACAO_PADRAO
+        return self._estimativa
+
+    # -------------------------------------------------------------------------
+    # Hooks
+    # -------------------------------------------------------------------------
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: List[pytest.Item]) -> None:
+        if not self.shards:
+            return
+        estimativas = {item.nodeid: self.estimar(item) for item in items}
+        particao = particionar(list(estimativas.items()), self.shards)
+        selecionados = set(particao[self.indice])
+        ordem = {nodeid: posicao for posicao, nodeid in enumerate(particao[self.indice])}
+
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selecionados])
+        items[:] = sorted((item for item in items if item.nodeid in selecionados), key=lambda item: ordem[item.nodeid])
+        self._estimado = sum(estimativas[item.nodeid] for item in items)
+
+    def pytest_report_collectionfinish(self, items: List[pytest.Item]) -> Optional[str]:
+        if not self.shards:
+            return None
+        return f"shard {self.indice + 1}/{self.shards}: {len(items)} testes, ~{self._estimado:.1f}s estimados"
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node) -> None:
+        """pytest-xdist: entrega as mesmas durações a todos os workers."""
+        node.workerinput["fintech_duracoes"] = self.duracoes_conhecidas()
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.skipped:
+            return
+        self._medidas[report.nodeid] = self._medidas.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        cache = getattr(self.config, "cache", None)
+        if cache is None or hasattr(self.config, "workerinput") or not self._medidas:
+            return
+        duracoes = self._duracoes_cache()
+        for nodeid, medida in self._medidas.items():
+            anterior = duracoes.get(nodeid)
+            duracoes[nodeid] = round(medida if anterior is None else PESO_RECENTE * medida + (1 - PESO_RECENTE) * anterior, 4)
+        cache.set(CHAVE_CACHE, duracoes)
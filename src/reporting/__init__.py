@@ -0,0 +1 @@
+# Allure reporting helpers package
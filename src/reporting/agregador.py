@@ -0,0 +1,286 @@
+"""
+Agregador incremental dos resultados do Allure.
+
+Lê `reports/allure-results` em streaming (`os.scandir`) e guarda cada
+`*-result.json` em um índice SQLite. O índice lembra quais arquivos já foram
+processados, então novas execuções só leem os arquivos novos; os anexos e
+containers nem são abertos. Como o histórico fica no índice, as tendências
+continuam disponíveis mesmo depois que o diretório de resultados é limpo.
+
+A partir do índice são calculados, por feature e story (`@allure.feature` /
+`@allure.story`), os totais de passed/failed/broken/skipped e as durações,
+no geral e por dia.
+
+Uso:
+    python -m src.reporting.agregador
+    python -m src.reporting.agregador --por feature --dias 30 --diario
+    python -m src.reporting.agregador --resultados reports/allure-results --json resumo.json
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DIRETORIO_RESULTADOS = "reports/allure-results"
+INDICE_PADRAO = "reports/allure-indice.sqlite"
+SUFIXO_RESULTADO = "-result.json"
+STATUS = ("passed", "failed", "broken", "skipped")
+SEM_ROTULO = "(sem rótulo)"
+AGRUPAMENTOS = {"feature": ("feature",), "story": ("feature", "story")}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS arquivos (
+    nome TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS resultados (
+    uuid TEXT PRIMARY KEY,
+    history_id TEXT,
+    nome TEXT,
+    feature TEXT NOT NULL,
+    story TEXT NOT NULL,
+    status TEXT NOT NULL,
+    inicio INTEGER,
+    duracao_ms INTEGER,
+    dia TEXT
+);
+CREATE INDEX IF NOT EXISTS resultados_grupo ON resultados (feature, story, dia);
+CREATE INDEX IF NOT EXISTS resultados_dia ON resultados (dia);
+"""
+
+
+def _rotulo(labels: Sequence[Dict[str, str]], nome: str) -> str:
+    for label in labels:
+        if label.get("name") == nome:
+            return label.get("value") or SEM_ROTULO
+    return SEM_ROTULO
+
+
+def ler_resultado(caminho: str) -> Optional[Tuple[Any, ...]]:
+    """
+    Extrai de um `*-result.json` a linha gravada no índice.
+
+    Returns:
+        Optional[Tuple]: (uuid, history_id, nome, feature, story, status, inicio,
+        duracao_ms, dia), ou None se o arquivo estiver incompleto ou corrompido
+    """
+    try:
+        with open(caminho, "rb") as arquivo:
+            dados = json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(dados, dict) or "uuid" not in dados:
+        return None
+    labels = dados.get("labels") or []
+    inicio, fim = dados.get("start"), dados.get("stop")
+    duracao = fim - inicio if isinstance(inicio, int) and isinstance(fim, int) else None
+    dia = (
+        datetime.fromtimestamp(inicio / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+        if isinstance(inicio, int) else None
+    )
+    return (
+        dados["uuid"],
+        dados.get("historyId"),
+        dados.get("fullName") or dados.get("name"),
+        _rotulo(labels, "feature"),
+        _rotulo(labels, "story"),
+        dados.get("status") or "unknown",
+        inicio,
+        duracao,
+        dia,
+    )
+
+
+class IndiceAllure:
+    """
+    Índice SQLite dos resultados do Allure já processados.
+
+    Args:
+        caminho: Arquivo do índice (":memory:" para um índice descartável)
+    """
+
+    def __init__(self, caminho: str = INDICE_PADRAO):
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        self.caminho = caminho
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(_ESQUEMA)
+
+    def __enter__(self) -> "IndiceAllure":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conexao.close()
+
+    def _novos(self, diretorio: str) -> Iterator[str]:
+        conhecidos = {nome for (nome,) in self._conexao.execute("SELECT nome FROM arquivos")}
+        with os.scandir(diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith(SUFIXO_RESULTADO) and entrada.name not in conhecidos:
+                    yield entrada.name
+
+    def atualizar(self, diretorio: str = DIRETORIO_RESULTADOS, lote: int = 500) -> int:
+        """
+        Processa os `*-result.json` que ainda não estão no índice.
+
+        Arquivos ilegíveis (ex.: ainda sendo gravados) não são marcados como
+        processados e serão tentados de novo na próxima atualização.
+
+        Args:
+            diretorio: Diretório de resultados do Allure
+            lote: Resultados gravados por transação
+
+        Returns:
+            int: Quantidade de resultados novos indexados
+        """
+        if not os.path.isdir(diretorio):
+            return 0
+        total = 0
+        linhas, nomes = [], []
+
+        def gravar() -> None:
+            with self._conexao:
+                self._conexao.executemany(
+                    "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", linhas
+                )
+                self._conexao.executemany("INSERT OR IGNORE INTO arquivos VALUES (?)", nomes)
+            linhas.clear()
+            nomes.clear()
+
+        for nome in self._novos(diretorio):
+            linha = ler_resultado(os.path.join(diretorio, nome))
+            if linha is None:
+                continue
+            linhas.append(linha)
+            nomes.append((nome,))
+            total += 1
+            if len(linhas) >= lote:
+                gravar()
+        if linhas:
+            gravar()
+        return total
+
+    def _consultar(self, por: str, colunas: str, dias: Optional[int], agrupar_extra: str = "") -> List[sqlite3.Row]:
+        if por not in AGRUPAMENTOS:
+            raise ValueError(f"Agrupamento inválido: {por}. Use {', '.join(AGRUPAMENTOS)}.")
+        grupo = ", ".join(AGRUPAMENTOS[por] + ((agrupar_extra,) if agrupar_extra else ()))
+        filtro, parametros = "", ()
+        if dias is not None:
+            filtro = "WHERE dia >= ?"
+            parametros = ((datetime.now(timezone.utc) - timedelta(days=dias - 1)).strftime("%Y-%m-%d"),)
+        contagens = ", ".join(f"SUM(status = '{status}') AS {status}" for status in STATUS)
+        sql = (
+            f"SELECT {grupo}, {colunas}, COUNT(*) AS execucoes, {contagens}, "
+            "AVG(duracao_ms) AS duracao_media_ms, MAX(duracao_ms) AS duracao_max_ms "
+            f"FROM resultados {filtro} GROUP BY {grupo} ORDER BY {grupo}"
+        )
+        self._conexao.row_factory = sqlite3.Row
+        try:
+            return self._conexao.execute(sql, parametros).fetchall()
+        finally:
+            self._conexao.row_factory = None
+
+    def resumo(self, por: str = "story", dias: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Totais por feature (ou feature + story).
+
+        Args:
+            por: "feature" ou "story"
+            dias: Considera apenas os últimos N dias (padrão: todo o histórico)
+
+        Returns:
+            List[Dict[str, Any]]: Uma linha por grupo, com contagens por status,
+            taxa de sucesso e durações
+        """
+        return [_linha(registro) for registro in self._consultar(por, "MAX(dia) AS ultimo_dia", dias)]
+
+    def tendencia(self, por: str = "story", dias: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Mesmas métricas do `resumo`, separadas por dia (UTC) de início do teste."""
+        return [_linha(registro) for registro in self._consultar(por, "COUNT(DISTINCT history_id) AS testes", dias, "dia")]
+
+    def duracoes_por_teste(self) -> Dict[str, float]:
+        """
+        Duração média (s) de cada teste executado, pelo `fullName` do Allure.
+
+        Resultados `skipped` ficam de fora: não representam o custo do teste.
+        """
+        return {
+            nome: media / 1000
+            for nome, media in self._conexao.execute(
+                "SELECT nome, AVG(duracao_ms) FROM resultados "
+                "WHERE status != 'skipped' AND duracao_ms IS NOT NULL GROUP BY nome"
+            )
+        }
+
+    def __len__(self) -> int:
+        return self._conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+
+def _linha(registro: sqlite3.Row) -> Dict[str, Any]:
+    linha = dict(registro)
+    linha["taxa_sucesso"] = round(linha["passed"] / linha["execucoes"], 4) if linha["execucoes"] else 0.0
+    if linha["duracao_media_ms"] is not None:
+        linha["duracao_media_ms"] = round(linha["duracao_media_ms"], 1)
+    return linha
+
+
+def formatar(linhas: List[Dict[str, Any]], por: str) -> str:
+    """Tabela de texto do resumo ou da tendência."""
+    chaves = list(AGRUPAMENTOS[por]) + (["dia"] if linhas and "dia" in linhas[0] else [])
+    larguras = {chave: max([len(chave)] + [len(str(linha[chave])) for linha in linhas]) for chave in chaves}
+    cabecalho = "  ".join(f"{chave:<{larguras[chave]}}" for chave in chaves)
+    cabecalho += f"{'exec':>7}{'pass':>7}{'fail':>7}{'broken':>8}{'skip':>7}{'sucesso%':>10}{'média ms':>10}{'max ms':>9}"
+    saida = [cabecalho]
+    for linha in linhas:
+        texto = "  ".join(f"{str(linha[chave]):<{larguras[chave]}}" for chave in chaves)
+        texto += (
+            f"{linha['execucoes']:>7}{linha['passed']:>7}{linha['failed']:>7}{linha['broken']:>8}{linha['skipped']:>7}"
+            f"{linha['taxa_sucesso'] * 100:>10.1f}{linha['duracao_media_ms'] or 0:>10.1f}{linha['duracao_max_ms'] or 0:>9}"
+        )
+        saida.append(texto)
+    return "\n".join(saida)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Resumo incremental dos resultados do Allure por feature/story",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--resultados", default=DIRETORIO_RESULTADOS, help="Diretório allure-results")
+    parser.add_argument("--indice", default=INDICE_PADRAO, help="Arquivo SQLite do índice")
+    parser.add_argument("--por", choices=tuple(AGRUPAMENTOS), default="story")
+    parser.add_argument("--dias", type=int, help="Considera apenas os últimos N dias")
+    parser.add_argument("--diario", action="store_true", help="Mostra a tendência dia a dia")
+    parser.add_argument("--json", dest="saida_json", help="Grava o resultado em JSON neste arquivo")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    with IndiceAllure(args.indice) as indice:
+        novos = indice.atualizar(args.resultados)
+        linhas = indice.tendencia(args.por, args.dias) if args.diario else indice.resumo(args.por, args.dias)
+        total = len(indice)
+    duracao = time.perf_counter() - inicio
+
+    print(formatar(linhas, args.por))
+    print(f"\n{novos} resultados novos, {total} no índice ({duracao * 1000:.0f} ms)", file=sys.stderr)
+    if args.saida_json:
+        with open(args.saida_json, "w", encoding="utf-8") as arquivo:
+            json.dump(linhas, arquivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Anexos do Allure gravados fora do caminho crítico dos testes.
+
+`allure.attach` registra o anexo no resultado do teste e grava o arquivo em
+`reports/allure-results` na mesma chamada. Aqui o registro continua síncrono
+(o anexo precisa pertencer ao passo corrente), mas a gravação vai para uma
+fila limitada consumida por uma thread de fundo, que também trunca ou
+comprime payloads grandes. Anexos de conteúdo idêntico apontam para o mesmo
+arquivo.
+
+Configuração por ambiente:
+    FINTECH_ALLURE_ANEXOS            async (padrão), sync ou off
+    FINTECH_ALLURE_ANEXOS_MAX_BYTES  limite por anexo (padrão 65536)
+    FINTECH_ALLURE_ANEXOS_GRANDES    truncar (padrão) ou gzip
+"""
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from uuid import uuid4
+
+import allure
+from allure_commons._core import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment
+from allure_commons.types import AttachmentType
+
+MODOS = ("async", "sync", "off")
+GRANDES = ("truncar", "gzip")
+
+
+def _serializar(body: Any) -> bytes:
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (dict, list)):
+        return json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+    return str(body).encode("utf-8")
+
+
+def _reporter():
+    """AllureReporter da sessão, ou None quando o allure-pytest não está ativo."""
+    for plugin in plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None:
+            return reporter
+    return None
+
+
+class Anexador:
+    """
+    Registra anexos no Allure e grava os arquivos em uma thread de fundo.
+
+    Args:
+        modo: "async" (gravação em fundo), "sync" (allure.attach direto) ou "off" (no-op)
+        max_bytes: Tamanho a partir do qual o anexo é truncado ou comprimido
+        grandes: "truncar" ou "gzip" para anexos acima de `max_bytes`
+        tamanho_fila: Anexos pendentes antes de a chamada esperar a gravação
+        max_dedup: Quantidade de hashes lembrados para deduplicação
+        reporter: AllureReporter a usar no lugar do da sessão do allure-pytest
+    """
+
+    def __init__(
+        self,
+        modo: str = "async",
+        max_bytes: int = 65536,
+        grandes: str = "truncar",
+        tamanho_fila: int = 10000,
+        max_dedup: int = 10000,
+        reporter=None,
+    ):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de anexos inválido: {modo}. Use um de {MODOS}.")
+        if grandes not in GRANDES:
+            raise ValueError(f"Tratamento de anexos grandes inválido: {grandes}. Use um de {GRANDES}.")
+        self.modo = modo
+        self.max_bytes = max_bytes
+        self.grandes = grandes
+        self.max_dedup = max_dedup
+        self.reporter = reporter
+        self.gravados = 0
+        self.deduplicados = 0
+        self._fila: "queue.Queue[Tuple[bytes, str, bool]]" = queue.Queue(maxsize=tamanho_fila)
+        self._arquivos: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> "Anexador":
+        """Anexador configurado pelas variáveis FINTECH_ALLURE_ANEXOS*."""
+        return cls(
+            modo=os.environ.get("FINTECH_ALLURE_ANEXOS", "async"),
+            max_bytes=int(os.environ.get("FINTECH_ALLURE_ANEXOS_MAX_BYTES", 65536)),
+            grandes=os.environ.get("FINTECH_ALLURE_ANEXOS_GRANDES", "truncar"),
+        )
+
+    def anexar(self, body: Any, name: str, attachment_type: AttachmentType = AttachmentType.TEXT) -> None:
+        """
+        Anexa `body` ao passo corrente do Allure, como `allure.attach`.
+
+        Args:
+            body: Conteúdo (str, bytes, dict/list serializados como JSON ou qualquer objeto via str)
+            name: Nome exibido no relatório
+            attachment_type: Tipo do anexo
+        """
+        if self.modo == "off":
+            return
+        conteudo = _serializar(body)
+        if self.modo == "sync":
+            allure.attach(conteudo, name=name, attachment_type=attachment_type)
+            return
+
+        reporter = self.reporter or _reporter()
+        try:
+            executavel = reporter and reporter._last_executable()
+            itens = reporter and reporter._items
+        except StopIteration:
+            executavel = None  # thread auxiliar aberta fora de um teste
+        except AttributeError:
+            # allure-commons sem a API interna usada aqui: volta ao caminho síncrono
+            allure.attach(conteudo, name=name, attachment_type=attachment_type)
+            return
+        if executavel is None:
+            return  # fora de um teste do allure-pytest: nada a registrar
+
+        chave = hashlib.blake2b(conteudo, digest_size=16).digest()
+        mime_type, extensao = attachment_type.mime_type, attachment_type.extension
+        comprimir = self.grandes == "gzip" and len(conteudo) > self.max_bytes
+        if comprimir:
+            mime_type, extensao = "application/gzip", f"{extensao}.gz"
+        chave += extensao.encode()
+
+        with self._lock:
+            file_name = self._arquivos.get(chave)
+            novo = file_name is None
+            if novo:
+                file_name = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=extensao)
+                self._arquivos[chave] = file_name
+                if len(self._arquivos) > self.max_dedup:
+                    self._arquivos.popitem(last=False)
+            else:
+                self._arquivos.move_to_end(chave)
+                self.deduplicados += 1
+
+        # Mesmo registro de AllureReporter._attach, com o nome de arquivo já decidido
+        itens[executavel].attachments.append(
+            Attachment(source=file_name, name=name, type=mime_type)
+        )
+        if novo:
+            self._iniciar()
+            self._fila.put((conteudo, file_name, comprimir))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Espera a gravação de todos os anexos enfileirados."""
+        if self._thread is None:
+            return
+        with self._fila.all_tasks_done:
+            if timeout is None:
+                while self._fila.unfinished_tasks:
+                    self._fila.all_tasks_done.wait()
+            else:
+                self._fila.all_tasks_done.wait_for(lambda: not self._fila.unfinished_tasks, timeout)
+
+    # --- Thread de gravação ---
+    def _iniciar(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._gravar, name="allure-anexos", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush, 30.0)
+
+    def _gravar(self) -> None:
+        while True:
+            conteudo, file_name, comprimir = self._fila.get()
+            try:
+                plugin_manager.hook.report_attached_data(body=self._preparar(conteudo, comprimir), file_name=file_name)
+                self.gravados += 1
+            except Exception:
+                pass  # um anexo perdido não deve derrubar a gravação dos demais
+            finally:
+                self._fila.task_done()
+
+    def _preparar(self, conteudo: bytes, comprimir: bool) -> bytes:
+        if comprimir:
+            return gzip.compress(conteudo, compresslevel=6)
+        if len(conteudo) > self.max_bytes:
+            cortado = conteudo[:self.max_bytes].decode("utf-8", "ignore").encode("utf-8")
+            return cortado + f"\n... [truncado: {len(conteudo) - len(cortado)} bytes omitidos]".encode("utf-8")
+        return conteudo
+
+
+anexador = Anexador.from_env()
+
+
+def anexar(body: Any, name: str, attachment_type: AttachmentType = AttachmentType.TEXT) -> None:
+    """Atalho para `anexador.anexar`, substituto direto de `allure.attach`."""
+    anexador.anexar(body, name=name, attachment_type=attachment_type)
@@ -1,42 +1,147 @@
-import requests
 import os
+import uuid
 import allure
+from typing import Optional
+from src.reporting.anexos import anexar
+from src.services.cache_saldo import CacheSaldo
+from src.services.cassete import Cassete
+from src.services.metricas import Metricas
+from src.services.resiliencia import PoliticaResiliencia, Resiliencia
+from src.services.resultados import CadastroResult, SaldoResult, TransferenciaResult, parse_resultado
+from src.services.transport import HTTPTransport
+
+# A URL do seu Mock Server que você copiou do Postman
+DEFAULT_BASE_URL = "https://38c7103a-8b55-4ca9-b297-4b802d0be29f.mock.pstmn.io"
+SCENARIO_HEADER = "x-mock-response-name"
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def montar_headers(scenario_name=None):
+    """
+    Monta os cabeçalhos de uma requisição ao Mock Server.
+
+    Args:
+        scenario_name: Nome do cenário de resposta (opcional)
+
+    Returns:
+        dict: Cabeçalhos da requisição
+    """
+    headers = {}
+    
+    # ESSENCIAL: Diz ao Mock Server qual cenário de resposta retornar
+    if scenario_name:
+        headers[SCENARIO_HEADER] = scenario_name
+        anexar(scenario_name, name="QA Forge Fintech", attachment_type=allure.attachment_type.TEXT)
+
+    return headers
+
 
 class FintechAPI:
-    def __init__(self):
-        # A URL do seu Mock Server que você copiou do Postman
-        self.base_url = os.environ.get("MOCK_API_URL", "https://38c7103a-8b55-4ca9-b297-4b802d0be29f.mock.pstmn.io")
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+        cassete: Optional[Cassete] = None,
+        metricas: Optional[Metricas] = None,
+        resiliencia: Optional[PoliticaResiliencia] = None,
+        cache_saldo: Optional[CacheSaldo] = None,
+    ):
+        self.base_url = base_url or os.environ.get("MOCK_API_URL", DEFAULT_BASE_URL)
+        # Sessão keep-alive compartilhada: evita um handshake TCP/TLS por requisição
+        self.transport = transport or HTTPTransport()
+        # Record/replay opcional (FINTECH_API_CASSETE_MODO=record|replay)
+        self.cassete = cassete if cassete is not None else Cassete.from_env()
+        # Tempos e bytes por requisição (FINTECH_API_METRICAS=off desliga)
+        self.metricas = metricas if metricas is not None else Metricas.from_env()
+        # Prazo, retry com jitter e hedging (FINTECH_API_PRAZO/_TENTATIVAS/_HEDGE_MS)
+        self.resiliencia = Resiliencia(resiliencia or PoliticaResiliencia.from_env())
+        # Cache de leitura de /saldo, desligado por padrão (ver src/services/cache_saldo.py)
+        self.cache_saldo = cache_saldo
 
-    def _send_request(self, method, path, payload=None, scenario_name=None):
+    def _send_request(self, method, path, payload=None, scenario_name=None, headers_extras=None, hedge=False):
         url = f"{self.base_url}{path}"
-        headers = {}
-        
-        # ESSENCIAL: Diz ao Mock Server qual cenário de resposta retornar
-        if scenario_name:
-            headers['x-mock-response-name'] = scenario_name
-            allure.attach(scenario_name, name="QA Forge Fintech", attachment_type=allure.attachment_type.TEXT)
+        headers = montar_headers(scenario_name)
+        if headers_extras:
+            headers.update(headers_extras)
         
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, json=payload, headers=headers)
-        else:
+        if method not in ("GET", "POST", "DELETE"):
             raise ValueError("Método HTTP não suportado.")
-            
-        return response
+
+        def tentativa(restante):
+            timeout = self.transport.config.timeout_limitado(restante)
+            if self.metricas is None:
+                return self.transport.request(method, url, json=payload, headers=headers, timeout=timeout)
+            return self.metricas.medir(
+                method, path, scenario_name,
+                lambda: self.transport.request(method, url, json=payload, headers=headers, timeout=timeout),
+            )
+
+        # POST só é repetido com Idempotency-Key: o servidor não reprocessa a mesma operação
+        idempotente = method != "POST" or IDEMPOTENCY_HEADER in headers
+
+        def enviar():
+            return self.resiliencia.executar(tentativa, idempotente, hedge)
+
+        if self.cassete is not None:
+            return self.cassete.responder(method, url, path, payload, scenario_name, enviar, headers)
+        return enviar()
+
+    def close(self):
+        """Fecha as conexões mantidas pelo transporte e a cassete, se houver."""
+        self.transport.close()
+        self.resiliencia.close()
+        if self.cassete is not None:
+            self.cassete.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     # --- Método 1: Cadastro ---
-    def cadastrar_usuario(self, nome, cpf, senha, scenario_name=None):
+    # tipado=True devolve CadastroResult/ErroNegocio em vez do Response cru
+    def cadastrar_usuario(self, nome, cpf, senha, scenario_name=None, tipado=False):
         payload = {"nome": nome, "cpf": cpf, "senha": senha}
-        return self._send_request("POST", "/cadastro", payload, scenario_name)
+        response = self._send_request("POST", "/cadastro", payload, scenario_name)
+        return parse_resultado(response, CadastroResult) if tipado else response
 
     # --- Método 2: Consulta de Saldo ---
-    def consultar_saldo(self, conta_id, scenario_name=None):
+    # hedge=True dispara uma segunda consulta se a primeira demorar (FINTECH_API_HEDGE_MS)
+    # Com cache_saldo, uma consulta repetida dentro do TTL não sai do processo
+    def consultar_saldo(self, conta_id, scenario_name=None, tipado=False, hedge=True):
         # O Path da URL no Mock Server é /saldo/{{conta_id}}, mas no código enviamos apenas /saldo/
         # O Postman fará o matching correto com a rota /saldo/...
-        return self._send_request("GET", f"/saldo/{conta_id}", scenario_name=scenario_name)
+        if self.cache_saldo is None:
+            response = self._send_request("GET", f"/saldo/{conta_id}", scenario_name=scenario_name, hedge=hedge)
+        else:
+            response, geracao = self.cache_saldo.obter(str(conta_id), scenario_name)
+            if response is None:
+                response = self._send_request("GET", f"/saldo/{conta_id}", scenario_name=scenario_name, hedge=hedge)
+                self.cache_saldo.guardar(str(conta_id), scenario_name, response, geracao)
+        return parse_resultado(response, SaldoResult) if tipado else response
 
     # --- Método 3: Transferência ---
-    def realizar_transferencia(self, origem, destino, valor, scenario_name=None):
+    # A Idempotency-Key (gerada se omitida) é a mesma em todas as retentativas da chamada
+    def realizar_transferencia(self, origem, destino, valor, scenario_name=None, tipado=False, idempotency_key=None):
         payload = {"origem": origem, "destino": destino, "valor": valor}
-        return self._send_request("POST", "/transferencia", payload, scenario_name)
\ No newline at end of file
+        headers = {IDEMPOTENCY_HEADER: idempotency_key or str(uuid.uuid4())}
+        try:
+            response = self._send_request("POST", "/transferencia", payload, scenario_name, headers_extras=headers)
+        except Exception:
+            self._invalidar_saldos(origem, destino)  # a transferência pode ter sido aplicada
+            raise
+        # Recusa de negócio (4xx) não altera saldos; 2xx altera e 5xx pode ter alterado
+        if response.status_code < 400 or response.status_code >= 500:
+            self._invalidar_saldos(origem, destino)
+        return parse_resultado(response, TransferenciaResult) if tipado else response
+
+    # --- Método 4: Exclusão de Usuário ---
+    def deletar_usuario(self, conta_id, scenario_name=None):
+        response = self._send_request("DELETE", f"/usuario/{conta_id}", scenario_name=scenario_name)
+        self._invalidar_saldos(conta_id)
+        return response
+
+    def _invalidar_saldos(self, *contas):
+        if self.cache_saldo is not None:
+            self.cache_saldo.invalidar(*(str(conta) for conta in contas))
@@ -0,0 +1,209 @@
+"""
+Cliente assíncrono (asyncio) da API Fintech, irmão do FintechAPI síncrono.
+"""
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, Iterable, NamedTuple, Optional, Union
+
+import httpx
+
+from src.services.api_client import DEFAULT_BASE_URL, montar_headers
+from src.services.resultados import CadastroResult, Resultado, SaldoResult, TransferenciaResult, parse_resultado
+from src.services.transport import TransportConfig
+
+
+class Operacao(NamedTuple):
+    """Uma chamada a ser executada em lote: nome do método do cliente e seus argumentos."""
+    metodo: str
+    kwargs: Dict[str, Any]
+
+
+class ResultadoOperacao(NamedTuple):
+    """Resultado de uma operação em lote: resposta HTTP ou a exceção levantada."""
+    operacao: Operacao
+    response: Optional[httpx.Response]
+    erro: Optional[BaseException]
+
+
+class AsyncFintechAPI:
+    """
+    Versão asyncio do FintechAPI com métodos de lote de concorrência limitada.
+
+    O httpx.AsyncClient é criado na primeira requisição e fica preso ao event
+    loop em que foi usado; use a instância sempre a partir do mesmo loop.
+    """
+
+    METODOS = ("cadastrar_usuario", "consultar_saldo", "realizar_transferencia")
+
+    def __init__(self, base_url: Optional[str] = None, config: Optional[TransportConfig] = None):
+        self.base_url = base_url or os.environ.get("MOCK_API_URL", DEFAULT_BASE_URL)
+        self.config = config or TransportConfig.from_env()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _cliente(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_size,
+                    max_keepalive_connections=self.config.pool_size,
+                ),
+                # pool=None: a espera por uma conexão livre já é limitada pelo semáforo dos lotes
+                timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout, pool=None),
+            )
+        return self._client
+
+    async def _send_request(self, method, path, payload=None, scenario_name=None) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        headers = montar_headers(scenario_name)
+
+        if method == "GET":
+            return await self._cliente().get(url, headers=headers)
+        if method == "POST":
+            return await self._cliente().post(url, json=payload, headers=headers)
+        raise ValueError("Método HTTP não suportado.")
+
+    async def aclose(self) -> None:
+        """Fecha as conexões mantidas pelo cliente."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncFintechAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    # --- Método 1: Cadastro ---
+    async def cadastrar_usuario(self, nome, cpf, senha, scenario_name=None, tipado=False) -> Union[httpx.Response, Resultado]:
+        payload = {"nome": nome, "cpf": cpf, "senha": senha}
+        response = await self._send_request("POST", "/cadastro", payload, scenario_name)
+        return parse_resultado(response, CadastroResult) if tipado else response
+
+    # --- Método 2: Consulta de Saldo ---
+    async def consultar_saldo(self, conta_id, scenario_name=None, tipado=False) -> Union[httpx.Response, Resultado]:
+        response = await self._send_request("GET", f"/saldo/{conta_id}", scenario_name=scenario_name)
+        return parse_resultado(response, SaldoResult) if tipado else response
+
+    # --- Método 3: Transferência ---
+    async def realizar_transferencia(self, origem, destino, valor, scenario_name=None, tipado=False) -> Union[httpx.Response, Resultado]:
+        payload = {"origem": origem, "destino": destino, "valor": valor}
+        response = await self._send_request("POST", "/transferencia", payload, scenario_name)
+        return parse_resultado(response, TransferenciaResult) if tipado else response
+
+    # --- Lotes ---
+    async def _executar(self, operacao: Operacao) -> ResultadoOperacao:
+        try:
+            response = await getattr(self, operacao.metodo)(**operacao.kwargs)
+        except Exception as erro:
+            return ResultadoOperacao(operacao, None, erro)
+        return ResultadoOperacao(operacao, response, None)
+
+    async def executar_em_lote(
+        self,
+        operacoes: Iterable[Operacao],
+        concorrencia: Optional[int] = None,
+    ) -> AsyncIterator[ResultadoOperacao]:
+        """
+        Executa as operações com no máximo `concorrencia` em voo, entregando
+        os resultados na ordem em que terminam.
+
+        O iterável é consumido sob demanda, então pode ser um gerador de
+        milhões de operações sem que todas as tarefas sejam criadas de uma vez.
+        Falhas de rede não interrompem o lote: vêm em ResultadoOperacao.erro.
+        Se o lote terminar antes da hora (o consumidor para de iterar ou uma
+        operação inválida aparece no meio), as tarefas em voo são canceladas
+        e aguardadas.
+
+        Args:
+            operacoes: Operações a executar
+            concorrencia: Limite de requisições simultâneas (padrão: pool_size)
+
+        Yields:
+            ResultadoOperacao: Resultado de cada operação concluída
+
+        Raises:
+            ValueError: Se uma operação usar um método fora de METODOS
+        """
+        limite = asyncio.Semaphore(concorrencia or self.config.pool_size)
+        concluidas: asyncio.Queue = asyncio.Queue()
+        # Referências fortes: o event loop guarda apenas referências fracas às tarefas
+        tarefas = set()
+        em_voo = 0
+
+        def _liberar(tarefa: asyncio.Task) -> None:
+            tarefas.discard(tarefa)
+            limite.release()
+            if not tarefa.cancelled():
+                concluidas.put_nowait(tarefa.result())
+
+        try:
+            for operacao in operacoes:
+                if operacao.metodo not in self.METODOS:
+                    raise ValueError(f"Operação não suportada em lote: {operacao.metodo}")
+                await limite.acquire()
+                tarefa = asyncio.create_task(self._executar(operacao))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(_liberar)
+                em_voo += 1
+                while not concluidas.empty():
+                    em_voo -= 1
+                    yield concluidas.get_nowait()
+
+            while em_voo:
+                em_voo -= 1
+                yield await concluidas.get()
+        finally:
+            # Saída antecipada (break do consumidor, aclose ou erro no meio do
+            # lote): as requisições ainda em voo não podem ficar órfãs no loop
+            pendentes = list(tarefas)
+            for tarefa in pendentes:
+                tarefa.cancel()
+            if pendentes:
+                await asyncio.gather(*pendentes, return_exceptions=True)
+
+    def consultar_saldos_em_lote(
+        self,
+        conta_ids: Iterable[str],
+        scenario_name: Optional[str] = None,
+        concorrencia: Optional[int] = None,
+    ) -> AsyncIterator[ResultadoOperacao]:
+        """
+        Consulta o saldo de várias contas com concorrência limitada.
+
+        Args:
+            conta_ids: IDs das contas
+            scenario_name: Cenário do Mock Server aplicado a todas as consultas
+            concorrencia: Limite de requisições simultâneas
+
+        Returns:
+            AsyncIterator[ResultadoOperacao]: Resultados na ordem de conclusão
+        """
+        operacoes = (
+            Operacao("consultar_saldo", {"conta_id": conta_id, "scenario_name": scenario_name})
+            for conta_id in conta_ids
+        )
+        return self.executar_em_lote(operacoes, concorrencia)
+
+    def transferencias_em_lote(
+        self,
+        transferencias: Iterable[Dict[str, Any]],
+        scenario_name: Optional[str] = None,
+        concorrencia: Optional[int] = None,
+    ) -> AsyncIterator[ResultadoOperacao]:
+        """
+        Realiza várias transferências com concorrência limitada.
+
+        Args:
+            transferencias: Dicts com origem, destino, valor e, opcionalmente, scenario_name
+            scenario_name: Cenário padrão para itens que não definem o próprio
+            concorrencia: Limite de requisições simultâneas
+
+        Returns:
+            AsyncIterator[ResultadoOperacao]: Resultados na ordem de conclusão
+        """
+        operacoes = (
+            Operacao("realizar_transferencia", {"scenario_name": scenario_name, **transferencia})
+            for transferencia in transferencias
+        )
+        return self.executar_em_lote(operacoes, concorrencia)
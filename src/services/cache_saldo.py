@@ -0,0 +1,137 @@
+"""
+Cache opcional de leitura para `GET /saldo/{conta_id}` no FintechAPI.
+
+LRU limitado a `max_itens` contas, com TTL: uma consulta de saldo respondida
+pelo cache pode estar até `ttl` segundos atrasada em relação ao backend.
+Por isso o cache vem desligado e é ligado por instância do cliente, em
+perfis de carga em que essa defasagem é aceitável.
+
+As escritas do próprio cliente invalidam as contas afetadas: transferência
+(origem e destino) e exclusão de usuário. Uma consulta que começou antes de
+uma invalidação da mesma conta não grava sua resposta, que pode ser
+anterior à escrita. Só respostas 200 são guardadas, uma por conta, junto
+com o cenário do Mock Server que as produziu.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import requests
+
+
+class _Item(NamedTuple):
+    scenario_name: Optional[str]
+    response: requests.Response
+    expira_em: float
+
+
+class CacheSaldo:
+    """
+    LRU com TTL das respostas de saldo, seguro entre threads.
+
+    Args:
+        max_itens: Contas guardadas no máximo; a menos usada recentemente sai primeiro
+        ttl: Validade de cada resposta, em segundos
+        relogio: Fonte de tempo monotônica (substituível nos testes)
+    """
+
+    def __init__(self, max_itens: int = 1024, ttl: float = 5.0, relogio: Callable[[], float] = time.monotonic):
+        if max_itens < 1 or ttl <= 0:
+            raise ValueError("O cache de saldo exige max_itens >= 1 e ttl > 0.")
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._relogio = relogio
+        self._itens: "OrderedDict[str, _Item]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Relógio lógico das invalidações: uma leitura iniciada na geração g não
+        # grava se a conta foi invalidada depois de g. O registro por conta é
+        # limitado; das contas esquecidas fica só a maior geração (`_piso`)
+        self._geracao = 0
+        self._invalidada_em: "OrderedDict[str, int]" = OrderedDict()
+        self._piso = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.expirados = 0
+        self.invalidacoes = 0
+        self.descartados = 0
+
+    def obter(self, conta_id: str, scenario_name: Optional[str] = None) -> Tuple[Optional[requests.Response], int]:
+        """
+        Busca o saldo guardado da conta.
+
+        Args:
+            conta_id: Conta consultada
+            scenario_name: Cenário do Mock Server da consulta
+
+        Returns:
+            Tuple[Optional[requests.Response], int]: A resposta guardada (ou
+            None em caso de falta) e a geração a repassar para `guardar`
+        """
+        with self._lock:
+            item = self._itens.get(conta_id)
+            if item is not None and item.scenario_name == scenario_name:
+                if item.expira_em > self._relogio():
+                    self._itens.move_to_end(conta_id)
+                    self.acertos += 1
+                    return item.response, self._geracao
+                del self._itens[conta_id]
+                self.expirados += 1
+            self.faltas += 1
+            return None, self._geracao
+
+    def guardar(self, conta_id: str, scenario_name: Optional[str], response: requests.Response, geracao: int) -> None:
+        """
+        Guarda a resposta de uma consulta que não achou a conta no cache.
+
+        Args:
+            conta_id: Conta consultada
+            scenario_name: Cenário do Mock Server da consulta
+            response: Resposta do backend (só status 200 é guardado)
+            geracao: Geração devolvida por `obter` antes da consulta
+        """
+        if response.status_code != 200:
+            return
+        with self._lock:
+            if self._invalidada_em.get(conta_id, self._piso) > geracao:
+                return  # houve escrita na conta durante a consulta: a resposta pode estar velha
+            self._itens[conta_id] = _Item(scenario_name, response, self._relogio() + self.ttl)
+            self._itens.move_to_end(conta_id)
+            if len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+                self.descartados += 1
+
+    def invalidar(self, *contas: str) -> None:
+        """Remove as contas do cache e descarta as consultas delas em andamento."""
+        with self._lock:
+            self._geracao += 1
+            for conta_id in contas:
+                if self._itens.pop(conta_id, None) is not None:
+                    self.invalidacoes += 1
+                self._invalidada_em[conta_id] = self._geracao
+                self._invalidada_em.move_to_end(conta_id)
+            while len(self._invalidada_em) > 4 * self.max_itens:
+                _, geracao = self._invalidada_em.popitem(last=False)
+                self._piso = max(self._piso, geracao)
+
+    def limpar(self) -> None:
+        """Esvazia o cache, mantendo os contadores."""
+        with self._lock:
+            self._geracao += 1
+            self._piso = self._geracao
+            self._invalidada_em.clear()
+            self._itens.clear()
+
+    @property
+    def taxa_acerto(self) -> float:
+        consultas = self.acertos + self.faltas
+        return self.acertos / consultas if consultas else 0.0
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheSaldo({len(self)}/{self.max_itens} contas, ttl={self.ttl}s, "
+            f"acertos={self.acertos}, faltas={self.faltas}, taxa={self.taxa_acerto:.1%})"
+        )
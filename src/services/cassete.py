@@ -0,0 +1,353 @@
+"""
+Camada de gravação/reprodução (record/replay) de respostas do FintechAPI.
+
+As respostas ficam em um arquivo binário append-only, lido via mmap:
+
+    cabeçalho  MAGIC (8 bytes)
+    registro   <16s d H H I>  impressão digital, gravado_em, status,
+                              tamanho do content-type, tamanho do corpo
+               content-type e corpo em seguida
+
+A impressão digital combina método, path, payload canônico e cenário do
+Mock Server. Regravações apenas acrescentam registros (o último vale); a
+compactação reescreve o arquivo sem versões antigas nem entradas expiradas.
+
+O mesmo arquivo pode ser gravado por vários clientes e workers do xdist ao
+mesmo tempo: cada registro é acrescentado com uma única escrita sob trava
+exclusiva (`<cassete>.lock`), e a compactação, sob a mesma trava, relê o
+arquivo inteiro antes de reescrevê-lo. Quem tinha o arquivo antigo aberto
+percebe a troca pelo inode e reabre. Sem `fcntl` (Windows) não há trava e a
+compactação automática no `close` é desligada.
+"""
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+MAGIC = b"QAFCAS01"
+_REGISTRO = struct.Struct("<16sdHHI")
+
+MODOS = ("off", "record", "replay")
+
+# Campos que as fixtures geram de forma única a cada execução e que não
+# alteram a resposta do Mock Server: ficam fora da impressão digital
+CAMPOS_VOLATEIS: Dict[str, Iterable[str]] = {
+    "/cadastro": ("nome", "cpf"),
+}
+
+
+class CasseteAusente(LookupError):
+    """Requisição sem resposta gravada (ou expirada) em modo replay."""
+
+
+class _Entrada(NamedTuple):
+    gravado_em: float
+    status: int
+    content_type: str
+    inicio: int
+    tamanho: int
+    corpo: Optional[bytes]
+
+
+def impressao_digital(method: str, path: str, payload=None, scenario_name=None) -> bytes:
+    """
+    Chave da requisição: método, path, payload canônico e cenário.
+
+    O payload é serializado com chaves ordenadas e sem espaços, então
+    dicts equivalentes geram a mesma chave.
+    """
+    if payload is not None:
+        volateis = CAMPOS_VOLATEIS.get(path, ())
+        payload = {k: v for k, v in payload.items() if k not in volateis}
+        canonico = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    else:
+        canonico = ""
+    chave = f"{method}\n{path}\n{canonico}\n{scenario_name or ''}".encode("utf-8")
+    return hashlib.blake2b(chave, digest_size=16).digest()
+
+
+class Cassete:
+    """
+    Armazena e reproduz respostas HTTP por impressão digital da requisição.
+
+    Args:
+        caminho: Arquivo da cassete
+        modo: "record" (rede + grava), "replay" (só a cassete) ou "off"
+        max_idade: Segundos até uma entrada expirar (None = nunca)
+        max_entradas: Entradas mantidas na compactação, das mais recentes (None = todas)
+    """
+
+    def __init__(
+        self,
+        caminho: str,
+        modo: str = "replay",
+        max_idade: Optional[float] = None,
+        max_entradas: Optional[int] = None,
+    ):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de cassete inválido: {modo}. Use um de {MODOS}.")
+        self.caminho = caminho
+        self.modo = modo
+        self.max_idade = max_idade
+        self.max_entradas = max_entradas
+        self.acertos = 0
+        self.faltas = 0
+        self._lock = threading.Lock()
+        self._indice: Dict[bytes, _Entrada] = {}
+        self._registros = 0
+        self._mmap: Optional[mmap.mmap] = None
+        self._arquivo = None
+        self._trava = None
+        self._carregar()
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassete"]:
+        """
+        Cassete configurada por FINTECH_API_CASSETE_MODO e FINTECH_API_CASSETE
+        (caminho), com FINTECH_API_CASSETE_MAX_IDADE opcional em segundos.
+
+        Returns:
+            Optional[Cassete]: None quando o modo é "off" ou não foi definido
+        """
+        modo = os.environ.get("FINTECH_API_CASSETE_MODO", "off")
+        if modo == "off":
+            return None
+        max_idade = os.environ.get("FINTECH_API_CASSETE_MAX_IDADE")
+        return cls(
+            os.environ.get("FINTECH_API_CASSETE", "reports/cassetes/fintech_api.cas"),
+            modo,
+            max_idade=float(max_idade) if max_idade else None,
+        )
+
+    # --- Leitura ---
+    def _carregar(self) -> None:
+        if not os.path.exists(self.caminho) or os.path.getsize(self.caminho) <= len(MAGIC):
+            return
+        with open(self.caminho, "rb") as arquivo:
+            self._mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            self._mmap = None
+            raise ValueError(f"Arquivo não é uma cassete do QA-Forge: {self.caminho}")
+
+        posicao, fim = len(MAGIC), len(self._mmap)
+        while posicao + _REGISTRO.size <= fim:
+            chave, gravado_em, status, tam_tipo, tam_corpo = _REGISTRO.unpack_from(self._mmap, posicao)
+            posicao += _REGISTRO.size
+            tipo = self._mmap[posicao:posicao + tam_tipo].decode("latin-1")
+            posicao += tam_tipo
+            if posicao + tam_corpo > fim:
+                break  # registro truncado (gravação interrompida)
+            self._indice[chave] = _Entrada(gravado_em, status, tipo, posicao, tam_corpo, None)
+            self._registros += 1
+            posicao += tam_corpo
+
+    def _expirada(self, entrada: _Entrada) -> bool:
+        return self.max_idade is not None and time.time() - entrada.gravado_em > self.max_idade
+
+    def _corpo(self, entrada: _Entrada) -> bytes:
+        if entrada.corpo is not None:
+            return entrada.corpo
+        return self._mmap[entrada.inicio:entrada.inicio + entrada.tamanho]
+
+    def buscar(self, chave: bytes) -> Optional[_Entrada]:
+        entrada = self._indice.get(chave)
+        if entrada is None or self._expirada(entrada):
+            return None
+        return entrada
+
+    # --- Integração com o cliente ---
+    def responder(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        payload,
+        scenario_name: Optional[str],
+        enviar: Callable[[], requests.Response],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Responde pela cassete (replay) ou pela rede gravando o resultado (record).
+
+        Args:
+            method: Método HTTP
+            url: URL completa, usada na resposta reproduzida
+            path: Path da requisição
+            payload: Corpo JSON da requisição
+            scenario_name: Cenário do Mock Server
+            enviar: Executa a requisição real
+            headers: Cabeçalhos da requisição, repetidos no `request` da resposta reproduzida
+
+        Returns:
+            requests.Response: Resposta gravada ou obtida da rede
+
+        Raises:
+            CasseteAusente: Em replay, se não houver entrada válida
+        """
+        chave = impressao_digital(method, path, payload, scenario_name)
+        if self.modo == "replay":
+            entrada = self.buscar(chave)
+            if entrada is None:
+                self.faltas += 1
+                raise CasseteAusente(f"Sem resposta gravada para {method} {path} (cenário: {scenario_name})")
+            self.acertos += 1
+            request = requests.Request(method, url, headers=headers, json=payload).prepare()
+            return _montar_response(entrada.status, entrada.content_type, self._corpo(entrada), request)
+
+        response = enviar()
+        if self.modo == "record":
+            self.gravar(chave, response.status_code, response.headers.get("Content-Type", ""), response.content)
+        return response
+
+    # --- Escrita ---
+    def gravar(self, chave: bytes, status: int, content_type: str, corpo: bytes) -> None:
+        """Acrescenta um registro ao arquivo; a versão mais recente passa a valer."""
+        tipo = content_type.encode("latin-1", "replace")
+        gravado_em = time.time()
+        registro = _REGISTRO.pack(chave, gravado_em, status, len(tipo), len(corpo)) + tipo + corpo
+        with self._lock, self._travado():
+            self._abrir_para_escrita()
+            # Sem buffer: o registro vai inteiro em um único write
+            self._arquivo.write(registro)
+            self._indice[chave] = _Entrada(gravado_em, status, content_type, 0, len(corpo), bytes(corpo))
+            self._registros += 1
+
+    def _travado(self):
+        """Trava exclusiva entre processos sobre `<cassete>.lock` (no-op sem fcntl)."""
+        if fcntl is None:
+            return contextlib.nullcontext()
+        if self._trava is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+            self._trava = open(f"{self.caminho}.lock", "ab")
+        return _Trava(self._trava)
+
+    def _abrir_para_escrita(self) -> None:
+        if self._arquivo is not None:
+            try:
+                substituido = os.stat(self.caminho).st_ino != os.fstat(self._arquivo.fileno()).st_ino
+            except FileNotFoundError:
+                substituido = True
+            if not substituido:
+                return
+            self._arquivo.close()  # outro processo compactou: o arquivo aberto não é mais a cassete
+            self._arquivo = None
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        self._arquivo = open(self.caminho, "ab", buffering=0)
+        if self._arquivo.tell() == 0:
+            self._arquivo.write(MAGIC)
+
+    def compactar(self) -> None:
+        """
+        Reescreve a cassete só com a versão mais recente de cada requisição,
+        descartando entradas expiradas e, acima de `max_entradas`, as mais antigas.
+
+        O arquivo é relido sob a trava, então registros gravados por outros
+        processos desde a abertura não se perdem.
+        """
+        with self._lock, self._travado():
+            self._recarregar()
+            self._reescrever()
+
+    def _recarregar(self) -> None:
+        self._fechar_arquivos()
+        self._indice = {}
+        self._registros = 0
+        self._carregar()
+
+    def _reescrever(self) -> None:
+        vigentes = [(chave, entrada) for chave, entrada in self._indice.items() if not self._expirada(entrada)]
+        vigentes.sort(key=lambda item: item[1].gravado_em, reverse=True)
+        if self.max_entradas is not None:
+            vigentes = vigentes[:self.max_entradas]
+        conteudo = [(chave, entrada, self._corpo(entrada)) for chave, entrada in vigentes]
+
+        self._fechar_arquivos()
+        temporario = f"{self.caminho}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(MAGIC)
+            for chave, entrada, corpo in reversed(conteudo):
+                tipo = entrada.content_type.encode("latin-1", "replace")
+                arquivo.write(_REGISTRO.pack(chave, entrada.gravado_em, entrada.status, len(tipo), len(corpo)))
+                arquivo.write(tipo + corpo)
+        os.replace(temporario, self.caminho)
+
+        self._recarregar()
+
+    @property
+    def desperdicio(self) -> float:
+        """Fração de registros no arquivo que são versões antigas."""
+        return 1 - len(self._indice) / self._registros if self._registros else 0.0
+
+    def _precisa_compactar(self) -> bool:
+        if self.desperdicio > 0.5:
+            return True
+        if self.max_entradas is not None and len(self._indice) > self.max_entradas:
+            return True
+        return any(self._expirada(entrada) for entrada in self._indice.values())
+
+    def _fechar_arquivos(self) -> None:
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self) -> None:
+        """Fecha a cassete; em record, compacta se metade do arquivo for lixo."""
+        with self._lock:
+            if self.modo == "record" and fcntl is not None and self._precisa_compactar():
+                with self._travado():
+                    # A decisão vale para o arquivo atual, com o que os outros gravaram
+                    self._recarregar()
+                    if self._precisa_compactar():
+                        self._reescrever()
+            self._fechar_arquivos()
+            if self._trava is not None:
+                self._trava.close()
+                self._trava = None
+
+
+class _Trava:
+    """flock exclusivo sobre um arquivo já aberto, como gerenciador de contexto."""
+
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+
+    def __enter__(self):
+        fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_UN)
+
+
+def _montar_response(status: int, content_type: str, corpo: bytes, request: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ""
+    response.headers = CaseInsensitiveDict({"Content-Type": content_type, "Content-Length": str(len(corpo))})
+    response._content = corpo
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(0)
+    return response
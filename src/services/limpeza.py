@@ -0,0 +1,124 @@
+"""
+Limpeza das contas criadas durante a sessão de testes.
+
+As contas são acumuladas ao longo de toda a sessão e removidas no final com
+`DELETE /usuario/{conta_id}` em paralelo, com concorrência limitada. Falhas
+transitórias (erro de rede, 429 e 5xx) voltam para uma nova rodada após um
+backoff exponencial; o que sobrar depois da última tentativa é devolvido
+como falha para o relatório.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.services.api_client import FintechAPI
+
+# Status que indicam falha transitória e justificam nova tentativa
+STATUS_RETENTAVEIS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class ResultadoLimpeza(NamedTuple):
+    """Contas removidas e contas que não puderam ser removidas, com o motivo."""
+    removidas: List[str]
+    falhas: Dict[str, str]
+    duracao: float
+
+    def resumo(self) -> str:
+        linhas = [f"Removidas: {len(self.removidas)} | Falhas: {len(self.falhas)} | {self.duracao:.2f}s"]
+        linhas += [f"  {conta_id}: {motivo}" for conta_id, motivo in self.falhas.items()]
+        return "\n".join(linhas)
+
+
+class LimpezaSessao:
+    """
+    Acumula contas da sessão e as remove em rodadas paralelas com retry.
+
+    Args:
+        api: Cliente usado nas exclusões
+        concorrencia: Exclusões simultâneas
+        tentativas: Rodadas no máximo por conta
+        espera: Backoff inicial entre rodadas, em segundos (dobra a cada rodada)
+        scenario_name: Cenário do Mock Server para a exclusão
+    """
+
+    def __init__(
+        self,
+        api: FintechAPI,
+        concorrencia: int = 16,
+        tentativas: int = 3,
+        espera: float = 0.2,
+        scenario_name: Optional[str] = None,
+    ):
+        self.api = api
+        self.concorrencia = concorrencia
+        self.tentativas = tentativas
+        self.espera = espera
+        self.scenario_name = scenario_name
+        # dict como conjunto ordenado: a mesma conta registrada duas vezes é removida uma vez
+        self._pendentes: Dict[str, None] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, api: FintechAPI) -> "LimpezaSessao":
+        """Limpeza configurada por FINTECH_LIMPEZA_CONCORRENCIA e FINTECH_LIMPEZA_TENTATIVAS."""
+        return cls(
+            api,
+            concorrencia=int(os.environ.get("FINTECH_LIMPEZA_CONCORRENCIA", 16)),
+            tentativas=int(os.environ.get("FINTECH_LIMPEZA_TENTATIVAS", 3)),
+        )
+
+    def registrar(self, conta_id: str) -> None:
+        """Agenda uma conta para remoção no fim da sessão."""
+        with self._lock:
+            self._pendentes[conta_id] = None
+
+    @property
+    def pendentes(self) -> List[str]:
+        with self._lock:
+            return list(self._pendentes)
+
+    def _remover(self, conta_id: str) -> Tuple[str, Optional[str], bool]:
+        """Retorna (conta_id, motivo da falha ou None, se vale tentar de novo)."""
+        try:
+            response = self.api.deletar_usuario(conta_id, scenario_name=self.scenario_name)
+        except Exception as erro:
+            return conta_id, f"{type(erro).__name__}: {erro}", True
+        # 404: a conta já não existe, que é o estado desejado
+        if response.status_code < 300 or response.status_code == 404:
+            return conta_id, None, False
+        motivo = f"HTTP {response.status_code}: {response.text[:200]}"
+        return conta_id, motivo, response.status_code in STATUS_RETENTAVEIS
+
+    def executar(self) -> ResultadoLimpeza:
+        """
+        Remove todas as contas registradas.
+
+        Returns:
+            ResultadoLimpeza: Removidas, falhas (com o último motivo) e duração
+        """
+        inicio = time.perf_counter()
+        with self._lock:
+            rodada, self._pendentes = list(self._pendentes), {}
+        removidas: List[str] = []
+        falhas: Dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, self.concorrencia)) as executor:
+            for tentativa in range(self.tentativas):
+                if not rodada:
+                    break
+                if tentativa:
+                    time.sleep(self.espera * 2 ** (tentativa - 1))
+                proxima = []
+                for conta_id, motivo, retentavel in executor.map(self._remover, rodada):
+                    if motivo is None:
+                        removidas.append(conta_id)
+                        falhas.pop(conta_id, None)
+                        continue
+                    falhas[conta_id] = motivo
+                    if retentavel:
+                        proxima.append(conta_id)
+                rodada = proxima
+
+        return ResultadoLimpeza(removidas, falhas, time.perf_counter() - inicio)
@@ -0,0 +1,368 @@
+"""
+Métricas por requisição do cliente FintechAPI.
+
+Cada requisição enviada pela rede registra DNS, conexão, TTFB, tempo total,
+bytes enviados/recebidos e status, agregados em memória por endpoint
+(path com IDs normalizados), método, cenário do Mock Server e status.
+
+DNS e conexão são medidos por uma conexão do urllib3 instrumentada, que
+anota as fases em uma variável por thread; em conexões reaproveitadas do
+pool as duas fases valem zero. O TTFB vem de `response.elapsed` (envio até
+os cabeçalhos da resposta).
+
+Os agregados são exportados em texto Prometheus e em line protocol do
+InfluxDB (`exportar`) e, opcionalmente, servidos em `/metrics` por
+`ServidorMetricas` durante execuções longas.
+"""
+import bisect
+import os
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PREFIXO = "fintech_api"
+
+# Limites (s) dos buckets do histograma de tempo total
+LIMITES_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Segmentos com dígitos (IDs, CPFs) viram {id} para manter a cardinalidade baixa
+_SEGMENTO_ID = re.compile(r"/[^/]*\d[^/]*")
+
+_fases = threading.local()
+
+
+def normalizar_endpoint(path: str) -> str:
+    """'/saldo/12345' -> '/saldo/{id}'."""
+    return _SEGMENTO_ID.sub("/{id}", path.split("?", 1)[0])
+
+
+# =============================================================================
+# CONEXÕES INSTRUMENTADAS
+# =============================================================================
+
+class _ConexaoMedida:
+    """Mixin que mede DNS e conexão TCP ao abrir uma conexão nova."""
+
+    def _new_conn(self):
+        inicio = time.perf_counter()
+        host = self._dns_host
+        try:
+            self._dns_host = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            pass  # deixa a resolução (e o erro) para o urllib3
+        resolvido = time.perf_counter()
+        try:
+            sock = super()._new_conn()
+        except Exception:
+            if self._dns_host == host:
+                raise
+            # O primeiro endereço resolvido falhou: deixa o urllib3 tentar os demais
+            self._dns_host = host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+        _fases.dns = resolvido - inicio
+        _fases.conexao = time.perf_counter() - resolvido
+        return sock
+
+
+class ConexaoHTTPMedida(_ConexaoMedida, HTTPConnection):
+    pass
+
+
+class ConexaoHTTPSMedida(_ConexaoMedida, HTTPSConnection):
+    pass
+
+
+class _PoolHTTPMedido(HTTPConnectionPool):
+    ConnectionCls = ConexaoHTTPMedida
+
+
+class _PoolHTTPSMedido(HTTPSConnectionPool):
+    ConnectionCls = ConexaoHTTPSMedida
+
+
+class AdapterInstrumentado(HTTPAdapter):
+    """HTTPAdapter cujos pools abrem conexões que medem DNS e conexão."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _PoolHTTPMedido, "https": _PoolHTTPSMedido}
+
+
+# =============================================================================
+# AGREGADOS
+# =============================================================================
+
+Rotulos = Tuple[str, str, str, str]  # endpoint, método, cenário, status
+
+
+class _Agregado:
+    __slots__ = ("total", "conexoes", "dns", "conexao", "ttfb", "duracao", "bytes_enviados",
+                 "bytes_recebidos", "buckets")
+
+    def __init__(self):
+        self.total = 0
+        self.conexoes = 0
+        self.dns = 0.0
+        self.conexao = 0.0
+        self.ttfb = 0.0
+        self.duracao = 0.0
+        self.bytes_enviados = 0
+        self.bytes_recebidos = 0
+        self.buckets = [0] * (len(LIMITES_LATENCIA) + 1)
+
+
+class Metricas:
+    """Agregados em memória das requisições do cliente, seguros entre threads."""
+
+    def __init__(self):
+        self._agregados: Dict[Rotulos, _Agregado] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["Metricas"]:
+        """
+        Registro global da sessão, ou None com FINTECH_API_METRICAS=off.
+
+        Returns:
+            Optional[Metricas]: O registro compartilhado `REGISTRO`
+        """
+        if os.environ.get("FINTECH_API_METRICAS", "on") == "off":
+            return None
+        return REGISTRO
+
+    def medir(
+        self,
+        method: str,
+        path: str,
+        scenario_name: Optional[str],
+        enviar: Callable[[], requests.Response],
+    ) -> requests.Response:
+        """
+        Executa `enviar` e registra suas métricas.
+
+        Args:
+            method: Método HTTP
+            path: Path da requisição (os IDs são normalizados)
+            scenario_name: Cenário do Mock Server
+            enviar: Executa a requisição
+
+        Returns:
+            requests.Response: A resposta de `enviar`
+        """
+        _fases.dns = _fases.conexao = 0.0
+        inicio = time.perf_counter()
+        try:
+            response = enviar()
+        except Exception as erro:
+            self.registrar((normalizar_endpoint(path), method, scenario_name or "", type(erro).__name__),
+                           time.perf_counter() - inicio)
+            raise
+        request = response.request
+        corpo = request.body if request is not None else None
+        self.registrar(
+            (normalizar_endpoint(path), method, scenario_name or "", str(response.status_code)),
+            time.perf_counter() - inicio,
+            ttfb=response.elapsed.total_seconds(),
+            bytes_enviados=len(corpo) if corpo else 0,
+            bytes_recebidos=len(response.content),
+        )
+        return response
+
+    def registrar(
+        self,
+        rotulos: Rotulos,
+        duracao: float,
+        ttfb: float = 0.0,
+        bytes_enviados: int = 0,
+        bytes_recebidos: int = 0,
+    ) -> None:
+        """Soma uma requisição aos agregados; DNS/conexão vêm da thread corrente."""
+        dns, conexao = getattr(_fases, "dns", 0.0), getattr(_fases, "conexao", 0.0)
+        bucket = bisect.bisect_left(LIMITES_LATENCIA, duracao)
+        with self._lock:
+            agregado = self._agregados.get(rotulos)
+            if agregado is None:
+                agregado = self._agregados[rotulos] = _Agregado()
+            agregado.total += 1
+            agregado.conexoes += 1 if conexao else 0
+            agregado.dns += dns
+            agregado.conexao += conexao
+            agregado.ttfb += ttfb
+            agregado.duracao += duracao
+            agregado.bytes_enviados += bytes_enviados
+            agregado.bytes_recebidos += bytes_recebidos
+            agregado.buckets[bucket] += 1
+
+    def snapshot(self) -> Dict[Rotulos, _Agregado]:
+        """Cópia consistente dos agregados atuais."""
+        with self._lock:
+            copia = {}
+            for rotulos, agregado in self._agregados.items():
+                novo = copia[rotulos] = _Agregado()
+                for campo in _Agregado.__slots__:
+                    valor = getattr(agregado, campo)
+                    setattr(novo, campo, list(valor) if isinstance(valor, list) else valor)
+            return copia
+
+    def zerar(self) -> None:
+        with self._lock:
+            self._agregados.clear()
+
+    # --- Exportação ---
+    def para_prometheus(self) -> str:
+        """Agregados no formato texto de exposição do Prometheus."""
+        agregados = self.snapshot()
+        linhas: List[str] = []
+
+        def serie(nome: str, tipo: str, ajuda: str, valor: Callable[[_Agregado], float]) -> None:
+            linhas.append(f"# HELP {PREFIXO}_{nome} {ajuda}")
+            linhas.append(f"# TYPE {PREFIXO}_{nome} {tipo}")
+            for rotulos, agregado in agregados.items():
+                linhas.append(f"{PREFIXO}_{nome}{{{_rotulos_prometheus(rotulos)}}} {_numero(valor(agregado))}")
+
+        serie("requests_total", "counter", "Requisições enviadas", lambda a: a.total)
+        serie("new_connections_total", "counter", "Conexões abertas (fora do pool)", lambda a: a.conexoes)
+        serie("dns_seconds_total", "counter", "Tempo somado de resolução DNS", lambda a: a.dns)
+        serie("connect_seconds_total", "counter", "Tempo somado de conexão TCP/TLS", lambda a: a.conexao)
+        serie("ttfb_seconds_total", "counter", "Tempo somado até o primeiro byte", lambda a: a.ttfb)
+        serie("request_bytes_total", "counter", "Bytes de corpo enviados", lambda a: a.bytes_enviados)
+        serie("response_bytes_total", "counter", "Bytes de corpo recebidos", lambda a: a.bytes_recebidos)
+
+        nome = f"{PREFIXO}_request_duration_seconds"
+        linhas.append(f"# HELP {nome} Tempo total da requisição")
+        linhas.append(f"# TYPE {nome} histogram")
+        for rotulos, agregado in agregados.items():
+            base = _rotulos_prometheus(rotulos)
+            acumulado = 0
+            for limite, quantidade in zip(LIMITES_LATENCIA + (float("inf"),), agregado.buckets):
+                acumulado += quantidade
+                le = "+Inf" if limite == float("inf") else _numero(limite)
+                linhas.append(f'{nome}_bucket{{{base},le="{le}"}} {acumulado}')
+            linhas.append(f"{nome}_sum{{{base}}} {_numero(agregado.duracao)}")
+            linhas.append(f"{nome}_count{{{base}}} {agregado.total}")
+        return "\n".join(linhas) + "\n"
+
+    def para_influx(self, timestamp_ns: Optional[int] = None) -> str:
+        """Agregados em line protocol do InfluxDB, uma linha por combinação de rótulos."""
+        timestamp_ns = timestamp_ns if timestamp_ns is not None else time.time_ns()
+        linhas = []
+        for (endpoint, metodo, cenario, status), a in self.snapshot().items():
+            tags = ",".join(
+                f"{chave}={_escapar_influx(valor)}"
+                for chave, valor in (("endpoint", endpoint), ("method", metodo), ("scenario", cenario), ("status", status))
+                if valor
+            )
+            campos = (
+                f"count={a.total}i,new_connections={a.conexoes}i,dns_sum={_numero(a.dns)},"
+                f"connect_sum={_numero(a.conexao)},ttfb_sum={_numero(a.ttfb)},duration_sum={_numero(a.duracao)},"
+                f"duration_mean={_numero(a.duracao / a.total)},request_bytes={a.bytes_enviados}i,"
+                f"response_bytes={a.bytes_recebidos}i"
+            )
+            linhas.append(f"{PREFIXO},{tags} {campos} {timestamp_ns}")
+        return "\n".join(linhas) + ("\n" if linhas else "")
+
+
+REGISTRO = Metricas()
+
+
+def _numero(valor: float) -> str:
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+def _rotulos_prometheus(rotulos: Rotulos) -> str:
+    nomes = ("endpoint", "method", "scenario", "status")
+    escapados = (valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for valor in rotulos)
+    return ",".join(f'{nome}="{valor}"' for nome, valor in zip(nomes, escapados))
+
+
+def _escapar_influx(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+
+def exportar(metricas: Metricas, diretorio: str = "reports/metrics", nome: str = PREFIXO) -> List[str]:
+    """
+    Grava `<nome>.prom` e `<nome>.influx` em `diretorio`.
+
+    Args:
+        metricas: Registro a exportar
+        diretorio: Pasta de destino (criada se preciso)
+        nome: Nome base dos arquivos
+
+    Returns:
+        List[str]: Caminhos gravados
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for extensao, conteudo in (("prom", metricas.para_prometheus()), ("influx", metricas.para_influx())):
+        caminho = os.path.join(diretorio, f"{nome}.{extensao}")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+        caminhos.append(caminho)
+    return caminhos
+
+
+# =============================================================================
+# ENDPOINT DE SCRAPE
+# =============================================================================
+
+class ServidorMetricas:
+    """
+    Serve `GET /metrics` (texto Prometheus) em uma thread de fundo.
+
+    Args:
+        metricas: Registro exposto
+        host: Interface de escuta
+        porta: Porta (0 escolhe uma livre)
+    """
+
+    def __init__(self, metricas: Metricas, host: str = "127.0.0.1", porta: int = 0):
+        registro = metricas
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corpo = registro.para_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *args):
+                pass
+
+        self._servidor = ThreadingHTTPServer((host, porta), _Handler)
+        self._servidor.daemon_threads = True
+        self.host, self.porta = self._servidor.server_address[:2]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.porta}/metrics"
+
+    def start(self) -> "ServidorMetricas":
+        self._thread = threading.Thread(target=self._servidor.serve_forever, name="metricas", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def __enter__(self) -> "ServidorMetricas":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
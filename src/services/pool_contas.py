@@ -0,0 +1,211 @@
+"""
+Pool de contas pré-cadastradas, emprestadas aos testes.
+
+Em vez de um `/cadastro` por teste, a sessão cadastra N contas de uma vez
+(em paralelo) e cada teste pega uma emprestada e a devolve ao terminar.
+Os CPFs gerados são válidos e não se repetem dentro de uma execução,
+nem entre threads nem entre workers do pytest-xdist:
+
+    dígitos 1-2  worker do xdist (gw0 -> 00, gw1 -> 01, ...)
+    dígitos 3-6  bloco da execução: parte do resumo do identificador da
+                 execução e avança um a cada 1000 CPFs
+    dígitos 7-9  sequência dentro do bloco
+    dígitos 10-11 verificadores calculados
+
+Entre execuções a garantia é probabilística: com um bloco cada, duas
+execuções coincidem com chance de 1 em 10 mil. Como as contas vão para a
+limpeza da sessão assim que são cadastradas, isso só importa para execuções
+simultâneas contra o mesmo backend ou quando a limpeza falha.
+"""
+import hashlib
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from src.services.api_client import FintechAPI
+from src.services.limpeza import LimpezaSessao
+
+_POR_BLOCO = 1_000
+_BLOCOS = 10_000
+_LIMITE_SEQUENCIA = _POR_BLOCO * _BLOCOS
+
+
+def digitos_verificadores(base: str) -> str:
+    """
+    Calcula os dois dígitos verificadores de um CPF.
+
+    Args:
+        base: Os 9 primeiros dígitos
+
+    Returns:
+        str: Os 2 dígitos verificadores
+    """
+    digitos = [int(d) for d in base]
+    for peso_inicial in (10, 11):
+        soma = sum(d * peso for d, peso in zip(digitos, range(peso_inicial, 1, -1)))
+        resto = soma * 10 % 11
+        digitos.append(0 if resto == 10 else resto)
+    return f"{digitos[-2]}{digitos[-1]}"
+
+
+def formatar_cpf(digitos: str) -> str:
+    return f"{digitos[:3]}.{digitos[3:6]}.{digitos[6:9]}-{digitos[9:]}"
+
+
+class GeradorCpf:
+    """
+    Gera CPFs válidos e únicos por worker e por execução.
+
+    Args:
+        worker: Índice do worker (padrão: lido de PYTEST_XDIST_WORKER)
+        execucao: Identificador da execução (padrão: PYTEST_XDIST_TESTRUNUID ou aleatório)
+    """
+
+    def __init__(self, worker: Optional[int] = None, execucao: Optional[str] = None):
+        if worker is None:
+            worker = int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").lstrip("gw") or 0)
+        execucao = execucao or os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid4().hex
+        resumo = int.from_bytes(hashlib.blake2b(execucao.encode(), digest_size=4).digest(), "big")
+        self.worker = worker % 100
+        self.bloco_inicial = resumo % _BLOCOS
+        self._sequencia = itertools.count()
+        self._lock = threading.Lock()
+
+    def proximo(self) -> str:
+        """
+        Returns:
+            str: CPF formatado (000.000.000-00)
+
+        Raises:
+            RuntimeError: Se a sequência do processo se esgotar
+        """
+        with self._lock:
+            numero = next(self._sequencia)
+        if numero >= _LIMITE_SEQUENCIA:
+            raise RuntimeError(f"Sequência de CPFs esgotada ({_LIMITE_SEQUENCIA} por worker e execução).")
+        bloco, indice = divmod(numero, _POR_BLOCO)
+        base = f"{self.worker:02d}{(self.bloco_inicial + bloco) % _BLOCOS:04d}{indice:03d}"
+        return formatar_cpf(base + digitos_verificadores(base))
+
+
+class PoolContas:
+    """
+    Contas cadastradas antecipadamente e emprestadas aos testes.
+
+    Args:
+        api: Cliente usado nos cadastros
+        tamanho: Contas cadastradas em `provisionar`
+        concorrencia: Cadastros simultâneos no provisionamento
+        scenario_name: Cenário do Mock Server para o cadastro
+        gerador: Gerador de CPFs (padrão: um por pool)
+        limpeza: Limpeza em que cada conta é registrada assim que cadastrada,
+            inclusive as de um provisionamento que falhou no meio
+    """
+
+    def __init__(
+        self,
+        api: FintechAPI,
+        tamanho: int = 8,
+        concorrencia: int = 8,
+        scenario_name: Optional[str] = "Cadastro Sucesso 201",
+        gerador: Optional[GeradorCpf] = None,
+        limpeza: Optional[LimpezaSessao] = None,
+    ):
+        self.api = api
+        self.tamanho = tamanho
+        self.concorrencia = concorrencia
+        self.scenario_name = scenario_name
+        self.gerador = gerador or GeradorCpf()
+        self.limpeza = limpeza
+        self.contas: List[Dict[str, str]] = []
+        self._livres: "queue.SimpleQueue[Dict[str, str]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(
+        cls, api: FintechAPI, gerador: Optional[GeradorCpf] = None, limpeza: Optional[LimpezaSessao] = None
+    ) -> "PoolContas":
+        """Pool dimensionado por FINTECH_POOL_CONTAS e FINTECH_POOL_CONTAS_CONCORRENCIA."""
+        return cls(
+            api,
+            tamanho=int(os.environ.get("FINTECH_POOL_CONTAS", 8)),
+            concorrencia=int(os.environ.get("FINTECH_POOL_CONTAS_CONCORRENCIA", 8)),
+            gerador=gerador,
+            limpeza=limpeza,
+        )
+
+    def cadastrar(self) -> Dict[str, str]:
+        """
+        Cadastra uma conta nova e a registra no pool (sem emprestá-la).
+
+        Returns:
+            Dict[str, str]: conta_id, cpf, nome e senha da conta
+
+        Raises:
+            RuntimeError: Se o cadastro não for aceito pela API
+        """
+        cpf = self.gerador.proximo()
+        dados = {"nome": f"Tester {cpf[:11]}", "cpf": cpf, "senha": "secure_pass"}
+        resultado = self.api.cadastrar_usuario(**dados, scenario_name=self.scenario_name, tipado=True)
+        if not resultado.ok or not resultado.conta_id:
+            raise RuntimeError(f"Falha ao cadastrar conta do pool ({resultado.status_code}): {resultado.dados}")
+        conta = {"conta_id": resultado.conta_id, **dados}
+        if self.limpeza is not None:
+            self.limpeza.registrar(conta["conta_id"])
+        with self._lock:
+            self.contas.append(conta)
+        return conta
+
+    def provisionar(self) -> "PoolContas":
+        """
+        Cadastra `tamanho` contas em paralelo e as deixa livres para empréstimo.
+
+        Raises:
+            RuntimeError: Se algum cadastro falhar; os demais terminam antes, e
+                as contas criadas ficam livres no pool (e na limpeza, se houver)
+        """
+        faltam = self.tamanho - len(self.contas)
+        if faltam <= 0:
+            return self
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concorrencia, faltam))) as executor:
+            # submit em vez de map: a primeira falha não cancela os cadastros restantes
+            futuros = [executor.submit(self.cadastrar) for _ in range(faltam)]
+        erros = []
+        for futuro in futuros:
+            if futuro.exception() is None:
+                self._livres.put(futuro.result())
+            else:
+                erros.append(futuro.exception())
+        if erros:
+            raise erros[0]
+        return self
+
+    def emprestar(self) -> Dict[str, str]:
+        """
+        Retira uma conta livre do pool; se não houver, cadastra uma nova.
+
+        Returns:
+            Dict[str, str]: Dados da conta emprestada
+        """
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            return self.cadastrar()
+
+    def devolver(self, conta: Dict[str, str]) -> None:
+        """Devolve uma conta emprestada ao pool."""
+        self._livres.put(conta)
+
+    @contextmanager
+    def emprestimo(self) -> Iterator[Dict[str, str]]:
+        """Empresta uma conta pelo tempo do bloco `with` e a devolve ao sair."""
+        conta = self.emprestar()
+        try:
+            yield conta
+        finally:
+            self.devolver(conta)
@@ -0,0 +1,197 @@
+"""
+Prazo, retentativas e hedging das requisições do FintechAPI.
+
+Uma chamada lógica do cliente (ex.: uma transferência) pode virar várias
+tentativas HTTP:
+
+- prazo: orçamento total (s) da chamada; cada tentativa usa como timeout o
+  menor entre o do transporte e o tempo que resta, e estourado o prazo a
+  chamada falha com `PrazoExcedido`
+- retentativas: erros de rede, timeouts e status transitórios (502/503/504)
+  são repetidos com backoff exponencial e jitter completo, sorteado em
+  [0, min(espera_max, espera_base * 2^n)], que evita retentativas em
+  sincronia entre clientes; só são repetidas requisições idempotentes
+  (GET/DELETE, ou POST com Idempotency-Key)
+- hedging: se a resposta não chega em `hedge_apos` segundos, uma segunda
+  requisição idêntica é disparada e vale a primeira que responder, cortando
+  a cauda de latência ao custo de algumas requisições extras
+
+Configuração por ambiente:
+    FINTECH_API_PRAZO         prazo total por chamada, em segundos
+    FINTECH_API_TENTATIVAS    tentativas no máximo (padrão 1: sem retry)
+    FINTECH_API_HEDGE_MS      atraso do hedge em ms (padrão: desligado)
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional
+
+import requests
+
+# Status que indicam falha transitória do servidor
+STATUS_RETENTAVEIS: FrozenSet[int] = frozenset({502, 503, 504})
+
+Tentativa = Callable[[Optional[float]], requests.Response]
+
+
+class PrazoExcedido(requests.Timeout):
+    """O prazo total da chamada terminou antes de uma resposta definitiva."""
+
+
+@dataclass(frozen=True)
+class PoliticaResiliencia:
+    """
+    Parâmetros de prazo, retentativa e hedging.
+
+    Attributes:
+        prazo: Tempo total (s) por chamada lógica, incluindo retentativas (None: sem prazo)
+        tentativas: Tentativas no máximo (1 = sem retry)
+        espera_base: Backoff da primeira retentativa, em segundos
+        espera_max: Teto do backoff, em segundos
+        hedge_apos: Atraso (s) até disparar a requisição de hedge (None: desligado)
+        status_retentaveis: Status HTTP que justificam nova tentativa
+    """
+    prazo: Optional[float] = None
+    tentativas: int = 1
+    espera_base: float = 0.05
+    espera_max: float = 1.0
+    hedge_apos: Optional[float] = None
+    status_retentaveis: FrozenSet[int] = STATUS_RETENTAVEIS
+
+    @classmethod
+    def from_env(cls) -> "PoliticaResiliencia":
+        """Monta a política a partir de FINTECH_API_PRAZO, _TENTATIVAS e _HEDGE_MS."""
+        prazo = os.environ.get("FINTECH_API_PRAZO")
+        hedge_ms = os.environ.get("FINTECH_API_HEDGE_MS")
+        return cls(
+            prazo=float(prazo) if prazo else None,
+            tentativas=int(os.environ.get("FINTECH_API_TENTATIVAS") or 1),
+            hedge_apos=float(hedge_ms) / 1000 if hedge_ms else None,
+        )
+
+    @property
+    def ativa(self) -> bool:
+        return self.prazo is not None or self.tentativas > 1 or self.hedge_apos is not None
+
+
+class Resiliencia:
+    """
+    Executa tentativas conforme a política, com contadores para medição.
+
+    A tentativa recebe o tempo restante do prazo (ou None) e devolve a
+    resposta HTTP. O hedge usa um pool de threads próprio; a requisição
+    perdedora termina em segundo plano e sua resposta é descartada.
+
+    Args:
+        politica: Prazo, retentativas e hedging
+        rng: Gerador do jitter (útil para testes reproduzíveis)
+        max_hedges: Requisições simultâneas no pool do hedge
+    """
+
+    def __init__(self, politica: PoliticaResiliencia, rng: Optional[random.Random] = None, max_hedges: int = 16):
+        self.politica = politica
+        self._rng = rng or random.Random()
+        self._max_hedges = max_hedges
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.retentativas = 0
+        self.hedges = 0
+        self.hedges_vencedores = 0
+
+    def _contar(self, contador: str) -> None:
+        with self._lock:
+            setattr(self, contador, getattr(self, contador) + 1)
+
+    def executar(self, tentativa: Tentativa, idempotente: bool, hedge: bool = False) -> requests.Response:
+        """
+        Executa a chamada lógica.
+
+        Args:
+            tentativa: Envia uma requisição com o tempo restante do prazo
+            idempotente: Se a requisição pode ser repetida com segurança
+            hedge: Usa hedging (apenas leituras idempotentes)
+
+        Returns:
+            requests.Response: A primeira resposta definitiva, ou a última
+            resposta transitória se as tentativas ou o prazo acabarem
+
+        Raises:
+            PrazoExcedido: Se o prazo terminar sem nenhuma resposta
+            requests.RequestException: Erro de rede da última tentativa, também
+                quando a próxima espera não cabe no prazo restante
+        """
+        politica = self.politica
+        if not politica.ativa:
+            return tentativa(None)
+
+        limite = time.monotonic() + politica.prazo if politica.prazo is not None else None
+        tentativas = politica.tentativas if idempotente else 1
+        usar_hedge = hedge and idempotente and politica.hedge_apos is not None
+        ultima: Optional[requests.Response] = None
+        erro_rede: Optional[requests.RequestException] = None
+
+        for numero in range(tentativas):
+            restante = None if limite is None else limite - time.monotonic()
+            if restante is not None and restante <= 0:
+                break
+            try:
+                ultima = self._com_hedge(tentativa, restante) if usar_hedge else tentativa(restante)
+            except (requests.ConnectionError, requests.Timeout) as erro:
+                if limite is not None and time.monotonic() >= limite:
+                    raise PrazoExcedido(f"Prazo de {politica.prazo}s excedido: {erro}") from erro
+                if numero == tentativas - 1:
+                    raise
+                ultima, erro_rede = None, erro
+            else:
+                if ultima.status_code not in politica.status_retentaveis or numero == tentativas - 1:
+                    return ultima
+
+            espera = self._rng.uniform(0, min(politica.espera_max, politica.espera_base * 2 ** numero))
+            if limite is not None and time.monotonic() + espera >= limite:
+                break
+            time.sleep(espera)
+            self._contar("retentativas")
+
+        if ultima is not None:
+            return ultima
+        if erro_rede is not None and (limite is None or time.monotonic() < limite):
+            # O backoff não caberia no prazo, mas ele não acabou: o erro real é o de rede
+            raise erro_rede
+        raise PrazoExcedido(f"Prazo de {politica.prazo}s excedido") from erro_rede
+
+    def _com_hedge(self, tentativa: Tentativa, restante: Optional[float]) -> requests.Response:
+        atraso = self.politica.hedge_apos
+        if restante is not None and restante <= atraso:
+            return tentativa(restante)
+
+        executor = self._pool()
+        primeira = executor.submit(tentativa, restante)
+        feitas, _ = wait([primeira], timeout=atraso)
+        if feitas:
+            return primeira.result()
+
+        self._contar("hedges")
+        segunda = executor.submit(tentativa, None if restante is None else restante - atraso)
+        feitas, pendentes = wait([primeira, segunda], return_when=FIRST_COMPLETED)
+        vencedora: Future = feitas.pop()
+        if vencedora.exception() is not None and pendentes:
+            # A primeira a terminar falhou: vale o resultado da outra
+            vencedora = pendentes.pop()
+        if vencedora is segunda and vencedora.exception() is None:
+            self._contar("hedges_vencedores")
+        return vencedora.result()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_hedges, thread_name_prefix="hedge")
+            return self._executor
+
+    def close(self) -> None:
+        """Libera o pool do hedge sem esperar requisições perdedoras em andamento."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,105 @@
+"""
+Resultados tipados das respostas da API Fintech.
+
+Cada resultado decodifica o corpo JSON uma única vez e expõe os campos da
+resposta como atributos. São classes com `__slots__` para caberem em
+execuções de carga com milhões de chamadas; a resposta original continua
+disponível em `response` e o JSON decodificado em `dados`.
+"""
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+
+class Resultado:
+    """
+    Base dos resultados: resposta original, status HTTP e JSON decodificado.
+
+    Args:
+        response: Resposta do requests ou do httpx
+        dados: JSON já decodificado (None decodifica `response.content`)
+    """
+    __slots__ = ("response", "status_code", "dados")
+
+    def __init__(self, response, dados: Optional[Dict[str, Any]] = None):
+        self.response = response
+        self.status_code: int = response.status_code
+        self.dados: Dict[str, Any] = _decodificar(response) if dados is None else dados
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def __repr__(self) -> str:
+        campos = ", ".join(f"{nome}={getattr(self, nome)!r}" for nome in type(self).__slots__)
+        return f"{type(self).__name__}(status_code={self.status_code}, {campos})"
+
+
+class CadastroResult(Resultado):
+    """Conta criada por `cadastrar_usuario`."""
+    __slots__ = ("status", "conta_id", "mensagem")
+
+    def __init__(self, response, dados: Optional[Dict[str, Any]] = None):
+        super().__init__(response, dados)
+        self.status: Optional[str] = self.dados.get("status")
+        self.conta_id: Optional[str] = self.dados.get("conta_id")
+        self.mensagem: Optional[str] = self.dados.get("mensagem")
+
+
+class SaldoResult(Resultado):
+    """Saldo retornado por `consultar_saldo`."""
+    __slots__ = ("conta_id", "saldo", "status")
+
+    def __init__(self, response, dados: Optional[Dict[str, Any]] = None):
+        super().__init__(response, dados)
+        self.conta_id: Optional[str] = self.dados.get("conta_id")
+        saldo = self.dados.get("saldo")
+        self.saldo: Optional[float] = float(saldo) if saldo is not None else None
+        self.status: Optional[str] = self.dados.get("status")
+
+
+class TransferenciaResult(Resultado):
+    """Transferência concluída por `realizar_transferencia`."""
+    __slots__ = ("status", "transacao_id", "mensagem")
+
+    def __init__(self, response, dados: Optional[Dict[str, Any]] = None):
+        super().__init__(response, dados)
+        self.status: Optional[str] = self.dados.get("status")
+        self.transacao_id: Optional[str] = self.dados.get("transacao_id")
+        self.mensagem: Optional[str] = self.dados.get("mensagem")
+
+
+class ErroNegocio(Resultado):
+    """Resposta de erro (4xx/5xx): regra de negócio violada ou recurso inexistente."""
+    __slots__ = ("status", "codigo_erro", "mensagem")
+
+    def __init__(self, response, dados: Optional[Dict[str, Any]] = None):
+        super().__init__(response, dados)
+        self.status: Optional[str] = self.dados.get("status")
+        self.codigo_erro: Optional[str] = self.dados.get("codigo_erro")
+        self.mensagem: Optional[str] = self.dados.get("mensagem")
+
+
+def _decodificar(response) -> Dict[str, Any]:
+    # json.loads sobre bytes detecta UTF-8/16/32 sozinho, sem a detecção de
+    # encoding que `response.json()` faz quando o header não traz charset
+    try:
+        dados = json.loads(response.content)
+    except ValueError:
+        return {}
+    return dados if isinstance(dados, dict) else {"valor": dados}
+
+
+def parse_resultado(response, tipo: Type[Resultado]) -> Union[Resultado, ErroNegocio]:
+    """
+    Converte a resposta em `tipo` (sucesso) ou `ErroNegocio` (status >= 400).
+
+    Args:
+        response: Resposta do requests ou do httpx
+        tipo: Classe de resultado esperada em caso de sucesso
+
+    Returns:
+        Resultado: Instância de `tipo` ou `ErroNegocio`
+    """
+    if response.status_code >= 400:
+        return ErroNegocio(response)
+    return tipo(response)
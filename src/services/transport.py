@@ -0,0 +1,118 @@
+"""
+Transporte HTTP com pool de conexões keep-alive para o cliente FintechAPI.
+"""
+import os
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from src.services.metricas import AdapterInstrumentado
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Parâmetros do transporte HTTP.
+
+    Attributes:
+        pool_size: Conexões mantidas abertas por host
+        connect_timeout: Tempo máximo (s) para abrir a conexão TCP/TLS
+        read_timeout: Tempo máximo (s) aguardando bytes da resposta
+        pool_block: Se True, bloqueia quando o pool esgota em vez de abrir conexões extras
+    """
+    pool_size: int = 20
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    pool_block: bool = False
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        """
+        Monta a configuração a partir das variáveis de ambiente FINTECH_API_*.
+
+        Returns:
+            TransportConfig: Configuração com os valores do ambiente ou os padrões
+        """
+        padrao = cls()
+        return cls(
+            pool_size=int(os.environ.get("FINTECH_API_POOL_SIZE", padrao.pool_size)),
+            connect_timeout=float(os.environ.get("FINTECH_API_CONNECT_TIMEOUT", padrao.connect_timeout)),
+            read_timeout=float(os.environ.get("FINTECH_API_READ_TIMEOUT", padrao.read_timeout)),
+            pool_block=os.environ.get("FINTECH_API_POOL_BLOCK", "0") == "1",
+        )
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Tupla (connect, read) no formato aceito pelo requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def timeout_limitado(self, restante: Optional[float]) -> Tuple[float, float]:
+        """Timeout (connect, read) que não ultrapassa os `restante` segundos de um prazo."""
+        if restante is None:
+            return self.timeout
+        return (min(self.connect_timeout, restante), min(self.read_timeout, restante))
+
+
+class HTTPTransport:
+    """
+    Sessão HTTP compartilhada com pool de conexões por host.
+
+    A mesma instância pode ser usada por várias threads: o pool do urllib3 é
+    thread-safe e a sessão não guarda cookies, então nenhuma requisição herda
+    estado de outra.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig.from_env()
+        self._session = self._criar_sessao()
+
+    def _criar_sessao(self) -> requests.Session:
+        session = requests.Session()
+        # Conexões novas anotam DNS/conexão para as métricas por requisição
+        adapter = AdapterInstrumentado(
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size,
+            pool_block=self.config.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # O Mock Server não usa cookies; bloqueá-los evita estado compartilhado entre threads
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+    ) -> requests.Response:
+        """
+        Envia a requisição reaproveitando uma conexão do pool.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+            json: Corpo serializado como JSON (opcional)
+            headers: Cabeçalhos adicionais
+            timeout: (connect, read) desta requisição (padrão: o da configuração)
+
+        Returns:
+            requests.Response: Resposta do servidor
+        """
+        return self._session.request(
+            method, url, json=json, headers=headers, timeout=timeout or self.config.timeout
+        )
+
+    def close(self) -> None:
+        """Fecha todas as conexões abertas do pool."""
+        self._session.close()
+
+    def __enter__(self) -> "HTTPTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,224 @@
+"""
+Catálogo declarativo de cenários da API e validadores compilados.
+
+Cada entrada do catálogo (`catalogo_cenarios.json`) descreve uma chamada do
+cliente, o cenário do Mock Server, o status esperado, o schema da resposta e
+invariantes:
+
+    "schema":      {"campo": "tipo", "opcional?": "tipo"}
+                   tipos: str, number, int, bool, object, list, null
+    "invariantes": [{"campo": "saldo", "op": ">=", "valor": 0},
+                    {"campo": "conta_id", "op": "==", "argumento": "conta_id"}]
+                   ops: ==, !=, >, >=, <, <=, contem, regex, nao_vazio
+    "feature", "story": rótulos do caso no Allure (padrão: "Catálogo de
+                   Cenários" e o nome do cenário)
+    "conta_do_pool": argumento preenchido com a conta emprestada do pool
+                   de contas da sessão, em vez do valor fixo
+
+O schema e as invariantes são traduzidos, uma única vez, para o código-fonte
+de uma função Python com as verificações em linha reta, compilada com
+`compile`. Validar uma resposta é uma chamada dessa função, sem interpretar
+o catálogo de novo; por isso cabe também em execuções de carga.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+CAMINHO_CATALOGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalogo_cenarios.json")
+
+Validador = Callable[[int, Any, Dict[str, Any]], List[str]]
+
+_TIPOS = {
+    "str": "isinstance(v, str)",
+    "number": "(type(v) is int or type(v) is float)",
+    "int": "type(v) is int",
+    "bool": "type(v) is bool",
+    "object": "isinstance(v, dict)",
+    "list": "isinstance(v, list)",
+    "null": "v is None",
+}
+
+_OPERADORES = {
+    "==": "v == {alvo}",
+    "!=": "v != {alvo}",
+    ">": "v > {alvo}",
+    ">=": "v >= {alvo}",
+    "<": "v < {alvo}",
+    "<=": "v <= {alvo}",
+    "contem": "{alvo} in v",
+    "regex": "{alvo}.search(v) is not None",
+    "nao_vazio": "bool(v)",
+}
+
+# Método HTTP e path de cada método do cliente, com os argumentos em {chaves}
+ROTAS_DOS_METODOS: Dict[str, Tuple[str, str]] = {
+    "cadastrar_usuario": ("POST", "/cadastro"),
+    "consultar_saldo": ("GET", "/saldo/{conta_id}"),
+    "realizar_transferencia": ("POST", "/transferencia"),
+    "deletar_usuario": ("DELETE", "/usuario/{conta_id}"),
+}
+
+_AUSENTE = object()
+
+
+class CenarioCatalogado(NamedTuple):
+    """Entrada do catálogo já com o validador compilado."""
+    id: str
+    metodo: str
+    argumentos: Dict[str, Any]
+    cenario: str
+    status: int
+    validar: Validador
+    feature: str = "Catálogo de Cenários"
+    story: Optional[str] = None
+    conta_do_pool: Optional[str] = None
+
+    def requisicao(self, argumentos: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """Método HTTP e endpoint chamados pela entrada, sem depender da resposta."""
+        metodo_http, rota = ROTAS_DOS_METODOS[self.metodo]
+        return metodo_http, rota.format(**(self.argumentos if argumentos is None else argumentos))
+
+
+class CatalogoInvalido(ValueError):
+    """Entrada do catálogo com tipo, operador ou campo desconhecido."""
+
+
+def compilar(status: int, schema: Dict[str, str], invariantes: List[Dict[str, Any]], nome: str = "validar") -> Validador:
+    """
+    Gera e compila a função de validação de um cenário.
+
+    Args:
+        status: Status HTTP esperado
+        schema: Campos obrigatórios (ou opcionais, com sufixo "?") e seus tipos
+        invariantes: Regras sobre os valores dos campos
+        nome: Identificação usada nas mensagens de erro de compilação
+
+    Returns:
+        Validador: `validar(status, dados, argumentos) -> lista de erros` (vazia se ok)
+
+    Raises:
+        CatalogoInvalido: Para tipo ou operador desconhecido
+    """
+    constantes: Dict[str, Any] = {"_AUSENTE": _AUSENTE}
+
+    def constante(valor: Any) -> str:
+        chave = f"_c{len(constantes)}"
+        constantes[chave] = valor
+        return chave
+
+    linhas = [
+        "def validar(status, dados, args):",
+        "    erros = []",
+        f"    if status != {int(status)}:",
+        f"        erros.append(f'status HTTP {{status}} != {int(status)}')",
+        "    if not isinstance(dados, dict):",
+        "        erros.append('corpo da resposta não é um objeto JSON')",
+        "        return erros",
+    ]
+
+    for chave, tipo in schema.items():
+        campo, opcional = (chave[:-1], True) if chave.endswith("?") else (chave, False)
+        if tipo not in _TIPOS:
+            raise CatalogoInvalido(f"{nome}: tipo desconhecido '{tipo}' no campo '{campo}'")
+        linhas.append(f"    v = dados.get({campo!r}, _AUSENTE)")
+        if opcional:
+            linhas.append(f"    if v is not _AUSENTE and not {_TIPOS[tipo]}:")
+        else:
+            linhas.append("    if v is _AUSENTE:")
+            linhas.append(f"        erros.append({f'campo obrigatório {campo!r} ausente'!r})")
+            linhas.append(f"    elif not {_TIPOS[tipo]}:")
+        linhas.append(f"        erros.append({f'campo {campo!r} deveria ser {tipo}, veio '!r} + type(v).__name__)")
+
+    for regra in invariantes:
+        campo, operador = regra.get("campo"), regra.get("op")
+        if not campo or operador not in _OPERADORES:
+            raise CatalogoInvalido(f"{nome}: invariante inválida {regra}")
+        condicao_extra = ""
+        if "argumento" in regra:
+            argumento = regra["argumento"]
+            alvo, descricao = f"args[{argumento!r}]", f"argumento {argumento}"
+            condicao_extra = f" and {argumento!r} in args"
+        elif operador == "regex":
+            alvo, descricao = constante(re.compile(regra["valor"])), repr(regra["valor"])
+        elif operador == "nao_vazio":
+            alvo, descricao = "", ""
+        else:
+            alvo, descricao = constante(regra["valor"]), repr(regra["valor"])
+        expressao = _OPERADORES[operador].format(alvo=alvo)
+        mensagem = f"invariante {campo} {operador} {descricao}".rstrip()
+        linhas += [
+            f"    v = dados.get({campo!r}, _AUSENTE)",
+            f"    if v is not _AUSENTE{condicao_extra}:",
+            "        try:",
+            f"            ok = {expressao}",
+            "        except (TypeError, ValueError):",
+            "            ok = False",
+            "        if not ok:",
+            f"            erros.append({mensagem + ' falhou (valor: '!r} + repr(v) + ')')",
+        ]
+    linhas.append("    return erros")
+
+    fonte = "\n".join(linhas)
+    codigo = compile(fonte, f"<validador {nome}>", "exec")
+    exec(codigo, constantes)
+    validar = constantes["validar"]
+    validar.fonte = fonte
+    return validar
+
+
+def carregar_catalogo(caminho: Optional[str] = None) -> List[CenarioCatalogado]:
+    """
+    Lê o catálogo e compila o validador de cada entrada.
+
+    Args:
+        caminho: Arquivo JSON do catálogo (padrão: o catálogo do projeto)
+
+    Returns:
+        List[CenarioCatalogado]: Entradas na ordem do arquivo
+
+    Raises:
+        CatalogoInvalido: Para entrada malformada ou id repetido
+    """
+    return list(_carregar(os.path.abspath(caminho or CAMINHO_CATALOGO)))
+
+
+@lru_cache(maxsize=None)
+def _carregar(caminho: str) -> tuple:
+    with open(caminho, encoding="utf-8") as arquivo:
+        entradas = json.load(arquivo)
+    catalogo, ids = [], set()
+    for entrada in entradas:
+        try:
+            identificador = entrada["id"]
+            cenario = CenarioCatalogado(
+                identificador,
+                entrada["metodo"],
+                entrada.get("argumentos", {}),
+                entrada["cenario"],
+                int(entrada["status"]),
+                compilar(entrada["status"], entrada.get("schema", {}), entrada.get("invariantes", []), identificador),
+                entrada.get("feature", "Catálogo de Cenários"),
+                entrada.get("story", entrada["cenario"]),
+                entrada.get("conta_do_pool"),
+            )
+        except KeyError as erro:
+            raise CatalogoInvalido(f"Entrada do catálogo sem o campo {erro}: {entrada}") from None
+        if cenario.metodo not in ROTAS_DOS_METODOS:
+            raise CatalogoInvalido(f"Método do cliente desconhecido em {identificador}: {cenario.metodo}")
+        if cenario.conta_do_pool is not None and cenario.conta_do_pool not in cenario.argumentos:
+            raise CatalogoInvalido(f"conta_do_pool de {identificador} não é um dos argumentos: {cenario.conta_do_pool}")
+        if identificador in ids:
+            raise CatalogoInvalido(f"id repetido no catálogo: {identificador}")
+        ids.add(identificador)
+        catalogo.append(cenario)
+    return tuple(catalogo)
+
+
+def validador_do_cenario(nome_cenario: str, caminho: Optional[str] = None) -> Optional[Validador]:
+    """Validador da primeira entrada do catálogo com esse cenário do Mock Server."""
+    for cenario in carregar_catalogo(caminho):
+        if cenario.cenario == nome_cenario:
+            return cenario.validar
+    return None
@@ -0,0 +1,70 @@
+"""
+Testes de API gerados a partir do catálogo declarativo de cenários.
+
+Cada entrada de `src/services/catalogo_cenarios.json` vira um teste próprio,
+`test_<id>`: a chamada do cliente é feita com o cenário do Mock Server e a
+resposta é conferida pelo validador compilado da entrada (status, schema e
+invariantes). Um teste por entrada, em vez de um parametrizado, dá a cada
+caso seu `fullName` no Allure, que é a chave do histórico e das durações
+usadas no particionamento. Feature e story também vêm da entrada.
+
+Entradas com `conta_do_pool` usam a conta emprestada do pool
+(`usuario_teste`) nesse argumento. Em `test_transferencia_api.py` fica o
+fluxo que o catálogo não expressa: o orçamento de latência.
+"""
+import pytest
+import allure
+from src.reporting.anexos import anexar
+from src.services.validacao import CenarioCatalogado, carregar_catalogo
+
+CATALOGO = carregar_catalogo()
+
+
+def _verificar(cenario: CenarioCatalogado, request: pytest.FixtureRequest, fintech_api, anexar_payload_api):
+    """
+    Executa a chamada de uma entrada do catálogo e valida a resposta.
+    """
+    allure.dynamic.feature(cenario.feature)
+    allure.dynamic.story(cenario.story)
+
+    with allure.step("Arrange - Preparar argumentos do cenário"):
+        argumentos = dict(cenario.argumentos)
+        if cenario.conta_do_pool:
+            argumentos[cenario.conta_do_pool] = request.getfixturevalue("usuario_teste")["conta_id"]
+
+    with allure.step(f"Act - {cenario.metodo}"):
+        response = getattr(fintech_api, cenario.metodo)(**argumentos, scenario_name=cenario.cenario)
+        try:
+            dados = response.json()
+        except ValueError:
+            dados = None
+
+        # Método e endpoint vêm da entrada do catálogo, não da resposta
+        metodo_http, endpoint = cenario.requisicao(argumentos)
+        anexar_payload_api(
+            request_payload=argumentos,
+            response_data=dados,
+            endpoint=endpoint,
+            method=metodo_http
+        )
+
+    with allure.step("Assert - Validar resposta pelo catálogo"):
+        erros = cenario.validar(response.status_code, dados, argumentos)
+        if erros:
+            anexar("\n".join(erros), name="Violações do Catálogo", attachment_type=allure.attachment_type.TEXT)
+        assert not erros, f"{cenario.id}: " + "; ".join(erros)
+
+
+def _gerar_teste(cenario: CenarioCatalogado):
+    def teste(request, fintech_api, anexar_payload_api):
+        _verificar(cenario, request, fintech_api, anexar_payload_api)
+
+    teste.__name__ = "test_" + cenario.id.replace("-", "_")
+    teste.__doc__ = f"Cenário do catálogo '{cenario.id}': {cenario.cenario}."
+    return teste
+
+
+for _cenario in CATALOGO:
+    _teste = _gerar_teste(_cenario)
+    globals()[_teste.__name__] = _teste
+del _cenario, _teste
@@ -1,11 +1,64 @@
 """
 Configurações e fixtures compartilhadas para testes de API.
 """
+import asyncio
+import os
 import pytest
-import time
 import allure
 from typing import Dict, Any, Generator
 from src.services.api_client import FintechAPI
+from src.services.async_api_client import AsyncFintechAPI
+from src.services.limpeza import LimpezaSessao
+from src.services.metricas import REGISTRO, ServidorMetricas, exportar
+from src.services.pool_contas import GeradorCpf, PoolContas
+from src.mock.server import MockServer
+from src.plugins import orcamento_latencia, particionamento
+from src.reporting.anexos import anexador, anexar
+
+
+# =============================================================================
+# HOOKS DA SESSÃO
+# =============================================================================
+
+def pytest_addoption(parser) -> None:
+    """Opções do particionamento por duração (--shards / --shard-indice)."""
+    particionamento.adicionar_opcoes(parser)
+
+
+def pytest_configure(config) -> None:
+    """Registra os plugins do marcador `latency_budget` e do particionamento."""
+    if not config.pluginmanager.has_plugin("orcamento_latencia"):
+        config.pluginmanager.register(orcamento_latencia, "orcamento_latencia")
+    if not config.pluginmanager.has_plugin("particionamento"):
+        config.pluginmanager.register(particionamento.Particionamento(config), "particionamento")
+
+
+def pytest_sessionstart(session) -> None:
+    """
+    Com FINTECH_API_METRICAS_PORTA definida, expõe /metrics durante a sessão.
+    """
+    porta = os.environ.get("FINTECH_API_METRICAS_PORTA")
+    if porta:
+        session.config._servidor_metricas = ServidorMetricas(REGISTRO, porta=int(porta)).start()
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    """
+    Garante que os anexos enfileirados sejam gravados antes de o allure-pytest
+    encerrar seu logger de arquivos e exporta as métricas das requisições.
+    """
+    anexador.flush()
+    
+    if REGISTRO.snapshot():
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        exportar(
+            REGISTRO,
+            os.environ.get("FINTECH_API_METRICAS_DIR", "reports/metrics"),
+            f"fintech_api_{worker}" if worker else "fintech_api",
+        )
+    servidor = getattr(session.config, "_servidor_metricas", None)
+    if servidor is not None:
+        servidor.stop()
 
 
 # =============================================================================
@@ -13,84 +66,183 @@ from src.services.api_client import FintechAPI
 # =============================================================================
 
 @pytest.fixture(scope="session")
-def fintech_api() -> FintechAPI:
+def mock_server_url() -> Generator[str, None, None]:
+    """
+    Garante um Mock Server para a sessão e aponta MOCK_API_URL para ele.
+    
+    Se MOCK_API_URL já estiver definida (ex.: Postman Mock Server), ela é
+    respeitada; caso contrário sobe o Mock Server local em uma porta livre.
+    
+    Yields:
+        str: URL base do Mock Server em uso
+    """
+    url_configurada = os.environ.get("MOCK_API_URL")
+    if url_configurada:
+        yield url_configurada
+        return
+    
+    with MockServer() as servidor:
+        os.environ["MOCK_API_URL"] = servidor.url
+        yield servidor.url
+        del os.environ["MOCK_API_URL"]
+
+
+@pytest.fixture(scope="session")
+def fintech_api(mock_server_url: str) -> Generator[FintechAPI, None, None]:
     """
     Fornece uma única instância do cliente FintechAPI para todos os testes da sessão.
     
-    Returns:
+    O cliente mantém um pool de conexões keep-alive que é reaproveitado por todos
+    os testes e fechado ao final da sessão.
+    
+    Args:
+        mock_server_url: URL do Mock Server da sessão
+        
+    Yields:
         FintechAPI: Instância do cliente de API
     """
-    return FintechAPI()
+    api = FintechAPI(base_url=mock_server_url)
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="session")
+def async_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """
+    Event loop dedicado da sessão, usado para dirigir o AsyncFintechAPI.
+    
+    Yields:
+        asyncio.AbstractEventLoop: Loop para `run_until_complete` nos testes
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_fintech_api(
+    async_loop: asyncio.AbstractEventLoop, mock_server_url: str
+) -> Generator[AsyncFintechAPI, None, None]:
+    """
+    Fornece o cliente assíncrono, preso ao `async_loop` da sessão.
+    
+    Args:
+        async_loop: Event loop da sessão
+        mock_server_url: URL do Mock Server da sessão
+        
+    Yields:
+        AsyncFintechAPI: Instância do cliente assíncrono
+    """
+    api = AsyncFintechAPI(base_url=mock_server_url)
+    yield api
+    async_loop.run_until_complete(api.aclose())
 
 
 # =============================================================================
 # FIXTURES DE DADOS DE TESTE
 # =============================================================================
 
-@pytest.fixture
-def dados_usuario_unicos() -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def gerador_cpf() -> GeradorCpf:
     """
-    Gera dados únicos para um usuário de teste baseado em timestamp.
+    Gerador de CPFs válidos e únicos por execução e por worker do pytest-xdist.
     
     Returns:
-        Dict[str, str]: Dados do usuário com nome, CPF e senha únicos
+        GeradorCpf: Gerador compartilhado pela sessão
     """
-    timestamp = str(int(time.time()))
-    return {
-        "nome": f"Tester {timestamp[-4:]}",
-        "cpf": f"111.111.111-{timestamp[-2:]}",
-        "senha": "secure_pass"
-    }
+    return GeradorCpf()
 
 
-@pytest.fixture
-def usuario_cadastrado(fintech_api: FintechAPI, dados_usuario_unicos: Dict[str, str]) -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def pool_contas(
+    fintech_api: FintechAPI, gerador_cpf: GeradorCpf, limpeza_sessao: LimpezaSessao
+) -> Generator[PoolContas, None, None]:
     """
-    Cadastra um usuário e retorna os dados completos.
+    Contas cadastradas uma única vez por sessão (e por worker do xdist).
+    
+    O tamanho e a concorrência do provisionamento vêm de FINTECH_POOL_CONTAS
+    e FINTECH_POOL_CONTAS_CONCORRENCIA; se o pool esvaziar, novas contas são
+    cadastradas sob demanda. Cada conta vai para a limpeza da sessão assim
+    que é cadastrada, mesmo se o provisionamento falhar no meio.
     
     Args:
         fintech_api: Cliente da API
-        dados_usuario_unicos: Dados únicos do usuário
+        gerador_cpf: Gerador de CPFs da sessão
+        limpeza_sessao: Limpeza acumulada da sessão
         
-    Returns:
-        Dict[str, str]: Dados completos do usuário cadastrado
+    Yields:
+        PoolContas: Pool já provisionado
     """
-    dados = dados_usuario_unicos
+    pool = PoolContas.from_env(fintech_api, gerador_cpf, limpeza_sessao)
+    with allure.step(f"Provisionar pool de {pool.tamanho} contas"):
+        pool.provisionar()
+    yield pool
+
+
+@pytest.fixture
+def usuario_cadastrado(pool_contas: PoolContas) -> Generator[Dict[str, str], None, None]:
+    """
+    Empresta uma conta já cadastrada do pool da sessão e a devolve ao final.
     
-    with allure.step("Cadastrar usuário de teste"):
-        cadastro_response = fintech_api.cadastrar_usuario(
-            nome=dados["nome"],
-            cpf=dados["cpf"],
-            senha=dados["senha"],
-            scenario_name="Cadastro Sucesso 201"
-        )
+    Args:
+        pool_contas: Pool de contas da sessão
         
-        # Anexar payload de resposta ao relatório Allure
-        allure.attach(
-            cadastro_response.text,
-            name="Response - Cadastro Usuário",
-            attachment_type=allure.attachment_type.JSON
-        )
-    
-    conta_id = cadastro_response.json().get('conta_id', 'MOCK_ID_FAIL')
-    
-    return {
-        "conta_id": conta_id,
-        "cpf": dados["cpf"],
-        "nome": dados["nome"],
-        "senha": dados["senha"]
-    }
+    Yields:
+        Dict[str, str]: Dados completos do usuário cadastrado
+    """
+    with pool_contas.emprestimo() as conta:
+        yield dict(conta)
 
 
 # =============================================================================
 # FIXTURES DE LIMPEZA E TEARDOWN
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def limpeza_sessao(fintech_api: FintechAPI) -> Generator[LimpezaSessao, None, None]:
+    """
+    Acumula as contas criadas na sessão e as remove ao final, em paralelo.
+    
+    As exclusões usam `DELETE /usuario/{id}` com concorrência limitada e
+    novas tentativas em falhas transitórias; o que não puder ser removido
+    fica registrado no relatório Allure.
+    
+    Args:
+        fintech_api: Cliente da API
+        
+    Yields:
+        LimpezaSessao: Registro de contas para exclusão
+    """
+    limpeza = LimpezaSessao.from_env(fintech_api)
+    yield limpeza
+    
+    if limpeza.pendentes:
+        with allure.step("Limpeza de dados da sessão"):
+            resultado = limpeza.executar()
+            anexar(
+                resultado.resumo(),
+                name="Resultado da Limpeza",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            if resultado.falhas:
+                anexar(
+                    resultado.falhas,
+                    name="Contas Não Removidas",
+                    attachment_type=allure.attachment_type.JSON
+                )
+
+
 @pytest.fixture
-def limpeza_usuario() -> Generator[callable, None, None]:
+def limpeza_usuario(limpeza_sessao: LimpezaSessao) -> Generator[callable, None, None]:
     """
     Fixture para gerenciar limpeza de dados de usuário.
     
+    As contas são repassadas à limpeza da sessão, que as remove em lote
+    no final em vez de uma a uma ao fim de cada teste.
+    
+    Args:
+        limpeza_sessao: Limpeza acumulada da sessão
+        
     Yields:
         callable: Função para adicionar usuários à lista de limpeza
     """
@@ -99,20 +251,17 @@ def limpeza_usuario() -> Generator[callable, None, None]:
     def adicionar_para_limpeza(conta_id: str) -> None:
         """Adiciona um usuário à lista de limpeza."""
         usuarios_para_limpar.append(conta_id)
+        limpeza_sessao.registrar(conta_id)
     
     yield adicionar_para_limpeza
     
-    # Teardown: Limpa todos os usuários registrados
     if usuarios_para_limpar:
         with allure.step("Limpeza de dados de teste"):
-            allure.attach(
+            anexar(
                 str(usuarios_para_limpar),
                 name="Usuários para Limpeza",
                 attachment_type=allure.attachment_type.TEXT
             )
-            # Em um ambiente real, aqui seria feita a chamada DELETE /usuario/{id}
-            # for conta_id in usuarios_para_limpar:
-            #     fintech_api.deletar_usuario(conta_id)
 
 
 # =============================================================================
@@ -120,22 +269,21 @@ def limpeza_usuario() -> Generator[callable, None, None]:
 # =============================================================================
 
 @pytest.fixture
-def usuario_teste(usuario_cadastrado: Dict[str, str], limpeza_usuario: callable) -> Generator[Dict[str, str], None, None]:
+def usuario_teste(usuario_cadastrado: Dict[str, str]) -> Generator[Dict[str, str], None, None]:
     """
     Fixture principal que fornece um usuário completo para testes.
     
+    A conta vem do pool da sessão e é reaproveitada por outros testes, por
+    isso não entra na `limpeza_usuario` (que é para contas criadas no teste).
+    
     Args:
         usuario_cadastrado: Dados do usuário cadastrado
-        limpeza_usuario: Função de limpeza
         
     Yields:
         Dict[str, str]: Dados completos do usuário de teste
     """
-    # Registra o usuário para limpeza automática
-    limpeza_usuario(usuario_cadastrado['conta_id'])
-    
     with allure.step("Configurar usuário de teste"):
-        allure.attach(
+        anexar(
             str(usuario_cadastrado),
             name="Dados do Usuário de Teste",
             attachment_type=allure.attachment_type.JSON
@@ -172,14 +320,14 @@ def anexar_payload_api():
             method: Método HTTP
         """
         if request_payload:
-            allure.attach(
+            anexar(
                 str(request_payload),
                 name=f"Request Payload - {method} {endpoint}",
                 attachment_type=allure.attachment_type.JSON
             )
         
         if response_data:
-            allure.attach(
+            anexar(
                 str(response_data),
                 name=f"Response Data - {method} {endpoint}",
                 attachment_type=allure.attachment_type.JSON
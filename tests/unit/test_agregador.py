@@ -0,0 +1,104 @@
+import json
+import os
+from uuid import uuid4
+
+from src.reporting.agregador import SEM_ROTULO, IndiceAllure, formatar, ler_resultado, main
+
+INICIO = 1759278001499  # 2025-10-01 UTC
+
+
+def _gravar_resultado(diretorio, status="passed", feature="Transferência", story="Sucesso", inicio=INICIO, duracao=100, history_id="h1"):
+    uuid = str(uuid4())
+    labels = [{"name": "feature", "value": feature}, {"name": "story", "value": story}] if feature else []
+    dados = {
+        "uuid": uuid, "historyId": history_id, "name": "test_x", "fullName": "tests.api#test_x",
+        "status": status, "start": inicio, "stop": inicio + duracao, "labels": labels,
+    }
+    (diretorio / f"{uuid}-result.json").write_text(json.dumps(dados), encoding="utf-8")
+    return uuid
+
+
+def test_ler_resultado_extrai_rotulos_e_duracao(tmp_path):
+    uuid = _gravar_resultado(tmp_path, status="failed", duracao=250)
+    _gravar_resultado(tmp_path, feature=None)
+    (tmp_path / "corrompido-result.json").write_text("{", encoding="utf-8")
+
+    linha = ler_resultado(str(tmp_path / f"{uuid}-result.json"))
+
+    assert linha == (uuid, "h1", "tests.api#test_x", "Transferência", "Sucesso", "failed", INICIO, 250, "2025-10-01")
+    assert ler_resultado(str(tmp_path / "corrompido-result.json")) is None
+    sem_rotulo = [ler_resultado(str(p)) for p in tmp_path.glob("*-result.json") if p.name != f"{uuid}-result.json"]
+    assert any(linha and linha[3] == SEM_ROTULO for linha in sem_rotulo)
+
+
+def test_atualizacao_incremental_le_apenas_arquivos_novos(tmp_path):
+    resultados = tmp_path / "allure-results"
+    resultados.mkdir()
+    for _ in range(3):
+        _gravar_resultado(resultados)
+    (resultados / "abc-attachment.json").write_text("não é resultado", encoding="utf-8")
+
+    with IndiceAllure(str(tmp_path / "indice.sqlite")) as indice:
+        assert indice.atualizar(str(resultados)) == 3
+        assert indice.atualizar(str(resultados)) == 0
+        _gravar_resultado(resultados, status="failed")
+        assert indice.atualizar(str(resultados)) == 1
+        assert len(indice) == 4
+
+
+def test_historico_sobrevive_a_limpeza_do_diretorio(tmp_path):
+    resultados = tmp_path / "allure-results"
+    resultados.mkdir()
+    _gravar_resultado(resultados)
+    caminho_indice = str(tmp_path / "indice.sqlite")
+    with IndiceAllure(caminho_indice) as indice:
+        indice.atualizar(str(resultados))
+
+    for arquivo in resultados.iterdir():
+        os.remove(arquivo)
+    _gravar_resultado(resultados, status="broken")
+
+    with IndiceAllure(caminho_indice) as indice:
+        assert indice.atualizar(str(resultados)) == 1
+        (linha,) = indice.resumo()
+    assert (linha["execucoes"], linha["passed"], linha["broken"]) == (2, 1, 1)
+
+
+def test_resumo_e_tendencia_por_feature_e_story(tmp_path):
+    dia = 24 * 3600 * 1000
+    _gravar_resultado(tmp_path, "passed", "Transferência", "Sucesso", INICIO, 100)
+    _gravar_resultado(tmp_path, "failed", "Transferência", "Sucesso", INICIO + dia, 300)
+    _gravar_resultado(tmp_path, "passed", "Transferência", "Saldo Insuficiente", INICIO, 50, "h2")
+    _gravar_resultado(tmp_path, "skipped", "Consulta de Saldo", "Inexistente", INICIO, 10, "h3")
+
+    with IndiceAllure(":memory:") as indice:
+        indice.atualizar(str(tmp_path))
+        por_story = {(l["feature"], l["story"]): l for l in indice.resumo("story")}
+        por_feature = {l["feature"]: l for l in indice.resumo("feature")}
+        tendencia = indice.tendencia("story")
+
+    sucesso = por_story[("Transferência", "Sucesso")]
+    assert (sucesso["execucoes"], sucesso["passed"], sucesso["failed"]) == (2, 1, 1)
+    assert sucesso["taxa_sucesso"] == 0.5
+    assert sucesso["duracao_media_ms"] == 200.0 and sucesso["duracao_max_ms"] == 300
+    assert por_feature["Transferência"]["execucoes"] == 3
+    assert por_feature["Consulta de Saldo"]["skipped"] == 1
+    dias = [(l["story"], l["dia"], l["failed"]) for l in tendencia if l["story"] == "Sucesso"]
+    assert dias == [("Sucesso", "2025-10-01", 0), ("Sucesso", "2025-10-02", 1)]
+    assert "Transferência" in formatar(tendencia, "story")
+
+
+def test_cli_grava_json(tmp_path, capsys):
+    resultados = tmp_path / "allure-results"
+    resultados.mkdir()
+    _gravar_resultado(resultados)
+    saida = tmp_path / "resumo.json"
+
+    codigo = main([
+        "--resultados", str(resultados), "--indice", str(tmp_path / "indice.sqlite"),
+        "--por", "feature", "--json", str(saida),
+    ])
+
+    assert codigo == 0
+    assert json.loads(saida.read_text(encoding="utf-8"))[0]["feature"] == "Transferência"
+    assert "1 resultados novos" in capsys.readouterr().err
@@ -0,0 +1,120 @@
+"""
+Testes da gravação assíncrona de anexos do Allure.
+"""
+import gzip
+from uuid import uuid4
+
+import allure
+import allure_commons
+import pytest
+from allure_commons._core import plugin_manager
+from allure_commons.logger import AllureMemoryLogger
+from allure_commons.model2 import TestResult as ResultadoAllure
+from allure_commons.reporter import AllureReporter
+
+from src.reporting.anexos import Anexador
+
+
+class _Listener:
+    def __init__(self, reporter):
+        self.allure_logger = reporter
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        # Como o AllureListener do allure-pytest, usado por `allure.attach`
+        self.allure_logger.attach_data(uuid4(), body, name=name, attachment_type=attachment_type, extension=extension)
+
+
+@pytest.fixture
+def allure_em_memoria():
+    """Simula o allure-pytest ativo: um teste em andamento e um logger em memória."""
+    reporter = AllureReporter()
+    uuid = str(uuid4())
+    reporter.schedule_test(uuid, ResultadoAllure(uuid=uuid, name="teste"))
+    listener, logger = _Listener(reporter), AllureMemoryLogger()
+    plugin_manager.register(listener)
+    plugin_manager.register(logger)
+    yield reporter.get_test(uuid), logger
+    plugin_manager.unregister(listener)
+    plugin_manager.unregister(logger)
+
+
+def test_anexo_registrado_e_gravado_em_fundo(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+    anexador = Anexador()
+
+    anexador.anexar({"conta_id": "99999"}, name="Payload", attachment_type=allure.attachment_type.JSON)
+    anexador.flush()
+
+    anexo = resultado.attachments[0]
+    assert anexo.name == "Payload" and anexo.type == "application/json"
+    assert logger.attachments[anexo.source] == b'{"conta_id": "99999"}'
+
+
+def test_anexos_identicos_compartilham_o_arquivo(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+    anexador = Anexador()
+
+    for nome in ("Primeiro", "Segundo"):
+        anexador.anexar("Saldo Encontrado 200", name=nome)
+    anexador.anexar("Outro cenário", name="Terceiro")
+    anexador.flush()
+
+    fontes = [anexo.source for anexo in resultado.attachments]
+    assert fontes[0] == fontes[1] != fontes[2]
+    assert len(logger.attachments) == 2
+    assert anexador.deduplicados == 1
+
+
+def test_anexo_grande_truncado(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+    anexador = Anexador(max_bytes=100)
+
+    anexador.anexar("x" * 1000, name="Grande")
+    anexador.flush()
+
+    gravado = logger.attachments[resultado.attachments[0].source]
+    assert gravado.startswith(b"x" * 100) and b"900 bytes omitidos" in gravado
+
+
+def test_anexo_grande_comprimido(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+    anexador = Anexador(max_bytes=100, grandes="gzip")
+
+    anexador.anexar("x" * 1000, name="Grande", attachment_type=allure.attachment_type.JSON)
+    anexador.flush()
+
+    anexo = resultado.attachments[0]
+    assert anexo.type == "application/gzip" and anexo.source.endswith(".json.gz")
+    assert gzip.decompress(logger.attachments[anexo.source]) == b"x" * 1000
+
+
+def test_modo_off_nao_anexa(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+
+    Anexador(modo="off").anexar("qualquer coisa", name="Ignorado")
+
+    assert resultado.attachments == [] and logger.attachments == {}
+
+
+def test_modo_sync_serializa_como_o_async(allure_em_memoria):
+    resultado, logger = allure_em_memoria
+
+    Anexador(modo="sync").anexar({"p99_ms": 12.5}, name="Estatísticas", attachment_type=allure.attachment_type.JSON)
+
+    anexo = resultado.attachments[0]
+    assert anexo.name == "Estatísticas"
+    assert logger.attachments[anexo.source] == b'{"p99_ms": 12.5}'
+
+
+def test_sem_api_interna_do_reporter_volta_ao_allure_attach(monkeypatch):
+    anexos = []
+    monkeypatch.setattr("src.reporting.anexos.allure.attach", lambda body, **kwargs: anexos.append((body, kwargs["name"])))
+    listener = _Listener(object())  # reporter sem _last_executable/_items
+    plugin_manager.register(listener)
+    try:
+        Anexador().anexar({"conta_id": "1"}, name="Payload")
+    finally:
+        plugin_manager.unregister(listener)
+
+    assert anexos == [(b'{"conta_id": "1"}', "Payload")]
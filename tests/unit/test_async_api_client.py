@@ -0,0 +1,160 @@
+"""
+Testes do cliente assíncrono e dos métodos de lote com concorrência limitada.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services.async_api_client import AsyncFintechAPI, Operacao
+from src.services.transport import TransportConfig
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    lock = threading.Lock()
+    em_voo = 0
+    pico = 0
+
+    def _responder(self, corpo):
+        with _Handler.lock:
+            _Handler.em_voo += 1
+            _Handler.pico = max(_Handler.pico, _Handler.em_voo)
+        time.sleep(0.02)
+        with _Handler.lock:
+            _Handler.em_voo -= 1
+        dados = json.dumps(corpo).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_GET(self):
+        self._responder({
+            "conta_id": self.path.rsplit("/", 1)[-1],
+            "cenario": self.headers.get("x-mock-response-name"),
+        })
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._responder({"payload": payload, "cenario": self.headers.get("x-mock-response-name")})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor_local():
+    _Handler.em_voo = _Handler.pico = 0
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+async def _coletar(iterador):
+    return [resultado async for resultado in iterador]
+
+
+def test_envia_header_de_cenario(servidor_local):
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local) as api:
+            return await api.realizar_transferencia("1", "2", 10.0, scenario_name="Transferencia Sucesso 200")
+
+    data = asyncio.run(cenario()).json()
+
+    assert data["cenario"] == "Transferencia Sucesso 200"
+    assert data["payload"] == {"origem": "1", "destino": "2", "valor": 10.0}
+
+
+def test_lote_respeita_limite_de_concorrencia(servidor_local):
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local, config=TransportConfig(pool_size=16)) as api:
+            return await _coletar(api.consultar_saldos_em_lote(
+                (str(i) for i in range(60)), scenario_name="Saldo Encontrado 200", concorrencia=4
+            ))
+
+    resultados = asyncio.run(cenario())
+
+    assert len(resultados) == 60
+    assert all(r.erro is None and r.response.status_code == 200 for r in resultados)
+    assert {r.response.json()["conta_id"] for r in resultados} == {str(i) for i in range(60)}
+    assert 1 < _Handler.pico <= 4
+
+
+def test_lote_reporta_erros_sem_interromper():
+    async def cenario():
+        async with AsyncFintechAPI(base_url="http://127.0.0.1:9", config=TransportConfig(connect_timeout=0.5)) as api:
+            return await _coletar(api.transferencias_em_lote([{"origem": "1", "destino": "2", "valor": 1.0}] * 3))
+
+    resultados = asyncio.run(cenario())
+
+    assert len(resultados) == 3
+    assert all(r.response is None and r.erro is not None for r in resultados)
+
+
+def test_lote_rejeita_operacao_desconhecida(servidor_local):
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local) as api:
+            await _coletar(api.executar_em_lote([Operacao("deletar_tudo", {})]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(cenario())
+
+
+def test_operacao_invalida_no_meio_cancela_as_tarefas_em_voo(servidor_local):
+    operacoes = [Operacao("consultar_saldo", {"conta_id": str(i)}) for i in range(3)]
+    operacoes.append(Operacao("deletar_tudo", {}))
+
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local) as api:
+            with pytest.raises(ValueError):
+                await _coletar(api.executar_em_lote(operacoes, concorrencia=4))
+            return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    assert asyncio.run(cenario()) == []
+
+
+def test_consumidor_que_para_cedo_nao_deixa_tarefas(servidor_local):
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local) as api:
+            lote = api.consultar_saldos_em_lote((str(i) for i in range(20)), concorrencia=4)
+            async for _ in lote:
+                break
+            await lote.aclose()
+            return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    assert asyncio.run(cenario()) == []
+
+
+def test_cancelar_o_lote_cancela_as_requisicoes_em_voo(servidor_local):
+    async def cenario():
+        async with AsyncFintechAPI(base_url=servidor_local) as api:
+            consumidor = asyncio.create_task(_coletar(api.consultar_saldos_em_lote(
+                (str(i) for i in range(20)), concorrencia=4
+            )))
+            await asyncio.sleep(0.01)  # o servidor segura cada resposta por 20 ms
+            em_voo = [t for t in asyncio.all_tasks() if t not in (consumidor, asyncio.current_task())]
+            consumidor.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await consumidor
+            return em_voo
+
+    em_voo = asyncio.run(cenario())
+
+    assert em_voo and all(tarefa.cancelled() for tarefa in em_voo)
+
+
+def test_fixture_async_fintech_api(async_fintech_api, async_loop, servidor_local, monkeypatch):
+    monkeypatch.setattr(async_fintech_api, "base_url", servidor_local)
+
+    response = async_loop.run_until_complete(async_fintech_api.consultar_saldo("99999"))
+
+    assert response.json()["conta_id"] == "99999"
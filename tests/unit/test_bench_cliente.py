@@ -0,0 +1,59 @@
+"""
+Testes do micro-benchmark do cliente.
+"""
+import json
+
+from benchmarks.bench_cliente import URL_STUB, TransporteStub, comparar, executar, main
+from src.services.api_client import FintechAPI
+
+
+def _caso(custo, pico=3000, ops=50000.0):
+    return {"ops_por_s": ops, "us_por_chamada": 20.0, "custo_relativo": custo, "pico_bytes": pico, "blocos_retidos": 0.0}
+
+
+def test_transporte_stub_responde_o_catalogo_sem_rede():
+    transporte = TransporteStub()
+    with FintechAPI(base_url=URL_STUB, transport=transporte) as api:
+        saldo = api.consultar_saldo("777", scenario_name="Saldo Encontrado 200", tipado=True)
+        falha = api.realizar_transferencia("1", "2", 1e6, scenario_name="Falha Saldo Insuficiente 400", tipado=True)
+
+    assert saldo.ok and saldo.conta_id == "777"
+    assert falha.status_code == 400 and falha.codigo_erro == "ERR-SALDO-001"
+    assert transporte.chamadas == 2
+
+
+def test_comparar_aponta_regressao_de_custo_e_memoria():
+    baseline = {"a": _caso(2.0), "b": _caso(2.0, pico=1000)}
+    atuais = {"a": _caso(2.6), "b": _caso(2.1, pico=1200), "novo": _caso(9.0)}
+
+    regressoes = comparar(atuais, baseline, limite=0.2, limite_memoria=0.1)
+
+    assert len(regressoes) == 2
+    assert regressoes[0].startswith("a: custo relativo 2.600 vs 2.000")
+    assert regressoes[1].startswith("b: pico de 1200 bytes")
+    assert comparar({"a": _caso(2.3)}, baseline, limite=0.2, limite_memoria=0.1) == []
+
+
+def test_executar_mede_os_casos_filtrados():
+    resultados = executar(chamadas=20, repeticoes=2, filtro="consultar_saldo")
+
+    assert set(resultados) == {"consultar_saldo", "consultar_saldo[tipado]"}
+    for resultado in resultados.values():
+        assert resultado["ops_por_s"] > 0 and resultado["custo_relativo"] > 0
+        assert resultado["pico_bytes"] > 0
+
+
+def test_salvar_e_comparar_com_a_baseline(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    argumentos = ["--chamadas", "20", "--repeticoes", "2", "--filtro", "cadastrar_usuario[", "--baseline", str(baseline)]
+
+    assert main(argumentos + ["--salvar"]) == 0
+    dados = json.loads(baseline.read_text(encoding="utf-8"))
+    assert list(dados["casos"]) == ["cadastrar_usuario[tipado]"]
+
+    # Baseline artificialmente 10x mais barata: a execução atual é uma regressão
+    dados["casos"]["cadastrar_usuario[tipado]"]["custo_relativo"] /= 10
+    baseline.write_text(json.dumps(dados), encoding="utf-8")
+    assert main(argumentos + ["--comparar"]) == 1
+    assert "REGRESSÃO" in capsys.readouterr().err
+    assert main(["--comparar", "--baseline", str(tmp_path / "inexistente.json"), "--chamadas", "5", "--repeticoes", "1"]) == 2
@@ -0,0 +1,111 @@
+"""
+Testes do cache de saldo do cliente.
+"""
+import pytest
+import requests
+
+from src.mock.falhas import Falha, PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+from src.services.cache_saldo import CacheSaldo
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def _resposta(status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    return response
+
+
+def test_ttl_e_contadores():
+    relogio = Relogio()
+    cache = CacheSaldo(ttl=5, relogio=relogio)
+    response = _resposta()
+
+    assert cache.obter("1") == (None, 0)
+    cache.guardar("1", None, response, 0)
+    relogio.agora = 4.9
+    assert cache.obter("1")[0] is response
+    assert cache.obter("1", "Outro Cenario")[0] is None  # cenário diferente não é acerto
+    relogio.agora = 5.0
+    cache.guardar("1", None, response, 0)
+    relogio.agora = 10.0
+    assert cache.obter("1")[0] is None
+
+    assert (cache.acertos, cache.faltas, cache.expirados) == (1, 3, 1)
+    assert cache.taxa_acerto == pytest.approx(0.25)
+
+
+def test_lru_limita_o_tamanho_e_so_guarda_200():
+    cache = CacheSaldo(max_itens=2)
+    for conta_id in ("1", "2"):
+        cache.guardar(conta_id, None, _resposta(), 0)
+    cache.obter("1")  # "2" passa a ser a menos usada
+    cache.guardar("3", None, _resposta(), 0)
+    cache.guardar("4", None, _resposta(404), 0)
+
+    assert cache.obter("2")[0] is None
+    assert cache.obter("1")[0] is not None and cache.obter("3")[0] is not None
+    assert cache.obter("4")[0] is None
+    assert len(cache) == 2 and cache.descartados == 1
+    with pytest.raises(ValueError):
+        CacheSaldo(ttl=0)
+
+
+def test_leitura_iniciada_antes_da_invalidacao_nao_grava():
+    cache = CacheSaldo()
+    _, geracao_1 = cache.obter("1")
+    _, geracao_2 = cache.obter("2")
+    cache.invalidar("1")  # transferência concluída enquanto as consultas estavam em voo
+
+    cache.guardar("1", None, _resposta(), geracao_1)
+    cache.guardar("2", None, _resposta(), geracao_2)
+
+    assert cache.obter("1")[0] is None
+    assert cache.obter("2")[0] is not None  # outra conta não é afetada
+
+
+def test_registro_de_invalidacoes_e_limitado():
+    cache = CacheSaldo(max_itens=1)
+    _, geracao = cache.obter("antiga")
+    cache.invalidar("antiga")
+    cache.invalidar("a", "b", "c", "d")  # "antiga" sai do registro por conta
+
+    cache.guardar("antiga", None, _resposta(), geracao)
+
+    assert len(cache._invalidada_em) == 4
+    assert cache.obter("antiga")[0] is None  # o piso ainda barra a leitura velha
+
+
+def test_cliente_usa_o_cache_e_invalida_na_transferencia():
+    servidor = MockServer(falhas=PlanoFalhas({}))
+    with servidor, FintechAPI(base_url=servidor.url, cache_saldo=CacheSaldo(ttl=60)) as api:
+        primeira = api.consultar_saldo("10", scenario_name="Saldo Encontrado 200", tipado=True)
+        segunda = api.consultar_saldo("10", scenario_name="Saldo Encontrado 200", tipado=True)
+        api.realizar_transferencia("10", "20", 5.0, scenario_name="Falha Saldo Insuficiente 400")
+        terceira = api.consultar_saldo("10", scenario_name="Saldo Encontrado 200")
+        api.realizar_transferencia("10", "20", 5.0, scenario_name="Transferencia Sucesso 200")
+        quarta = api.consultar_saldo("10", scenario_name="Saldo Encontrado 200")
+        cache = api.cache_saldo
+
+    assert primeira.ok and segunda.saldo == primeira.saldo
+    assert terceira is segunda.response  # recusa de negócio não muda saldos
+    assert quarta is not terceira
+    assert (cache.acertos, cache.faltas, cache.invalidacoes) == (2, 2, 1)
+
+
+def test_falha_de_servidor_na_transferencia_tambem_invalida():
+    plano = PlanoFalhas({"transferencia": Falha(taxa_erro=1.0)})
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url, cache_saldo=CacheSaldo()) as api:
+        api.consultar_saldo("10", scenario_name="Saldo Encontrado 200")
+        response = api.realizar_transferencia("20", "10", 5.0, scenario_name="Transferencia Sucesso 200")
+
+    assert response.status_code == 503
+    assert len(api.cache_saldo) == 0
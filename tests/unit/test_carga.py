@@ -0,0 +1,72 @@
+"""
+Testes do gerador de carga open-loop.
+"""
+import pytest
+
+from src.mock.server import MockServer
+from src.perf.carga import (
+    EstatisticasCenario, PerfilDegraus, PerfilFixo, PerfilRampa, RelatorioCarga, Sla,
+    avaliar_sla, executar_carga, montar_mix,
+)
+from src.services.api_client import FintechAPI
+
+
+def test_perfil_fixo_espacamento_uniforme():
+    instantes = list(PerfilFixo(rps=10, duracao=2).instantes())
+
+    assert len(instantes) == 20
+    assert instantes[1] - instantes[0] == pytest.approx(0.1)
+
+
+def test_perfil_rampa_acelera_ate_taxa_final():
+    instantes = list(PerfilRampa(rps_inicial=0, rps_final=100, duracao=10).instantes())
+
+    assert len(instantes) == 500
+    assert instantes[-1] <= 10
+    # Intervalo entre envios no fim (~100 rps) é menor que no começo
+    assert instantes[-1] - instantes[-2] < instantes[2] - instantes[1]
+
+
+def test_perfil_degraus_concatena_patamares():
+    instantes = list(PerfilDegraus([(10, 1), (20, 1)]).instantes())
+
+    assert len(instantes) == 30
+    assert instantes[10] == pytest.approx(1.0)
+
+
+def test_mix_rejeita_cenario_desconhecido():
+    with pytest.raises(ValueError):
+        montar_mix({"Cenario Inexistente": 1})
+
+
+def test_sla_parse():
+    assert Sla.parse("p99=250") == Sla("p99", 250.0, "TOTAL")
+    assert Sla.parse("Saldo Encontrado 200:erro=0.01") == Sla("erro", 0.01, "Saldo Encontrado 200")
+    with pytest.raises(ValueError):
+        Sla.parse("p42=1")
+
+
+def test_avaliar_sla_aponta_violacoes():
+    estatisticas = EstatisticasCenario()
+    for latencia_us in (1000, 2000, 300000):
+        estatisticas.latencia.registrar(latencia_us)
+    estatisticas.total = 3
+    estatisticas.erros = 1
+    relatorio = RelatorioCarga({"Transferencia Sucesso 200": estatisticas}, duracao=1.0)
+
+    violacoes = avaliar_sla(relatorio, [Sla("p50", 5), Sla("p99", 100), Sla("erro", 0.5), Sla("rps", 10)])
+
+    assert len(violacoes) == 2
+    assert any("p99" in v for v in violacoes) and any("rps" in v for v in violacoes)
+
+
+def test_execucao_contra_mock_local():
+    mix = montar_mix({"Transferencia Sucesso 200": 3, "Falha Saldo Insuficiente 400": 1, "Saldo Encontrado 200": 1})
+    with MockServer() as servidor, FintechAPI(base_url=servidor.url) as api:
+        relatorio = executar_carga(api, PerfilFixo(rps=200, duracao=1), mix, workers=8, semente=1)
+
+    total = relatorio.consolidado()
+    assert total.total == 200
+    assert total.erros == 0
+    assert set(relatorio.por_cenario) == {item.cenario for item in mix}
+    assert relatorio.resumo()["TOTAL"]["p99"] > 0
@@ -0,0 +1,100 @@
+"""
+Testes da camada record/replay do FintechAPI.
+"""
+import os
+import time
+
+import pytest
+
+from src.mock.server import MockServer
+from src.services.api_client import IDEMPOTENCY_HEADER, FintechAPI
+from src.services.cassete import Cassete, CasseteAusente, impressao_digital
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cassetes" / "fintech.cas")
+
+
+def _gravar(caminho, **kwargs):
+    with MockServer() as servidor, FintechAPI(base_url=servidor.url, cassete=Cassete(caminho, "record", **kwargs)) as api:
+        api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+        api.realizar_transferencia("1", "2", 10.0, scenario_name="Falha Saldo Insuficiente 400")
+
+
+def test_impressao_digital_ignora_ordem_das_chaves():
+    assert impressao_digital("POST", "/transferencia", {"origem": "1", "valor": 5}, "X") == \
+        impressao_digital("POST", "/transferencia", {"valor": 5, "origem": "1"}, "X")
+    assert impressao_digital("POST", "/transferencia", {"origem": "1"}, "X") != \
+        impressao_digital("POST", "/transferencia", {"origem": "1"}, "Y")
+
+
+def test_replay_responde_sem_rede(caminho):
+    _gravar(caminho)
+
+    # Porta 1: qualquer tentativa de rede falharia
+    with FintechAPI(base_url="http://127.0.0.1:1", cassete=Cassete(caminho, "replay")) as api:
+        saldo = api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+        transferencia = api.realizar_transferencia("1", "2", 10.0, scenario_name="Falha Saldo Insuficiente 400")
+        assert api.cassete.acertos == 2
+
+    assert saldo.status_code == 200
+    assert saldo.json() == {"conta_id": "12345", "saldo": 1500.5, "status": "ATIVO"}
+    assert transferencia.status_code == 400
+    assert transferencia.json()["codigo_erro"] == "ERR-SALDO-001"
+    # A resposta reproduzida traz a requisição, como uma resposta real
+    assert (saldo.request.method, saldo.request.path_url) == ("GET", "/saldo/12345")
+    assert transferencia.request.method == "POST"
+    assert IDEMPOTENCY_HEADER in transferencia.request.headers
+
+
+def test_replay_sem_gravacao_levanta_erro(caminho):
+    _gravar(caminho)
+
+    with FintechAPI(base_url="http://127.0.0.1:1", cassete=Cassete(caminho, "replay")) as api:
+        with pytest.raises(CasseteAusente):
+            api.consultar_saldo("12345", scenario_name="Saldo Nao Encontrado 404")
+
+
+def test_entradas_expiradas_nao_sao_reproduzidas(caminho):
+    _gravar(caminho)
+    time.sleep(0.05)
+
+    with FintechAPI(base_url="http://127.0.0.1:1", cassete=Cassete(caminho, "replay", max_idade=0.01)) as api:
+        with pytest.raises(CasseteAusente):
+            api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+
+
+def test_regravacao_compacta_versoes_antigas(caminho):
+    _gravar(caminho)
+    tamanho_uma_gravacao = os.path.getsize(caminho)
+    for _ in range(5):
+        _gravar(caminho)
+
+    cassete = Cassete(caminho, "replay")
+
+    assert cassete.desperdicio <= 0.5
+    assert os.path.getsize(caminho) <= 2 * tamanho_uma_gravacao
+
+
+def test_compactacao_respeita_max_entradas(caminho):
+    _gravar(caminho, max_entradas=1)
+
+    cassete = Cassete(caminho, "replay")
+
+    assert len(cassete._indice) == 1
+
+
+def test_compactacao_preserva_gravacoes_de_outros_clientes(caminho):
+    primeira, segunda = Cassete(caminho, "record"), Cassete(caminho, "record")
+    for _ in range(4):
+        primeira.gravar(b"a" * 16, 200, "application/json", b'{"v": 1}')
+    segunda.gravar(b"b" * 16, 200, "application/json", b'{"v": 2}')
+
+    primeira.close()  # 3 de 5 registros são versões antigas: compacta
+    segunda.gravar(b"c" * 16, 201, "application/json", b'{"v": 3}')
+    segunda.close()
+
+    cassete = Cassete(caminho, "replay")
+    assert set(cassete._indice) == {b"a" * 16, b"b" * 16, b"c" * 16}
+    assert cassete._registros == 3
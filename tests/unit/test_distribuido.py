@@ -0,0 +1,105 @@
+"""
+Testes do scale-out multi-processo do gerador de carga.
+"""
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from types import SimpleNamespace
+
+import pytest
+
+from src.mock.server import MockServer
+from src.perf.carga import ColetorCarga, EstatisticasCenario, criar_parser
+from src.perf.distribuido import Agregador, WorkersAusentes, _aceitar, coordenar, main, resolver_chave
+
+
+def test_coletor_extrai_deltas():
+    coletor = ColetorCarga(["Saldo Encontrado 200"])
+    coletor.registrar("Saldo Encontrado 200", 1000, 900, erro=False)
+
+    primeiro = coletor.extrair()
+    coletor.registrar("Saldo Encontrado 200", 2000, 1900, erro=True)
+    segundo = coletor.extrair()
+
+    assert primeiro["Saldo Encontrado 200"].total == 1
+    assert segundo["Saldo Encontrado 200"].total == 1
+    assert segundo["Saldo Encontrado 200"].erros == 1
+
+
+def test_agregador_mescla_snapshots_de_varios_workers():
+    agregador = Agregador()
+    for latencia in (1000, 2000, 3000):
+        estatisticas = EstatisticasCenario()
+        estatisticas.latencia.registrar(latencia)
+        estatisticas.total = 1
+        agregador.mesclar({"Transferencia Sucesso 200": estatisticas.snapshot()})
+
+    janela = agregador.fechar_janela()
+
+    assert janela.total == 3
+    assert agregador.acumulado["Transferencia Sucesso 200"].latencia.maximo == 3000
+    assert agregador.fechar_janela().total == 0
+
+
+def test_coordenador_com_processos_locais():
+    linhas = []
+    with MockServer() as servidor:
+        args = criar_parser().parse_args(["--url", servidor.url, "--rps", "100", "--duracao", "1", "--workers", "4"])
+        relatorio = coordenar(args, processos=2, intervalo=0.5, saida=linhas.append)
+
+    total = relatorio.consolidado()
+    assert total.total == 100
+    assert total.erros == 0
+    assert linhas and "workers" in linhas[-1]
+
+
+def test_chave_explicita_para_escuta_externa(monkeypatch, capsys):
+    monkeypatch.delenv("FINTECH_CARGA_CHAVE", raising=False)
+
+    assert len(resolver_chave("127.0.0.1", remotos=0)) == 32
+    assert resolver_chave("127.0.0.1", 0) != resolver_chave("127.0.0.1", 0)
+    for host, remotos in (("0.0.0.0", 0), ("127.0.0.1", 1), ("carga.interna", 0)):
+        with pytest.raises(ValueError, match="FINTECH_CARGA_CHAVE"):
+            resolver_chave(host, remotos)
+    assert main(["coordenador", "--host", "0.0.0.0", "--url", "http://127.0.0.1:1"]) == 2
+    assert "FINTECH_CARGA_CHAVE" in capsys.readouterr().err
+
+    monkeypatch.setenv("FINTECH_CARGA_CHAVE", "segredo")
+    assert resolver_chave("0.0.0.0", remotos=2) == b"segredo"
+
+
+def test_coordenador_nao_espera_para_sempre():
+    args = criar_parser().parse_args(["--url", "http://127.0.0.1:1", "--duracao", "1"])
+
+    inicio = time.monotonic()
+    with pytest.raises(WorkersAusentes, match="0 de 1"):
+        coordenar(args, processos=0, remotos=1, chave=b"k", prazo_conexao=0.3)
+    assert time.monotonic() - inicio < 2
+
+    with socket.create_server(("127.0.0.1", 0)) as servidor:
+        with pytest.raises(WorkersAusentes, match="terminou"):
+            _aceitar(servidor, b"k", 1, [SimpleNamespace(exitcode=1)], prazo=10)
+
+
+def test_aceitar_descarta_worker_sem_a_chave():
+    recusas = []
+
+    def conectar(endereco):
+        try:
+            Client(endereco, authkey=b"errada").close()
+        except AuthenticationError:
+            recusas.append(1)
+        with Client(endereco, authkey=b"k") as conexao:
+            conexao.send("pronto")
+
+    with socket.create_server(("127.0.0.1", 0)) as servidor:
+        cliente = threading.Thread(target=conectar, args=(servidor.getsockname(),))
+        cliente.start()
+        conexoes = _aceitar(servidor, b"k", 1, [], prazo=5)
+        cliente.join()
+
+    assert len(conexoes) == 1 and recusas == [1]
+    assert conexoes[0].recv() == "pronto"
+    conexoes[0].close()
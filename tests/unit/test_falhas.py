@@ -0,0 +1,83 @@
+"""
+Testes da injeção de latência e erros no Mock Server.
+"""
+import random
+import statistics
+import time
+
+import pytest
+
+from src.mock.falhas import Falha, Latencia, PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+from src.services.resiliencia import PoliticaResiliencia
+
+
+def test_latencia_parse_e_amostragem():
+    rng = random.Random(7)
+
+    assert Latencia.parse("fixa:5").amostrar(rng) == 0.005
+    assert 0.010 <= Latencia.parse("uniforme:10:20").amostrar(rng) <= 0.020
+    amostras = [Latencia.parse("lognormal:20:0.8").amostrar(rng) for _ in range(5000)]
+    assert statistics.median(amostras) == pytest.approx(0.020, rel=0.1)
+    assert max(amostras) > 0.1  # cauda longa
+    with pytest.raises(ValueError):
+        Latencia.parse("normal:10")
+    with pytest.raises(ValueError):
+        Latencia.parse("uniforme:10")
+
+
+def test_regra_mais_especifica_vence():
+    plano = PlanoFalhas.de_dict({
+        "*": {"latencia": "fixa:1"},
+        "saldo": {"taxa_erro": 0.5},
+        "saldo/Saldo Nao Encontrado 404": {"status_erro": 500},
+    })
+
+    assert plano.regra("saldo", "Saldo Nao Encontrado 404")[0] == "saldo/Saldo Nao Encontrado 404"
+    assert plano.regra("saldo", "Saldo Encontrado 200")[0] == "saldo"
+    assert plano.regra("cadastro", None)[0] == "*"
+    assert PlanoFalhas({}).sortear("saldo", None) == (0.0, None)
+
+
+def test_falhas_iniciais_e_taxa_de_erro():
+    plano = PlanoFalhas({
+        "saldo": Falha(falhas_iniciais=2, status_erro=502),
+        "transferencia": Falha(taxa_erro=0.25),
+    }, semente=3)
+
+    assert [plano.sortear("saldo", None)[1] for _ in range(4)] == [502, 502, None, None]
+    erros = sum(plano.sortear("transferencia", None)[1] == 503 for _ in range(4000))
+    assert erros / 4000 == pytest.approx(0.25, abs=0.03)
+
+
+def test_mock_aplica_latencia_e_erro_por_rota():
+    plano = PlanoFalhas.de_dict({
+        "saldo": {"latencia": "fixa:80"},
+        "transferencia": {"taxa_erro": 1.0, "status_erro": 503},
+    })
+    politica = PoliticaResiliencia()
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url, resiliencia=politica) as api:
+        inicio = time.perf_counter()
+        saldo = api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+        duracao = time.perf_counter() - inicio
+        transferencia = api.realizar_transferencia("1", "2", 10.0, scenario_name="Transferencia Sucesso 200")
+        cadastro = api.cadastrar_usuario("Tester", "111.111.111-11", "senha")
+
+    assert saldo.status_code == 200 and duracao >= 0.08
+    assert transferencia.status_code == 503
+    assert transferencia.json()["mensagem"] == "Falha injetada pelo Mock Server."
+    assert cadastro.status_code == 201
+
+
+def test_idempotency_key_repete_a_primeira_resposta():
+    servidor = MockServer(falhas=PlanoFalhas({}))
+    headers = {"idempotency-key": "k-1", "x-mock-response-name": "Transferencia Sucesso 200"}
+
+    primeira = servidor.responder("POST", "/transferencia", headers)
+    headers["x-mock-response-name"] = "Falha Saldo Insuficiente 400"
+    repetida = servidor.responder("POST", "/transferencia", headers)
+    outra_chave = servidor.responder("POST", "/transferencia", {**headers, "idempotency-key": "k-2"})
+
+    assert repetida == primeira and primeira[0] == 200
+    assert outra_chave[0] == 400
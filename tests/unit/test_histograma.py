@@ -0,0 +1,78 @@
+"""
+Testes do histograma de latências HDR.
+"""
+import random
+
+import pytest
+
+from src.perf.histograma import Histograma
+
+
+def _percentil_exato(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[int(max(1, -(-len(ordenados) * p // 100))) - 1]
+
+
+@pytest.mark.parametrize("p", [50, 90, 99, 99.9])
+def test_percentis_com_erro_relativo_limitado(p):
+    rng = random.Random(42)
+    valores = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+    histograma = Histograma()
+    for valor in valores:
+        histograma.registrar(valor)
+
+    exato = _percentil_exato(valores, p)
+
+    assert exato <= histograma.percentil(p) <= exato * 1.008 + 1
+
+
+def test_valores_pequenos_sao_exatos():
+    histograma = Histograma()
+    for valor in range(1, 101):
+        histograma.registrar(valor)
+
+    assert histograma.percentil(50) == 50
+    assert histograma.percentil(100) == 100
+    assert histograma.minimo == 1
+    assert histograma.media == 50.5
+
+
+def test_mesclar_equivale_a_registrar_tudo_em_um():
+    a, b, unico = Histograma(), Histograma(), Histograma()
+    for valor in range(0, 100000, 7):
+        (a if valor % 2 else b).registrar(valor)
+        unico.registrar(valor)
+
+    a.mesclar(b)
+
+    assert a.contagens == unico.contagens
+    assert (a.total, a.soma, a.minimo, a.maximo) == (unico.total, unico.soma, unico.minimo, unico.maximo)
+
+
+def test_valores_acima_do_maximo_sao_truncados():
+    histograma = Histograma(valor_maximo=1_000_000)
+    histograma.registrar(5_000_000)
+
+    assert histograma.maximo == 1_000_000
+    assert histograma.percentil(99) == 1_000_000
+
+
+def test_mesclar_exige_mesma_faixa():
+    with pytest.raises(ValueError):
+        Histograma(valor_maximo=1000).mesclar(Histograma())
+
+
+def test_serializacao_compacta_ida_e_volta():
+    histograma = Histograma()
+    for valor in range(0, 2_000_000, 13):
+        histograma.registrar(valor)
+
+    dados = histograma.para_bytes()
+    copia = Histograma.de_bytes(dados)
+
+    assert len(dados) < 8 * len(histograma.contagens)
+    assert copia.contagens == histograma.contagens
+    assert (copia.total, copia.soma, copia.minimo, copia.maximo) == (
+        histograma.total, histograma.soma, histograma.minimo, histograma.maximo
+    )
+    assert Histograma.de_bytes(Histograma().para_bytes()).minimo is None
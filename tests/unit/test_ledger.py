@@ -0,0 +1,73 @@
+"""
+Testes do ledger vetorizado.
+"""
+import numpy as np
+import pytest
+
+from src.perf.ledger import (
+    DESTINO_INEXISTENTE, INEXISTENTE, SALDO_INSUFICIENTE, SUCESSO, Ledger, Transferencias,
+    aplicar_sequencial, gerar_carga, resultado_observado,
+)
+from src.services.api_client import FintechAPI
+
+
+def _transferencias(*linhas):
+    origem, destino, valor = zip(*linhas)
+    return Transferencias(np.array(origem), np.array(destino), np.array(valor))
+
+
+def test_regras_basicas():
+    ledger = Ledger(["A", "B"], [1000, 0])
+
+    resultados = ledger.aplicar(_transferencias(
+        (0, 1, 600),          # A -> B
+        (0, 1, 600),          # A só tem 400: saldo insuficiente
+        (1, 0, 600),          # B recebeu 600 antes: sucesso
+        (0, INEXISTENTE, 1),  # destino fora do ledger
+        (0, 0, 1000),         # para a própria conta, com saldo exato
+    ))
+
+    assert resultados.tolist() == [SUCESSO, SALDO_INSUFICIENTE, SUCESSO, DESTINO_INEXISTENTE, SUCESSO]
+    assert ledger.saldos.tolist() == [1000, 0]
+    assert ledger.verificar_invariantes() == []
+
+
+@pytest.mark.parametrize("semente, contas, bloco", [(1, 5, 8), (2, 50, 64), (3, 500, 4096)])
+def test_equivale_a_aplicacao_sequencial(semente, contas, bloco):
+    ledger, transferencias = gerar_carga(contas, 20_000, saldo_maximo=300, semente=semente)
+    ledger.bloco_inicial = bloco
+    referencia, _ = gerar_carga(contas, 20_000, saldo_maximo=300, semente=semente)
+
+    resultados = ledger.aplicar(transferencias)
+
+    np.testing.assert_array_equal(resultados, aplicar_sequencial(referencia, transferencias))
+    np.testing.assert_array_equal(ledger.saldos, referencia.saldos)
+    assert (resultados == SALDO_INSUFICIENTE).any()
+    assert ledger.verificar_invariantes() == []
+
+
+def test_rejeita_origem_inexistente_e_valor_invalido():
+    ledger = Ledger(["A"], [10])
+
+    with pytest.raises(ValueError):
+        ledger.aplicar(_transferencias((INEXISTENTE, 0, 1)))
+    with pytest.raises(ValueError):
+        ledger.aplicar(_transferencias((0, 0, 0)))
+
+
+def test_resultado_observado_das_respostas():
+    assert resultado_observado(200) == SUCESSO
+    assert resultado_observado(400, "ERR-SALDO-001") == SALDO_INSUFICIENTE
+    assert resultado_observado(404) == DESTINO_INEXISTENTE
+
+
+def test_conferir_saldos_com_a_api(mock_server_url):
+    # O Mock Server responde 1500.50 para qualquer conta
+    ledger = Ledger(["10", "20"], [150050, 150050])
+
+    with FintechAPI(base_url=mock_server_url) as api:
+        assert ledger.conferir_saldos(api) == []
+        ledger.aplicar(_transferencias((0, 1, 50)))
+        divergencias = ledger.conferir_saldos(api)
+
+    assert [(d.conta_id, d.esperado, d.obtido) for d in divergencias] == [("10", 150000, 150050), ("20", 150100, 150050)]
@@ -0,0 +1,84 @@
+"""
+Testes da limpeza em lote das contas da sessão.
+"""
+import threading
+from collections import Counter
+
+import pytest
+import requests
+
+from src.services.api_client import FintechAPI
+from src.services.limpeza import LimpezaSessao
+
+
+@pytest.fixture
+def api(mock_server_url):
+    with FintechAPI(base_url=mock_server_url) as cliente:
+        yield cliente
+
+
+class _ApiInstavel:
+    """Falha as primeiras `falhas` exclusões de cada conta com erro de conexão."""
+
+    def __init__(self, falhas):
+        self.falhas = falhas
+        self.chamadas = Counter()
+        self.lock = threading.Lock()
+
+    def deletar_usuario(self, conta_id, scenario_name=None):
+        with self.lock:
+            self.chamadas[conta_id] += 1
+            chamada = self.chamadas[conta_id]
+        if chamada <= self.falhas:
+            raise requests.ConnectionError("conexão recusada")
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+def test_deletar_usuario_no_mock(api):
+    response = api.deletar_usuario("12345", scenario_name="Exclusao Sucesso 200")
+
+    assert response.status_code == 200
+    assert response.json()["conta_id"] == "12345"
+
+
+def test_remove_contas_registradas_sem_repetir(api):
+    limpeza = LimpezaSessao(api, concorrencia=4)
+    for conta_id in ("1", "2", "3", "2"):
+        limpeza.registrar(conta_id)
+
+    resultado = limpeza.executar()
+
+    assert sorted(resultado.removidas) == ["1", "2", "3"]
+    assert resultado.falhas == {} and limpeza.pendentes == []
+
+
+def test_falha_transitoria_e_retentada():
+    api = _ApiInstavel(falhas=2)
+    limpeza = LimpezaSessao(api, tentativas=3, espera=0.001)
+    for conta_id in map(str, range(20)):
+        limpeza.registrar(conta_id)
+
+    resultado = limpeza.executar()
+
+    assert len(resultado.removidas) == 20 and resultado.falhas == {}
+    assert set(api.chamadas.values()) == {3}
+
+
+def test_falha_persistente_vai_para_o_relatorio(api):
+    limpeza = LimpezaSessao(api, tentativas=2, espera=0.001, scenario_name="Exclusao Indisponivel 503")
+    limpeza.registrar("12345")
+
+    resultado = limpeza.executar()
+
+    assert resultado.removidas == []
+    assert resultado.falhas["12345"].startswith("HTTP 503")
+    assert "12345: HTTP 503" in resultado.resumo()
+
+
+def test_conta_inexistente_conta_como_removida(api):
+    limpeza = LimpezaSessao(api, scenario_name="Exclusao Conta Nao Encontrada 404")
+    limpeza.registrar("00000")
+
+    assert limpeza.executar().removidas == ["00000"]
@@ -0,0 +1,82 @@
+"""
+Testes das métricas por requisição do cliente.
+"""
+import requests
+
+from src.services.api_client import FintechAPI
+from src.services.metricas import Metricas, ServidorMetricas, exportar, normalizar_endpoint
+
+
+def _api(url, metricas):
+    return FintechAPI(base_url=url, metricas=metricas)
+
+
+def test_normaliza_ids_do_path():
+    assert normalizar_endpoint("/saldo/12345") == "/saldo/{id}"
+    assert normalizar_endpoint("/usuario/abc-9?x=1") == "/usuario/{id}"
+    assert normalizar_endpoint("/transferencia") == "/transferencia"
+
+
+def test_agrega_por_endpoint_cenario_e_status(mock_server_url):
+    metricas = Metricas()
+    with _api(mock_server_url, metricas) as api:
+        for conta_id in ("1", "2", "3"):
+            api.consultar_saldo(conta_id, scenario_name="Saldo Encontrado 200")
+        api.realizar_transferencia("1", "2", 10.0, scenario_name="Falha Saldo Insuficiente 400")
+
+    agregados = metricas.snapshot()
+    saldo = agregados[("/saldo/{id}", "GET", "Saldo Encontrado 200", "200")]
+    transferencia = agregados[("/transferencia", "POST", "Falha Saldo Insuficiente 400", "400")]
+
+    assert saldo.total == 3 and transferencia.total == 1
+    # Keep-alive: só a primeira requisição abre conexão
+    assert saldo.conexoes == 1 and transferencia.conexoes == 0
+    assert saldo.conexao > 0 and saldo.duracao >= saldo.ttfb > 0
+    assert saldo.bytes_enviados == 0 and saldo.bytes_recebidos > 0
+    assert transferencia.bytes_enviados == len(b'{"origem": "1", "destino": "2", "valor": 10.0}')
+
+
+def test_erro_de_rede_registrado_pelo_tipo():
+    metricas = Metricas()
+    with _api("http://127.0.0.1:1", metricas) as api:
+        try:
+            api.consultar_saldo("1")
+        except requests.ConnectionError:
+            pass
+
+    assert ("/saldo/{id}", "GET", "", "ConnectionError") in metricas.snapshot()
+
+
+def test_formatos_de_exportacao(mock_server_url, tmp_path):
+    metricas = Metricas()
+    with _api(mock_server_url, metricas) as api:
+        api.consultar_saldo("1", scenario_name="Saldo Encontrado 200")
+
+    prometheus = metricas.para_prometheus()
+    rotulos = 'endpoint="/saldo/{id}",method="GET",scenario="Saldo Encontrado 200",status="200"'
+    assert f"fintech_api_requests_total{{{rotulos}}} 1" in prometheus
+    assert f'fintech_api_request_duration_seconds_bucket{{{rotulos},le="+Inf"}} 1' in prometheus
+
+    influx = metricas.para_influx(timestamp_ns=123)
+    assert influx.startswith(
+        "fintech_api,endpoint=/saldo/{id},method=GET,scenario=Saldo\\ Encontrado\\ 200,status=200 count=1i,"
+    )
+    assert influx.rstrip().endswith(" 123")
+
+    caminhos = exportar(metricas, str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fintech_api.influx", "fintech_api.prom"]
+    assert len(caminhos) == 2
+
+
+def test_endpoint_de_scrape(mock_server_url):
+    metricas = Metricas()
+    with _api(mock_server_url, metricas) as api:
+        api.consultar_saldo("1")
+
+    with ServidorMetricas(metricas) as servidor:
+        response = requests.get(servidor.url, timeout=5)
+        nao_encontrado = requests.get(servidor.url.replace("/metrics", "/outro"), timeout=5)
+
+    assert response.status_code == 200
+    assert "fintech_api_requests_total" in response.text
+    assert nao_encontrado.status_code == 404
@@ -0,0 +1,102 @@
+"""
+Testes do Mock Server local.
+"""
+import asyncio
+
+import pytest
+
+from src.mock.cenarios import CENARIOS
+from src.mock.falhas import Falha, PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    with MockServer() as servidor:
+        yield servidor
+
+
+@pytest.fixture
+def api(servidor):
+    with FintechAPI(base_url=servidor.url) as api:
+        yield api
+
+
+@pytest.mark.parametrize("rota, nome_cenario", [
+    (rota, nome) for rota, cenarios in CENARIOS.items() for nome in cenarios
+])
+def test_cenarios_do_catalogo(api, rota, nome_cenario):
+    chamadas = {
+        "cadastro": lambda: api.cadastrar_usuario("Tester", "111.111.111-11", "senha", scenario_name=nome_cenario),
+        "saldo": lambda: api.consultar_saldo("12345", scenario_name=nome_cenario),
+        "transferencia": lambda: api.realizar_transferencia("1", "2", 10.0, scenario_name=nome_cenario),
+        "exclusao": lambda: api.deletar_usuario("12345", scenario_name=nome_cenario),
+    }
+
+    response = chamadas[rota]()
+
+    assert response.status_code == CENARIOS[rota][nome_cenario].status
+    assert response.headers["Content-Type"].startswith("application/json")
+    assert isinstance(response.json(), dict)
+
+
+def test_saldo_ecoa_conta_do_path(api):
+    assert api.consultar_saldo("54321", scenario_name="Saldo Encontrado 200").json()["conta_id"] == "54321"
+
+
+def test_sem_header_usa_primeiro_cenario_da_rota(api):
+    response = api.cadastrar_usuario("Tester", "111.111.111-11", "senha")
+
+    assert response.status_code == 201
+    assert response.json()["status"] == "SUCESSO"
+
+
+def test_cenario_ou_rota_desconhecidos_retornam_404(api):
+    assert api.consultar_saldo("1", scenario_name="Cenario Inexistente").status_code == 404
+    assert api._send_request("GET", "/nao-existe").status_code == 404
+
+
+def test_milhares_de_conexoes_simultaneas(servidor):
+    async def cliente():
+        reader, writer = await asyncio.open_connection(servidor.host, servidor.porta)
+        for _ in range(2):
+            writer.write(
+                b"GET /saldo/1 HTTP/1.1\r\nHost: mock\r\n"
+                b"x-mock-response-name: Saldo Encontrado 200\r\n\r\n"
+            )
+            await writer.drain()
+            status, _, cabecalhos = (await reader.readuntil(b"\r\n\r\n")).partition(b"\r\n")
+            tamanho = int(cabecalhos.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(tamanho)
+        writer.close()
+        return status
+
+    async def cenario():
+        return await asyncio.gather(*(cliente() for _ in range(1500)))
+
+    assert all(status.startswith(b"HTTP/1.1 200") for status in asyncio.run(cenario()))
+
+
+def test_status_de_erro_fora_da_tabela_padrao():
+    plano = PlanoFalhas({"saldo": Falha(taxa_erro=1.0, status_erro=599)})
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url) as api:
+        response = api.consultar_saldo("1", scenario_name="Saldo Encontrado 200")
+
+    assert response.status_code == 599
+
+
+@pytest.mark.parametrize("content_length", [b"abc", b"-5"])
+def test_content_length_invalido_retorna_400(servidor, content_length):
+    async def cenario():
+        reader, writer = await asyncio.open_connection(servidor.host, servidor.porta)
+        writer.write(b"POST /cadastro HTTP/1.1\r\nHost: mock\r\nContent-Length: " + content_length + b"\r\n\r\n")
+        await writer.drain()
+        resposta = await reader.read()  # o servidor fecha a conexão depois do 400
+        writer.close()
+        return resposta
+
+    resposta = asyncio.run(cenario())
+
+    assert resposta.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in resposta and b"Content-Length" in resposta
@@ -0,0 +1,64 @@
+"""
+Testes do plugin de orçamento de latência.
+"""
+import os
+import subprocess
+import sys
+import textwrap
+
+from src.plugins.orcamento_latencia import calcular_estatisticas, percentil
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _executar_pytest(tmp_path, codigo):
+    arquivo = tmp_path / "test_exemplo.py"
+    arquivo.write_text(textwrap.dedent(codigo), encoding="utf-8")
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", str(arquivo), "-q", "-p", "src.plugins.orcamento_latencia",
+         "-p", "no:cacheprovider", "--rootdir", str(tmp_path)],
+        cwd=RAIZ, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": RAIZ, "FINTECH_ORCAMENTO_LATENCIA": "on"},
+    )
+
+
+def test_percentil_nearest_rank():
+    amostras = sorted(float(i) for i in range(1, 101))
+
+    assert percentil(amostras, 50) == 50.0
+    assert percentil(amostras, 99) == 99.0
+    assert percentil([7.0], 99) == 7.0
+
+
+def test_estatisticas_apontam_violacoes():
+    estatisticas = calcular_estatisticas([1.0] * 98 + [500.0, 900.0], {"p50_ms": 10, "p99_ms": 100})
+
+    assert estatisticas["amostras"] == 100
+    assert estatisticas["medidas"]["p99_ms"] == 500.0
+    assert estatisticas["violacoes"] == ["p99_ms = 500.00 ms > orçamento de 100.00 ms"]
+
+
+def test_marcador_repete_o_act_e_falha_acima_do_orcamento(tmp_path):
+    resultado = _executar_pytest(tmp_path, """
+        import time
+        import pytest
+
+        chamadas = []
+
+        @pytest.mark.latency_budget(p99_ms=1000, samples=5)
+        def test_rapido(orcamento_latencia):
+            assert orcamento_latencia(lambda: chamadas.append(1) or "ok") == "ok"
+            assert len(chamadas) == 5
+
+        @pytest.mark.latency_budget(p99_ms=5, samples=3)
+        def test_lento(orcamento_latencia):
+            orcamento_latencia(lambda: time.sleep(0.02))
+
+        @pytest.mark.latency_budget(p99_ms=5)
+        def test_sem_medicao():
+            pass
+    """)
+
+    assert "1 passed" in resultado.stdout and "2 failed" in resultado.stdout, resultado.stdout
+    assert "Orçamento de latência excedido (3 amostras): p99_ms" in resultado.stdout
+    assert "não mediu o Act" in resultado.stdout
@@ -0,0 +1,103 @@
+"""
+Testes do plugin de particionamento por duração.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import textwrap
+
+from src.plugins.particionamento import CHAVE_CACHE, particionar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CONFTEST = """
+    from src.plugins import particionamento
+
+    def pytest_addoption(parser):
+        particionamento.adicionar_opcoes(parser)
+
+    def pytest_configure(config):
+        config.pluginmanager.register(particionamento.Particionamento(config), "particionamento")
+"""
+
+TESTES = """
+    import pytest
+
+    @pytest.mark.parametrize("n", range(6))
+    def test_item(n):
+        pass
+"""
+
+
+def _executar_pytest(tmp_path, *argumentos):
+    (tmp_path / "conftest.py").write_text(textwrap.dedent(CONFTEST), encoding="utf-8")
+    (tmp_path / "test_exemplo.py").write_text(textwrap.dedent(TESTES), encoding="utf-8")
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", str(tmp_path), "-q", "--rootdir", str(tmp_path), *argumentos],
+        cwd=RAIZ, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": RAIZ, "FINTECH_SHARDS": "", "FINTECH_SHARD_INDICE": ""},
+    )
+
+
+def _coletados(resultado):
+    return re.findall(r"test_exemplo\.py::test_item\[\d\]", resultado.stdout)
+
+
+def test_particao_lpt_equilibrada_e_longest_first():
+    duracoes = [("a", 8.0), ("b", 7.0), ("c", 6.0), ("d", 5.0), ("e", 4.0), ("f", 3.0), ("g", 2.0), ("h", 1.0)]
+
+    particao = particionar(duracoes, 3)
+
+    cargas = [sum(dict(duracoes)[nodeid] for nodeid in shard) for shard in particao]
+    assert sorted(nodeid for shard in particao for nodeid in shard) == list("abcdefgh")
+    assert max(cargas) - min(cargas) <= 2.0
+    for shard in particao:
+        assert [dict(duracoes)[n] for n in shard] == sorted((dict(duracoes)[n] for n in shard), reverse=True)
+
+
+def test_particao_deterministica_com_empates():
+    duracoes = [(f"t{i}", 1.0) for i in range(10)]
+
+    assert particionar(duracoes, 4) == particionar(list(reversed(duracoes)), 4)
+    assert [len(shard) for shard in particionar(duracoes, 4)] == [3, 3, 2, 2]
+    assert particionar([], 2) == [[], []]
+
+
+def test_shards_cobrem_a_suite_sem_sobreposicao(tmp_path):
+    shards = []
+    for indice in range(3):
+        resultado = _executar_pytest(tmp_path, "--co", "--shards", "3", "--shard-indice", str(indice))
+        assert resultado.returncode == 0, resultado.stdout + resultado.stderr
+        assert f"shard {indice + 1}/3: 2 testes" in resultado.stdout
+        shards.append(_coletados(resultado))
+
+    todos = [nodeid for shard in shards for nodeid in shard]
+    assert len(todos) == len(set(todos)) == 6
+
+
+def test_duracoes_do_cache_ordenam_o_shard(tmp_path):
+    cache = tmp_path / ".pytest_cache" / "v" / CHAVE_CACHE
+    cache.parent.mkdir(parents=True)
+    cache.write_text(json.dumps({f"test_exemplo.py::test_item[{n}]": float(n) for n in range(6)}), encoding="utf-8")
+
+    resultado = _executar_pytest(tmp_path, "--co", "--shards", "1")
+
+    assert _coletados(resultado) == [f"test_exemplo.py::test_item[{n}]" for n in reversed(range(6))]
+    assert "~15.0s estimados" in resultado.stdout
+
+
+def test_execucao_grava_duracoes_no_cache(tmp_path):
+    resultado = _executar_pytest(tmp_path)
+
+    assert resultado.returncode == 0, resultado.stdout + resultado.stderr
+    duracoes = json.loads((tmp_path / ".pytest_cache" / "v" / CHAVE_CACHE).read_text(encoding="utf-8"))
+    assert set(duracoes) == {f"test_exemplo.py::test_item[{n}]" for n in range(6)}
+
+
+def test_indice_de_shard_invalido(tmp_path):
+    resultado = _executar_pytest(tmp_path, "--shards", "2", "--shard-indice", "2")
+
+    assert resultado.returncode != 0
+    assert "--shard-indice deve estar entre 0 e 1" in resultado.stderr
@@ -0,0 +1,90 @@
+"""
+Testes do pool de contas e da geração de CPFs.
+"""
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.mock.falhas import Falha, PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+from src.services.limpeza import LimpezaSessao
+from src.services.pool_contas import GeradorCpf, PoolContas, digitos_verificadores
+
+
+@pytest.fixture
+def api(mock_server_url):
+    with FintechAPI(base_url=mock_server_url) as cliente:
+        yield cliente
+
+
+def test_digitos_verificadores_de_cpf_conhecido():
+    assert digitos_verificadores("529982247") == "25"
+    assert digitos_verificadores("111444777") == "35"
+
+
+def test_cpfs_unicos_e_validos_entre_threads():
+    gerador = GeradorCpf(worker=3, execucao="execucao-1")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        cpfs = list(executor.map(lambda _: gerador.proximo(), range(2000)))
+
+    assert len(set(cpfs)) == len(cpfs)
+    for cpf in cpfs[:50]:
+        assert re.fullmatch(r"03\d\.\d{3}\.\d{3}-\d{2}", cpf)
+        digitos = re.sub(r"\D", "", cpf)
+        assert digitos_verificadores(digitos[:9]) == digitos[9:]
+
+
+def test_bloco_da_execucao_avanca_a_cada_mil_cpfs():
+    gerador = GeradorCpf(worker=0, execucao="x")
+
+    cpfs = [re.sub(r"\D", "", gerador.proximo()) for _ in range(1001)]
+
+    assert cpfs[0][6:9] == "000" and cpfs[999][6:9] == "999"
+    assert cpfs[1000][6:9] == "000"
+    assert int(cpfs[1000][2:6]) == (int(cpfs[0][2:6]) + 1) % 10_000
+
+
+def test_workers_diferentes_nao_colidem():
+    gerador_gw0, gerador_gw1 = GeradorCpf(worker=0, execucao="x"), GeradorCpf(worker=1, execucao="x")
+
+    cpfs_gw0 = {gerador_gw0.proximo() for _ in range(100)}
+    cpfs_gw1 = {gerador_gw1.proximo() for _ in range(100)}
+
+    assert not cpfs_gw0 & cpfs_gw1
+
+
+def test_pool_provisiona_e_reaproveita_contas(api):
+    pool = PoolContas(api, tamanho=4, concorrencia=4).provisionar()
+
+    assert len(pool.contas) == 4
+    with pool.emprestimo() as conta:
+        assert conta["conta_id"] == "99999"
+    for _ in range(4):
+        pool.devolver(pool.emprestar())
+
+    assert len(pool.contas) == 4
+
+
+def test_pool_vazio_cadastra_sob_demanda(api):
+    pool = PoolContas(api, tamanho=1).provisionar()
+
+    emprestadas = [pool.emprestar(), pool.emprestar()]
+
+    assert len(pool.contas) == 2
+    assert emprestadas[0]["cpf"] != emprestadas[1]["cpf"]
+
+
+def test_provisionamento_parcial_registra_as_contas_criadas():
+    plano = PlanoFalhas({"cadastro": Falha(falhas_iniciais=1)})
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url) as api:
+        limpeza = LimpezaSessao(api)
+        pool = PoolContas(api, tamanho=4, concorrencia=1, limpeza=limpeza)
+
+        with pytest.raises(RuntimeError):
+            pool.provisionar()
+
+    assert len(pool.contas) == 3
+    assert limpeza.pendentes == ["99999"]  # o mock devolve o mesmo conta_id em todo cadastro
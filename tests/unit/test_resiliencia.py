@@ -0,0 +1,123 @@
+"""
+Testes de prazo, retentativas e hedging do cliente.
+"""
+import random
+import time
+
+import pytest
+import requests
+
+from src.mock.falhas import Falha, Latencia, PlanoFalhas
+from src.mock.server import MockServer
+from src.services.api_client import IDEMPOTENCY_HEADER, FintechAPI
+from src.services.resiliencia import PoliticaResiliencia, PrazoExcedido, Resiliencia
+
+
+def _resposta(status: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    return response
+
+
+def test_retry_com_backoff_exponencial_e_jitter(monkeypatch):
+    esperas = []
+    monkeypatch.setattr("src.services.resiliencia.time.sleep", esperas.append)
+    resiliencia = Resiliencia(PoliticaResiliencia(tentativas=4, espera_base=0.1, espera_max=0.3), random.Random(1))
+
+    response = resiliencia.executar(lambda restante: _resposta(503), idempotente=True)
+
+    assert response.status_code == 503
+    assert len(esperas) == resiliencia.retentativas == 3
+    for numero, espera in enumerate(esperas):
+        assert 0 <= espera <= min(0.3, 0.1 * 2 ** numero)
+
+
+def test_sem_retry_para_requisicao_nao_idempotente():
+    chamadas = []
+    resiliencia = Resiliencia(PoliticaResiliencia(tentativas=3))
+
+    response = resiliencia.executar(lambda restante: chamadas.append(1) or _resposta(503), idempotente=False)
+
+    assert response.status_code == 503 and len(chamadas) == 1
+
+
+def test_erro_de_rede_e_repetido_e_o_ultimo_e_propagado():
+    chamadas = []
+
+    def tentativa(restante):
+        chamadas.append(restante)
+        raise requests.ConnectionError("recusada")
+
+    resiliencia = Resiliencia(PoliticaResiliencia(tentativas=2, espera_base=0.001))
+    with pytest.raises(requests.ConnectionError):
+        resiliencia.executar(tentativa, idempotente=True)
+    assert len(chamadas) == 2
+
+
+class _EsperaMaxima(random.Random):
+    def uniform(self, a, b):
+        return b
+
+
+def test_erro_de_rede_antes_do_prazo_nao_vira_prazo_excedido():
+    def tentativa(restante):
+        raise requests.ConnectionError("recusada")
+
+    politica = PoliticaResiliencia(prazo=10, tentativas=3, espera_base=60, espera_max=60)
+    resiliencia = Resiliencia(politica, _EsperaMaxima())
+
+    # O backoff de 60 s não cabe nos 10 s de prazo: sai do laço sem esperar
+    with pytest.raises(requests.ConnectionError) as erro:
+        resiliencia.executar(tentativa, idempotente=True)
+    assert not isinstance(erro.value, PrazoExcedido)
+    assert str(erro.value) == "recusada"
+
+
+def test_hedge_usa_a_resposta_mais_rapida():
+    chamadas = []
+
+    def tentativa(restante):
+        chamadas.append(restante)
+        if len(chamadas) == 1:
+            time.sleep(0.5)
+            return _resposta(500)
+        return _resposta(200)
+
+    resiliencia = Resiliencia(PoliticaResiliencia(hedge_apos=0.02))
+    inicio = time.perf_counter()
+    response = resiliencia.executar(tentativa, idempotente=True, hedge=True)
+    duracao = time.perf_counter() - inicio
+    resiliencia.close()
+
+    assert response.status_code == 200
+    assert duracao < 0.4
+    assert (resiliencia.hedges, resiliencia.hedges_vencedores) == (1, 1)
+
+
+def test_prazo_limita_a_chamada_contra_backend_lento():
+    plano = PlanoFalhas({"saldo": Falha(latencia=Latencia.parse("fixa:500"))})
+    politica = PoliticaResiliencia(prazo=0.15, tentativas=3)
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url, resiliencia=politica) as api:
+        inicio = time.perf_counter()
+        with pytest.raises(PrazoExcedido):
+            api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+        assert time.perf_counter() - inicio < 0.4
+
+
+def test_transferencia_repetida_com_a_mesma_idempotency_key():
+    plano = PlanoFalhas({"transferencia": Falha(falhas_iniciais=2)})
+    politica = PoliticaResiliencia(tentativas=3, espera_base=0.001)
+    with MockServer(falhas=plano) as servidor, FintechAPI(base_url=servidor.url, resiliencia=politica) as api:
+        response = api.realizar_transferencia("1", "2", 10.0, scenario_name="Transferencia Sucesso 200")
+        repetida = api.realizar_transferencia(
+            "1", "2", 10.0, scenario_name="Falha Saldo Insuficiente 400",
+            idempotency_key=response.request.headers[IDEMPOTENCY_HEADER],
+        )
+        cadastro_plano = PlanoFalhas({"cadastro": Falha(falhas_iniciais=1)})
+        servidor.falhas = cadastro_plano
+        cadastro = api.cadastrar_usuario("Tester", "111.111.111-11", "senha")
+
+    assert response.status_code == 200
+    assert api.resiliencia.retentativas == 2
+    assert repetida.status_code == 200  # mesma chave: o servidor devolve o resultado original
+    assert cadastro.status_code == 503  # POST sem Idempotency-Key não é repetido
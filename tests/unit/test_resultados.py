@@ -0,0 +1,49 @@
+"""
+Testes dos resultados tipados do cliente.
+"""
+import pytest
+
+from src.services.api_client import FintechAPI
+from src.services.resultados import ErroNegocio, SaldoResult, TransferenciaResult
+
+
+@pytest.fixture
+def api(mock_server_url):
+    with FintechAPI(base_url=mock_server_url) as cliente:
+        yield cliente
+
+
+def test_saldo_tipado(api):
+    resultado = api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200", tipado=True)
+
+    assert isinstance(resultado, SaldoResult) and resultado.ok
+    assert (resultado.conta_id, resultado.saldo, resultado.status) == ("12345", 1500.5, "ATIVO")
+    assert resultado.response.status_code == 200
+
+
+def test_transferencia_tipada(api):
+    resultado = api.realizar_transferencia("1", "2", 10.0, scenario_name="Transferencia Sucesso 200", tipado=True)
+
+    assert isinstance(resultado, TransferenciaResult)
+    assert resultado.transacao_id == "T-QA-123456" and resultado.status == "SUCESSO"
+
+
+def test_erro_de_negocio(api):
+    resultado = api.realizar_transferencia("1", "2", 1e6, scenario_name="Falha Saldo Insuficiente 400", tipado=True)
+
+    assert isinstance(resultado, ErroNegocio) and not resultado.ok
+    assert resultado.status_code == 400 and resultado.codigo_erro == "ERR-SALDO-001"
+
+
+def test_resultado_nao_tem_dict_por_instancia(api):
+    resultado = api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200", tipado=True)
+
+    assert not hasattr(resultado, "__dict__")
+    with pytest.raises(AttributeError):
+        resultado.campo_inexistente = 1
+
+
+def test_sem_tipado_mantem_response(api):
+    response = api.consultar_saldo("12345", scenario_name="Saldo Encontrado 200")
+
+    assert response.json()["saldo"] == 1500.5
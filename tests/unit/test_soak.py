@@ -0,0 +1,138 @@
+"""
+Testes do modo soak e do rastreamento de vazamentos.
+"""
+import json
+import socket
+
+import pytest
+
+from src.mock.falhas import PlanoFalhas
+from src.mock.server import MockServer
+from src.perf.soak import (
+    AllureTemporario,
+    Amostra,
+    CargaSoak,
+    LimitesSoak,
+    MonitorRecursos,
+    RelatorioSoak,
+    avaliar_limites,
+    crescimento_por_100k,
+    descritores,
+    executar_soak,
+    main,
+)
+from src.reporting import anexos
+from src.services.api_client import FintechAPI
+
+_vazamento = []
+
+
+def _amostra(operacoes, memoria, fds=10, rss=None):
+    return Amostra(operacoes, 0.0, memoria, rss, fds, 0)
+
+
+def test_crescimento_por_100k_pela_inclinacao():
+    amostras = [_amostra(0, 1000), _amostra(10_000, 3000), _amostra(20_000, 5000)]
+
+    assert crescimento_por_100k(amostras, "memoria") == pytest.approx(20_000)
+    assert crescimento_por_100k(amostras, "fds") == 0
+    assert crescimento_por_100k(amostras, "rss") is None  # sem a métrica nesta plataforma
+    assert crescimento_por_100k(amostras[:1], "memoria") is None
+
+
+def test_descritores_contam_sockets_abertos():
+    antes, sockets_antes = descritores()
+    if antes is None:
+        pytest.skip("sem /proc/self/fd")
+    with socket.socket():
+        depois, sockets_depois = descritores()
+
+    assert depois == antes + 1
+    assert sockets_depois == sockets_antes + 1
+
+
+def test_monitor_aponta_a_linha_que_vaza():
+    monitor = MonitorRecursos().iniciar()
+    try:
+        monitor.amostrar(0)
+        monitor.marcar_base()
+        for operacoes in (1000, 2000, 3000):
+            _vazamento.extend(bytes(100) for _ in range(1000))
+            monitor.amostrar(operacoes)
+        top = monitor.top_crescimento(3)
+        crescimento = monitor.crescimento()
+    finally:
+        monitor.parar()
+        _vazamento.clear()
+
+    local, tamanho, blocos = top[0]
+    assert local.endswith(f"test_soak.py:{test_monitor_aponta_a_linha_que_vaza.__code__.co_firstlineno + 6}")
+    assert blocos >= 3000 and tamanho >= 3000 * 100
+    assert crescimento["memoria"] > 100 * 100_000
+
+
+def test_executar_soak_com_limpeza_periodica():
+    with MockServer(falhas=PlanoFalhas({})) as servidor, FintechAPI(base_url=servidor.url) as api:
+        carga = CargaSoak(api, semente=1)
+        relatorio = executar_soak(carga, iteracoes=600, intervalo=0, workers=2, limpar_a_cada=1)
+
+    assert relatorio.operacoes == 600 and relatorio.erros == 0
+    assert carga.limpeza.pendentes == []
+    assert len(relatorio.amostras) >= 3 and relatorio.indice_base > 0
+    assert relatorio.amostras[-1].operacoes == 600
+    assert relatorio.crescimento["memoria"] is not None
+    assert "Crescimento por 100 mil operações" in relatorio.formatar()
+    # 600 operações em testes de até 1000: um teste, com anexos de cenário deduplicados
+    assert relatorio.allure["testes"] == 1
+    assert relatorio.allure["anexos_gravados"] >= 1 and relatorio.allure["anexos_deduplicados"] > 0
+
+
+def test_allure_temporario_troca_de_teste_e_restaura_o_anexador():
+    original = anexos.anexador
+    with AllureTemporario() as allure:
+        assert anexos.anexador is allure.anexador and allure.anexador.modo == "async"
+        for _ in range(2):
+            with allure.teste():
+                anexos.anexar("Saldo Encontrado 200", name="Cenário")
+        allure.anexador.flush()
+        arquivos = sorted(caminho.name.split("-")[-1] for caminho in allure.diretorio.iterdir())
+        diretorio = allure.diretorio
+
+    assert allure.testes == 2
+    assert arquivos == ["attachment.txt"]  # resultados fechados são apagados; o anexo é um só
+    assert anexos.anexador is original and not diretorio.exists()
+
+
+def test_mix_com_operacao_desconhecida():
+    with FintechAPI(base_url="http://127.0.0.1:9") as api:
+        with pytest.raises(ValueError, match="deposito"):
+            CargaSoak(api).sortear({"deposito": 1}, 10)
+
+
+def test_avaliar_limites():
+    monitor = MonitorRecursos()
+    monitor.amostras = [_amostra(0, 0, fds=10), _amostra(100_000, 4 * 1024 * 1024, fds=12)]
+    relatorio = RelatorioSoak(monitor, operacoes=100_000, erros=0, duracao=1.0)
+
+    violacoes = avaliar_limites(relatorio, LimitesSoak(memoria_kib=1024, fds=1))
+
+    assert violacoes == [
+        "memoria: +4096.00 KiB por 100k operações (limite 1024)",
+        "fds: +2.00 descritores por 100k operações (limite 1)",
+    ]
+    assert avaliar_limites(relatorio, LimitesSoak(memoria_kib=None, fds=5)) == []
+
+
+def test_cli_grava_o_relatorio(tmp_path, capsys):
+    saida = tmp_path / "soak.json"
+
+    codigo = main([
+        "--mock-local", "--iteracoes", "300", "--intervalo", "0", "--workers", "2",
+        "--limite-memoria", "1e9", "--limite-fds", "1e9", "--saida", str(saida),
+    ])
+
+    assert codigo == 0
+    resumo = json.loads(saida.read_text(encoding="utf-8"))
+    assert resumo["operacoes"] == 300
+    assert set(resumo["crescimento_por_100k"]) == {"memoria", "rss", "fds", "sockets"}
+    assert "ops/s" in capsys.readouterr().out
@@ -0,0 +1,82 @@
+"""
+Testes do transporte HTTP com pool de conexões.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.services.api_client import FintechAPI
+from src.services.transport import HTTPTransport, TransportConfig
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    conexoes = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with _Handler.lock:
+            _Handler.conexoes += 1
+
+    def do_GET(self):
+        if self.path == "/lento":
+            time.sleep(0.5)
+        corpo = b'{"conta_id": "99999", "saldo": 1500.5}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor_local():
+    _Handler.conexoes = 0
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def test_transporte_reaproveita_conexao(servidor_local):
+    with HTTPTransport(TransportConfig(pool_size=2)) as transport:
+        for _ in range(20):
+            assert transport.request("GET", f"{servidor_local}/saldo/99999").status_code == 200
+
+    assert _Handler.conexoes == 1
+
+
+def test_transporte_compartilhado_entre_threads(servidor_local):
+    with HTTPTransport(TransportConfig(pool_size=4, pool_block=True)) as transport:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            status = list(executor.map(
+                lambda _: transport.request("GET", f"{servidor_local}/saldo/99999").status_code,
+                range(100),
+            ))
+
+    assert status == [200] * 100
+    assert _Handler.conexoes <= 4
+
+
+def test_transporte_aplica_read_timeout(servidor_local):
+    with HTTPTransport(TransportConfig(read_timeout=0.1)) as transport:
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            transport.request("GET", f"{servidor_local}/lento")
+
+
+def test_fintech_api_usa_transporte_injetado(servidor_local):
+    with FintechAPI(base_url=servidor_local) as api:
+        response = api.consultar_saldo("99999")
+
+    assert response.json()["saldo"] == 1500.5
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from src.mock.cenarios import CENARIOS
+from src.perf.carga import PerfilFixo, executar_carga, montar_mix
+from src.mock.server import MockServer
+from src.services.api_client import FintechAPI
+from src.services.validacao import CatalogoInvalido, carregar_catalogo, compilar, validador_do_cenario
+
+
+def test_catalogo_do_projeto_referencia_cenarios_do_mock():
+    catalogo = carregar_catalogo()
+
+    cenarios_mock = {nome: cenario for rota in CENARIOS.values() for nome, cenario in rota.items()}
+    assert len({cenario.id for cenario in catalogo}) == len(catalogo)
+    for cenario in catalogo:
+        assert cenario.cenario in cenarios_mock
+        assert cenario.status == cenarios_mock[cenario.cenario].status
+
+    por_id = {cenario.id: cenario for cenario in catalogo}
+    assert por_id["saldo-encontrado"].requisicao() == ("GET", "/saldo/12345")
+    assert por_id["transferencia-sucesso"].requisicao() == ("POST", "/transferencia")
+    assert por_id["saldo-encontrado"].requisicao({"conta_id": "777"}) == ("GET", "/saldo/777")
+    assert (por_id["cadastro-cpf-duplicado"].feature, por_id["cadastro-cpf-duplicado"].story) == (
+        "Cadastro de Usuário", "Validação de CPF duplicado"
+    )
+    assert por_id["transferencia-sucesso"].conta_do_pool == "origem"
+
+
+def test_schema_acusa_campo_ausente_e_tipo_errado():
+    validar = compilar(200, {"conta_id": "str", "saldo": "number", "status?": "str"}, [])
+
+    assert validar(200, {"conta_id": "1", "saldo": 10}, {}) == []
+    assert validar(200, {"conta_id": "1", "saldo": True}, {}) == ["campo 'saldo' deveria ser number, veio bool"]
+    assert validar(200, {"saldo": 1.5, "status": 3}, {}) == [
+        "campo obrigatório 'conta_id' ausente",
+        "campo 'status' deveria ser str, veio int",
+    ]
+    assert validar(500, [], {}) == ["status HTTP 500 != 200", "corpo da resposta não é um objeto JSON"]
+
+
+def test_invariantes_com_valor_regex_e_argumento():
+    validar = compilar(200, {}, [
+        {"campo": "saldo", "op": ">=", "valor": 0},
+        {"campo": "transacao_id", "op": "regex", "valor": "^T-\\d+$"},
+        {"campo": "conta_id", "op": "==", "argumento": "conta_id"},
+        {"campo": "mensagem", "op": "nao_vazio"},
+    ])
+
+    assert validar(200, {"saldo": 0, "transacao_id": "T-1", "conta_id": "7", "mensagem": "ok"}, {"conta_id": "7"}) == []
+    erros = validar(200, {"saldo": "x", "transacao_id": "X-1", "conta_id": "8", "mensagem": ""}, {"conta_id": "7"})
+    assert len(erros) == 4
+    # Sem o argumento (execuções de carga), a invariante que depende dele é ignorada
+    assert validar(200, {"conta_id": "8"}, {}) == []
+
+
+def test_entrada_invalida_e_rejeitada(tmp_path):
+    with pytest.raises(CatalogoInvalido, match="tipo desconhecido"):
+        compilar(200, {"saldo": "decimal"}, [])
+    with pytest.raises(CatalogoInvalido, match="invariante inválida"):
+        compilar(200, {}, [{"campo": "saldo", "op": "~"}])
+
+    arquivo = tmp_path / "catalogo.json"
+    entrada = {"id": "a", "metodo": "consultar_saldo", "cenario": "Saldo Encontrado 200", "status": 200}
+    arquivo.write_text(json.dumps([entrada, entrada]), encoding="utf-8")
+    with pytest.raises(CatalogoInvalido, match="id repetido"):
+        carregar_catalogo(str(arquivo))
+
+    arquivo.write_text(json.dumps([{**entrada, "metodo": "sacar"}]), encoding="utf-8")
+    with pytest.raises(CatalogoInvalido, match="Método do cliente desconhecido"):
+        carregar_catalogo(str(arquivo))
+
+    arquivo.write_text(json.dumps([{**entrada, "conta_do_pool": "origem"}]), encoding="utf-8")
+    with pytest.raises(CatalogoInvalido, match="conta_do_pool"):
+        carregar_catalogo(str(arquivo))
+
+    arquivo.write_text(json.dumps([entrada]), encoding="utf-8")
+    cenario = carregar_catalogo(str(arquivo))[0]
+    assert (cenario.feature, cenario.story) == ("Catálogo de Cenários", "Saldo Encontrado 200")
+
+
+def test_validador_por_nome_de_cenario():
+    validar = validador_do_cenario("Transferencia Sucesso 200")
+
+    assert validar(200, {"status": "SUCESSO", "transacao_id": "T-QA-1"}, {}) == []
+    assert validador_do_cenario("Cenario Inexistente") is None
+
+
+def test_carga_com_validacao_de_corpo():
+    mix = montar_mix({"Transferencia Sucesso 200": 1, "Saldo Encontrado 200": 1}, validar=True)
+    assert all(item.validador is not None for item in mix)
+
+    with MockServer() as servidor, FintechAPI(base_url=servidor.url) as api:
+        relatorio = executar_carga(api, PerfilFixo(rps=100, duracao=0.5), mix, workers=4, semente=3)
+
+    assert relatorio.consolidado().total == 50
+    assert relatorio.consolidado().erros == 0